@@ -1,20 +1,48 @@
 from __future__ import annotations
 
 import asyncio
+import gzip
 import json
 import logging
 from collections import deque
 from datetime import timedelta, datetime
-from typing import MutableSequence, Optional, List, Set
+from typing import Deque, Optional, List, FrozenSet, Iterable, Dict, Tuple
 
 from aiohttp import ClientSession
+from attrs import evolve
 from posthog.client import Client
+from posthog.request import DEFAULT_HOST
 
 from fixcore.analytics import AnalyticsEventSender, AnalyticsEvent
 from fixcore.db import SystemData
-from fixcore.util import uuid_str, Periodic, utc
+from fixcore.util import uuid_str, Periodic
 
 log = logging.getLogger(__name__)
+PostHogCdnUrl = "https://cdn.some.engineering/posthog/posthog.json"
+
+
+def merge_duplicates(events: Iterable[AnalyticsEvent]) -> List[AnalyticsEvent]:
+    """
+    Merge events of the same kind, system and context that happened in the same minute.
+    The counters of merged events are summed up, the time of the first event is maintained.
+    """
+    result: List[AnalyticsEvent] = []
+    by_key: Dict[Tuple[str, str, datetime], List[int]] = {}
+    for event in events:
+        key = (event.kind, event.system, event.at.replace(second=0, microsecond=0))
+        candidates = by_key.setdefault(key, [])
+        for idx in candidates:
+            existing = result[idx]
+            if existing.context == event.context:
+                counters = dict(existing.counters)
+                for name, value in event.counters.items():
+                    counters[name] = counters.get(name, 0) + value
+                result[idx] = evolve(existing, counters=counters)
+                break
+        else:
+            candidates.append(len(result))
+            result.append(event)
+    return result
 
 
 class PostHogEventSender(AnalyticsEventSender):
@@ -30,15 +58,19 @@ class PostHogEventSender(AnalyticsEventSender):
         host: Optional[str] = None,  # was: "https://analytics.some.engineering",
         client_flush_interval: float = 0.5,
         client_retries: int = 3,
+        client_retry_backoff: timedelta = timedelta(seconds=1),
     ):
         """
         Create a new PostHog sender.
         :param system_data: information about the current executing system.
         :param flush_at: number of events that can queue up, before the queue is flushed directly.
+                         The queue holds at most 4 * flush_at events: in case events can not be sent, the oldest
+                         events are dropped.
         :param interval: the frequency when the queue should be flushed.
         :param host: Only here for testing purposes.
         :param client_flush_interval: only here for testing purposes.
         :param client_retries: only here for testing purposes.
+        :param client_retry_backoff: wait time before the first retry, doubled for every further retry.
         """
         super().__init__()
         # Note: the client also has the ability to queue events with a flush interval.
@@ -49,50 +81,63 @@ class PostHogEventSender(AnalyticsEventSender):
         self.client = Client(  # type: ignore
             api_key="n/a", host=host, flush_interval=client_flush_interval, max_retries=client_retries, gzip=True
         )
+        self.host = (host or DEFAULT_HOST).rstrip("/")
+        self.retries = client_retries
+        self.retry_backoff = client_retry_backoff
         self.run_id = uuid_str()  # create a unique id for this instance run
         self.system_data = system_data
-        self.queue: MutableSequence[AnalyticsEvent] = deque()
         self.flush_at = flush_at
+        self.queue: Deque[AnalyticsEvent] = deque(maxlen=flush_at * 4)
+        self.flush_task: Optional[asyncio.Task[None]] = None
         self.flusher = Periodic("flush_analytics", self.flush, interval)
-        self.lock = asyncio.Lock()
-        self.last_fetched: Optional[datetime] = None
+        self.cdn_cache_headers: Dict[str, Optional[str]] = {}
+        self.cdn_refresher = Periodic("refresh_posthog_cdn", self.refresh_from_cdn, timedelta(hours=1))
         self.session: Optional[ClientSession] = None
-        self.white_listed_events: Set[str] = set()
+        self.white_listed_events: FrozenSet[str] = frozenset()
 
     async def capture(self, event: List[AnalyticsEvent]) -> None:
         """
         Capture a single event by adding it to an internal queue.
         The queue is flushed by a scheduled function.
-        Only in the rare case when the queue size reached its maximum the queue will be flushed directly.
+        Only in the rare case when the queue size reached its maximum the queue will be flushed in the background.
         """
-        async with self.lock:
-            for e in event:
-                if e.kind not in self.white_listed_events:
-                    log.debug(f"Event {e.kind} is not whitelisted and will be ignored.")
-                    continue
-                self.queue.append(e)
+        # deque.append is atomic: no lock is required to enqueue events
+        white_listed = self.white_listed_events
+        for e in event:
+            if e.kind not in white_listed:
+                log.debug(f"Event {e.kind} is not whitelisted and will be ignored.")
+                continue
+            self.queue.append(e)
 
-        if len(self.queue) >= self.flush_at:
-            await self.flush()
+        # flush in the background, so the caller is not blocked. Only one flush is running at a time.
+        if len(self.queue) >= self.flush_at and (self.flush_task is None or self.flush_task.done()):
+            self.flush_task = asyncio.create_task(self.flush())
 
     async def refresh_from_cdn(self) -> None:
         """
         The API key is public but not static, so we need to refresh it periodically.
         """
         try:
-            if not self.session:
-                self.session = ClientSession()
-            async with self.session.get("https://cdn.some.engineering/posthog/posthog.json") as resp:
-                ph = json.loads(await resp.text())
+            # only download and parse the data, if it has changed since the last fetch
+            headers = {k: v for k, v in self.cdn_cache_headers.items() if v}
+            async with self._client_session().get(PostHogCdnUrl, headers=headers) as resp:
+                if resp.status == 304:
+                    log.debug("Posthog data on CDN has not changed.")
+                    return
+                resp.raise_for_status()
+                ph = json.loads(await resp.read())
                 # update the api key
                 api_key = ph["api_key"]
                 self.client.api_key = api_key
                 for consumer in self.client.consumers:
                     consumer.api_key = api_key
-                # update the events to report
-                self.white_listed_events = set(ph["events"])
-                # update the last fetched time
-                self.last_fetched = utc()
+                # update the events to report: the set is replaced, never changed in place
+                self.white_listed_events = frozenset(ph["events"])
+                # remember the cache validators of this response
+                self.cdn_cache_headers = {
+                    "If-None-Match": resp.headers.get("ETag"),
+                    "If-Modified-Since": resp.headers.get("Last-Modified"),
+                }
                 log.debug("Fetched latest posthog data from CDN.")
         except Exception as ex:
             log.debug(f"Could not fetch latest api key. Will use the current one. {ex}")
@@ -101,37 +146,69 @@ class PostHogEventSender(AnalyticsEventSender):
         """
         Flush all events to the posthog server.
         """
-        # check, if we need to fetch or refresh the public api key
-        if not self.last_fetched:
+        # check, if we need to fetch the public api key. Refreshing it is done by the cdn_refresher.
+        if self.client.api_key == "n/a":
             await self.refresh_from_cdn()
             sd = self.system_data
             self.client.identify(sd.system_id, {"run_id": self.run_id, "created_at": sd.created_at})  # type: ignore
-        elif (utc() - self.last_fetched) > timedelta(hours=1):
-            await self.refresh_from_cdn()
 
-        # acquire the lock, send all events to the client and clear the queue
-        async with self.lock:
-            for event in self.queue:
-                self.client.capture(  # type: ignore
-                    distinct_id=self.system_data.system_id,
-                    event=event.kind,
-                    properties={
-                        **event.context,
-                        **event.counters,
-                        "source": event.system,
-                        "run_id": self.run_id,
-                    },
-                    timestamp=event.at,
-                )
-            self.queue.clear()
+        # nothing to do on idle ticks
+        if not self.queue:
+            return
+
+        # swap the queue: new events are added to the fresh queue, while the pending ones are sent
+        pending, self.queue = self.queue, deque(maxlen=self.flush_at * 4)
+        await self._send(merge_duplicates(pending))
+
+    async def _send(self, events: List[AnalyticsEvent]) -> None:
+        # send all events with one request to the batch endpoint
+        # note: context and counters are owned by the caller and must not be changed in place
+        distinct_id = self.system_data.system_id
+        run_id = self.run_id
+        batch = [
+            {
+                "event": event.kind,
+                "distinct_id": distinct_id,
+                "properties": {**event.context, **event.counters, "source": event.system, "run_id": run_id},
+                "timestamp": event.at.isoformat(),
+            }
+            for event in events
+        ]
+        body = gzip.compress(json.dumps({"api_key": self.client.api_key, "batch": batch}).encode("utf-8"))
+        headers = {"Content-Type": "application/json", "Content-Encoding": "gzip"}
+        for attempt in range(self.retries + 1):
+            if attempt > 0:
+                # only connection errors, throttling and server errors are retried: give the service time to recover
+                await asyncio.sleep(self.retry_backoff.total_seconds() * 2 ** (attempt - 1))
+            try:
+                async with self._client_session().post(f"{self.host}/batch/", data=body, headers=headers) as resp:
+                    if resp.status == 200:
+                        return
+                    elif resp.status != 429 and resp.status < 500:
+                        # the request will not succeed when it is sent again: drop the batch
+                        log.info(f"Posthog rejected {len(batch)} events with status {resp.status}. Drop the batch.")
+                        return
+                    log.debug(f"Sending {len(batch)} events to posthog failed with status {resp.status}.")
+            except Exception as ex:
+                log.debug(f"Could not send {len(batch)} events to posthog (attempt {attempt + 1}): {ex}")
+        log.info(f"Giving up sending {len(batch)} events to posthog after {self.retries + 1} attempts.")
+
+    def _client_session(self) -> ClientSession:
+        if not self.session:
+            self.session = ClientSession()
+        return self.session
 
     async def start(self) -> PostHogEventSender:
         await self.flush()  # flush will make sure to load initial data from CDN
         await self.flusher.start()
+        await self.cdn_refresher.start()
         return self
 
     async def stop(self) -> None:
+        await self.cdn_refresher.stop()
         await self.flusher.stop()
+        if self.flush_task is not None:
+            await self.flush_task
         await self.flush()
         if self.session:
             await self.session.close()
@@ -183,19 +183,21 @@ def js_value_at(element: JsonElement, path_or_name: Union[List[str], str]) -> Op
     def at_idx(current: JsonElement, idx: int) -> Optional[Any]:
         if at == idx:
             return current
+        if not isinstance(current, dict):
+            return None
         prop, index = parse_path_index(path[idx])
-        if current is None or not isinstance(current, dict) or prop not in current:
+        # a missing property and a property with value None both yield None
+        child = current.get(prop)
+        if child is None:
             return None
-        else:
-            child = current[prop]
-            if isinstance(child, list):
-                if index is None or index is True:
-                    return [at_idx(e, idx + 1) for e in child]
-                elif index < len(child):
-                    return at_idx(child[index], idx + 1)
-                else:
-                    return None
+        elif isinstance(child, list):
+            if index is None or index is True:
+                return [at_idx(e, idx + 1) for e in child]
+            elif index < len(child):
+                return at_idx(child[index], idx + 1)
             else:
-                return at_idx(child, idx + 1)
+                return None
+        else:
+            return at_idx(child, idx + 1)
 
     return at_idx(element, 0)
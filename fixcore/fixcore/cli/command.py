@@ -15,8 +15,8 @@ from asyncio import Future, Task
 
 # noinspection PyProtectedMember
 from asyncio.subprocess import Process
-from collections import defaultdict
-from collections.abc import Hashable
+from collections import defaultdict, OrderedDict
+from collections.abc import Hashable, Iterable
 from contextlib import suppress
 from datetime import timedelta, datetime
 from functools import partial, lru_cache, cached_property
@@ -42,6 +42,7 @@ from urllib.parse import urlparse, urlunparse
 
 import aiofiles
 import jq
+import orjson
 import yaml
 from aiofiles.tempfile import TemporaryDirectory
 from aiohttp import ClientTimeout, JsonPayload, BasicAuth
@@ -1114,35 +1115,27 @@ class CountCommand(SearchCLIPart):
 
     def parse(self, arg: Optional[str] = None, ctx: CLIContext = EmptyContext, **kwargs: Any) -> CLIFlow:
         get_path = ctx.variable_in_section(arg).split(".") if arg else None
-        counter: Dict[str, int] = defaultdict(int)
-        matched = 0
-        unmatched = 0
-
-        def inc_prop(o: JsonElement) -> None:
-            nonlocal matched
-            nonlocal unmatched
-            value = js_value_at(o, get_path)  # type:ignore
-            if value is not None:
-                if isinstance(value, str):
-                    pass
-                elif isinstance(value, (dict, list)):
-                    value = json.dumps(value)
-                else:
-                    value = str(value)
-                matched += 1
-                counter[value] += 1
-            else:
-                unmatched += 1
-
-        def inc_identity(_: Any) -> None:
-            nonlocal matched
-            matched += 1
 
-        fn = inc_prop if arg else inc_identity
+        async def count_instances(content: JsStream) -> AsyncIterator[JsonElement]:
+            matched = 0
+            async for _ in content:
+                matched += 1
+            yield f"total matched: {matched}"
+            yield "total unmatched: 0"
 
-        async def count_in_stream(content: JsStream) -> AsyncIterator[JsonElement]:
+        async def count_property(content: JsStream) -> AsyncIterator[JsonElement]:
+            counter: Dict[str, int] = defaultdict(int)
+            matched = 0
+            unmatched = 0
             async for element in content:
-                fn(element)
+                value = js_value_at(element, get_path)  # type:ignore
+                if value is None:
+                    unmatched += 1
+                    continue
+                if not isinstance(value, str):
+                    value = json.dumps(value) if isinstance(value, (dict, list)) else str(value)
+                matched += 1
+                counter[value] += 1
 
             for key, value in sorted(counter.items(), key=lambda x: x[1]):
                 yield f"{key}: {value}"
@@ -1150,6 +1143,8 @@ class CountCommand(SearchCLIPart):
             yield f"total matched: {matched}"
             yield f"total unmatched: {unmatched}"
 
+        count_in_stream = count_property if arg else count_instances
+
         # noinspection PyTypeChecker
         return CLIFlow(count_in_stream)
 
@@ -1241,7 +1236,11 @@ class JsonCommand(CLICommand):
 
     def parse(self, arg: Optional[str] = None, ctx: CLIContext = EmptyContext, **kwargs: Any) -> CLISource:
         if arg:
-            js = json.loads(arg)
+            try:
+                js = orjson.loads(arg)
+            except orjson.JSONDecodeError:
+                # orjson is strict (e.g. no NaN or ints > 64 bit): fall back to the standard library
+                js = json.loads(arg)
         else:
             raise AttributeError("json expects one argument!")
         if isinstance(js, list):
@@ -1642,19 +1641,52 @@ class FlattenCommand(CLICommand):
         return []
 
     def parse(self, arg: Optional[str] = None, ctx: CLIContext = EmptyContext, **kwargs: Any) -> CLIFlow:
-        return CLIFlow(lambda i: Stream(i).flatten(), required_permissions={Permission.read})
+        def flatten(in_stream: JsStream) -> JsStream:
+            async def flat() -> AsyncIterator[JsonElement]:
+                # a stream has only a handful of distinct element types: compute the kind only once per type
+                # 0: single element, 1: async iterable, 2: iterable
+                kind_by_type: Dict[type, int] = {}
+                async for item in in_stream:
+                    kind = kind_by_type.get(type(item))
+                    if kind is None:
+                        if hasattr(item, "__aiter__"):
+                            kind = 1
+                        elif isinstance(item, Iterable) and not isinstance(item, (str, bytes, dict)):
+                            kind = 2
+                        else:
+                            kind = 0
+                        kind_by_type[type(item)] = kind
+                    if kind == 0:
+                        yield item
+                    elif kind == 1:
+                        async for sub in item:  # type: ignore
+                            yield sub
+                    else:
+                        for sub in item:  # type: ignore
+                            yield sub
+
+            return Stream(flat())
+
+        return CLIFlow(flatten, required_permissions={Permission.read})
 
 
 class UniqCommand(CLICommand):
     """
     ```shell
-    uniq
+    uniq [--window <num>]
     ```
 
     All elements flowing through the uniq command are analyzed and all duplicates get removed.
     Note: a hash value is computed from json objects, which is ignorant of the order of properties,
     so that `{"a": 1, "b": 2}` is declared equal to `{"b": 2, "a": 1}`
 
+    In order to limit the memory consumption, only the last recently seen `window` elements are remembered.
+    In case more distinct elements flow through the stream, duplicates are only detected within this window.
+
+    ## Options
+
+    - `--window` [optional, default=1000000]: the maximum number of distinct elements to remember.
+
     ## Examples
 
     ```shell
@@ -1668,6 +1700,13 @@ class UniqCommand(CLICommand):
     > json [{"a": 1, "b": 2}, {"b": 2, "a": 1}] | uniq
     a: 1
     b: 2
+
+    # Only the last 2 distinct elements are remembered
+    > json [1, 2, 3, 1] | uniq --window 2
+    1
+    2
+    3
+    1
     ```
     """
 
@@ -1679,27 +1718,46 @@ class UniqCommand(CLICommand):
         return "Remove all duplicated objects from the stream."
 
     def args_info(self) -> ArgsInfo:
-        return []
+        return [ArgInfo("--window", expects_value=True, help_text="number of distinct elements to remember")]
 
     def parse(self, arg: Optional[str] = None, ctx: CLIContext = EmptyContext, **kwargs: Any) -> CLIFlow:
-        visited = set()
+        parser = NoExitArgumentParser()
+        parser.add_argument("--window", type=int, default=1_000_000)
+        window: int = parser.parse_args(args_parts_unquoted_parser.parse(arg) if arg else []).window
+        if window < 1:
+            raise CLIParseError(f"{self.name}: window needs to be a positive number, got {window}")
 
         def hashed(item: Any) -> Hashable:
+            # canonical, order independent representation of a json element that can be hashed directly
             if isinstance(item, dict):
-                return json.dumps(item, sort_keys=True)
+                return frozenset((k, hashed(v)) for k, v in item.items())
+            elif isinstance(item, list):
+                return tuple(hashed(v) for v in item)
+            elif isinstance(item, Hashable):
+                # 1, 1.0 and true are equal in python, but different json values
+                return type(item), item
             else:
                 raise CLIParseError(f"{self.name} can not make {item}:{type(item)} uniq")
 
-        def has_not_seen(item: Any) -> bool:
-            item = item if isinstance(item, Hashable) else hashed(item)
+        def uniq(in_stream: JsStream) -> JsStream:
+            # the first entry is the least recently seen element
+            visited: OrderedDict[Hashable, None] = OrderedDict()
 
-            if item in visited:
-                return False
-            else:
-                visited.add(item)
-                return True
+            def has_not_seen(item: Any) -> bool:
+                item = item if isinstance(item, Hashable) else hashed(item)
+
+                if item in visited:
+                    visited.move_to_end(item)
+                    return False
+                else:
+                    visited[item] = None
+                    if len(visited) > window:
+                        visited.popitem(last=False)
+                    return True
+
+            return Stream(in_stream).filter(has_not_seen)
 
-        return CLIFlow(lambda in_stream: Stream(in_stream).filter(has_not_seen), required_permissions={Permission.read})
+        return CLIFlow(uniq, required_permissions={Permission.read})
 
 
 class JqCommand(CLICommand, OutputTransformer):
@@ -1966,6 +2024,12 @@ class KindsCommand(CLICommand, PreserveOutputFormat):
         return CLISource.only_count(source, required_permissions={Permission.read})
 
 
+@lru_cache(maxsize=64)
+def parse_key_values(arg: str) -> Json:
+    # Parsed patches are cached and shared between invocations: the result must not be changed!
+    return key_values_parser.parse(arg)  # type: ignore
+
+
 class SetDesiredStateBase(CLICommand, EntityProvider, ABC):
     @abstractmethod
     def patch(self, arg: Optional[str], ctx: CLIContext) -> Json:
@@ -1985,12 +2049,9 @@ class SetDesiredStateBase(CLICommand, EntityProvider, ABC):
     ) -> AsyncIterator[JsonElement]:
         model = await self.dependencies.model_handler.load_model(graph_name)
         db = self.dependencies.db_access.get_graph_db(graph_name)
-        node_ids = []
-        for item in items:
-            if "id" in item:
-                node_ids.append(item["id"])
-            elif isinstance(item, str):
-                node_ids.append(item)
+        node_ids = [
+            item if isinstance(item, str) else item["id"] for item in items if isinstance(item, str) or "id" in item
+        ]
         async for update in db.update_nodes_desired(model, patch, node_ids):
             yield update
 
@@ -2040,7 +2101,7 @@ class SetDesiredCommand(SetDesiredStateBase):
 
     def patch(self, arg: Optional[str], ctx: CLIContext) -> Json:
         if arg and arg.strip():
-            return key_values_parser.parse(arg)  # type: ignore
+            return parse_key_values(arg)
         else:
             return {}
 
@@ -2122,12 +2183,9 @@ class SetMetadataStateBase(CLICommand, EntityProvider, ABC):
     async def set_metadata(self, graph_name: GraphName, patch: Json, items: List[Json]) -> AsyncIterator[JsonElement]:
         model = await self.dependencies.model_handler.load_model(graph_name)
         db = self.dependencies.db_access.get_graph_db(graph_name)
-        node_ids = []
-        for item in items:
-            if "id" in item:
-                node_ids.append(item["id"])
-            elif isinstance(item, str):
-                node_ids.append(item)
+        node_ids = [
+            item if isinstance(item, str) else item["id"] for item in items if isinstance(item, str) or "id" in item
+        ]
         async for update in db.update_nodes_metadata(model, patch, node_ids):
             yield update
 
@@ -2178,7 +2236,7 @@ class SetMetadataCommand(SetMetadataStateBase):
 
     def patch(self, arg: Optional[str], ctx: CLIContext) -> Json:
         if arg and arg.strip():
-            return key_values_parser.parse(arg)  # type: ignore
+            return parse_key_values(arg)
         else:
             return {}
 
@@ -1,5 +1,5 @@
 from datetime import timedelta
-from functools import reduce
+from functools import reduce, lru_cache
 from typing import List, Optional, Dict
 
 import parsy
@@ -481,6 +481,13 @@ def query_parser() -> Parser:
 
 
 def parse_query(query: str, env: Optional[Dict[str, str]] = None) -> Query:
+    # the only value of env used during parsing is the edge_type
+    return __parse_query(query.strip(), env.get("edge_type") if env else None)
+
+
+# Query objects are immutable and can be shared: cache the result of recently parsed queries
+@lru_cache(maxsize=256)
+def __parse_query(query: str, env_edge_type: Optional[str]) -> Query:
     def set_edge_type_if_not_set(part: Part, edge_types: List[EdgeType]) -> Part:
         def set_in_with_clause(wc: WithClause) -> WithClause:
             nav = wc.navigation
@@ -497,10 +504,9 @@ def parse_query(query: str, env: Optional[Dict[str, str]] = None) -> Query:
         return evolve(part, navigation=nav, with_clause=adapted_wc)
 
     try:
-        parsed: Query = query_parser.parse(query.strip())
+        parsed: Query = query_parser.parse(query)
         pre = parsed.preamble
-        env = env or {}
-        ets: List[EdgeType] = pre.get("edge_type", env.get("edge_type", EdgeTypes.default)).split(",")  # type: ignore
+        ets: List[EdgeType] = pre.get("edge_type", env_edge_type or EdgeTypes.default).split(",")  # type: ignore
         for et in ets:
             if et not in EdgeTypes.all:
                 raise AttributeError(f"Given edge_type {et} is not available. Use one of {EdgeTypes.all}")
@@ -1,10 +1,45 @@
+from __future__ import annotations
+
+import gzip
+import json
+from datetime import timedelta
+from types import TracebackType
+from typing import List, Any, Dict, Optional, Type
+
 import pytest
 
-from fixcore.analytics.posthog import PostHogEventSender
+from fixcore.analytics import AnalyticsEvent
+from fixcore.analytics.posthog import PostHogEventSender, merge_duplicates
 from fixcore.db import SystemData
 from fixcore.util import utc
 
 
+class StubResponse:
+    def __init__(self, status: int) -> None:
+        self.status = status
+
+    async def __aenter__(self) -> StubResponse:
+        return self
+
+    async def __aexit__(
+        self, exc_type: Optional[Type[BaseException]], exc: Optional[BaseException], tb: Optional[TracebackType]
+    ) -> None:
+        pass
+
+
+class StubSession:
+    def __init__(self, *status: int) -> None:
+        self.status = list(status)
+        self.calls: List[Dict[str, Any]] = []
+
+    def post(self, url: str, data: bytes, headers: Dict[str, str]) -> StubResponse:
+        self.calls.append(dict(url=url, body=json.loads(gzip.decompress(data)), headers=headers))
+        return StubResponse(self.status.pop(0))
+
+    async def close(self) -> None:
+        pass
+
+
 @pytest.mark.asyncio
 async def test_send_analytics_proper() -> None:
     sd = SystemData("test", utc(), 1, "test-version")
@@ -23,3 +58,71 @@ async def test_send_analytics_no_service() -> None:
         event = await sender.core_event("test-event")
         assert event.kind == "test-event"
     # reaching this point means: no exception has been thrown, which is the real test
+
+
+def test_merge_duplicates() -> None:
+    now = utc().replace(second=0, microsecond=0)
+    a = AnalyticsEvent("fixcore", "a", {"foo": "bar"}, {"count": 1}, now)
+    a2 = AnalyticsEvent("fixcore", "a", {"foo": "bar"}, {"count": 2, "other": 3}, now + timedelta(seconds=10))
+    a_other_ctx = AnalyticsEvent("fixcore", "a", {"foo": "baz"}, {"count": 1}, now)
+    a_later = AnalyticsEvent("fixcore", "a", {"foo": "bar"}, {"count": 1}, now + timedelta(minutes=1))
+    b = AnalyticsEvent("fixcore", "b", {"foo": "bar"}, {"count": 1}, now)
+    merged = merge_duplicates([a, a2, a_other_ctx, a_later, b])
+    assert merged == [
+        AnalyticsEvent("fixcore", "a", {"foo": "bar"}, {"count": 3, "other": 3}, now),
+        a_other_ctx,
+        a_later,
+        b,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_send_batch_with_retries() -> None:
+    sd = SystemData("test", utc(), 1, "test-version")
+    now = utc()
+    events = [
+        AnalyticsEvent("fixcore", "a", {"foo": "bar"}, {"count": 1}, now),
+        AnalyticsEvent("fixcore", "b", {}, {}, now),
+    ]
+    sender = PostHogEventSender(sd, host="https://posthog.test/", client_retries=2, client_retry_backoff=timedelta(0))
+    sender.client.api_key = "test-key"
+
+    # the first attempt fails, the retry succeeds
+    sender.session = session = StubSession(500, 200)  # type: ignore
+    await sender._send(events)
+    assert len(session.calls) == 2
+    call = session.calls[0]
+    assert call["url"] == "https://posthog.test/batch/"
+    assert call["headers"]["Content-Encoding"] == "gzip"
+    assert call["body"]["api_key"] == "test-key"
+    assert call["body"]["batch"] == [
+        {
+            "event": "a",
+            "distinct_id": "test",
+            "properties": {"foo": "bar", "count": 1, "source": "fixcore", "run_id": sender.run_id},
+            "timestamp": now.isoformat(),
+        },
+        {
+            "event": "b",
+            "distinct_id": "test",
+            "properties": {"source": "fixcore", "run_id": sender.run_id},
+            "timestamp": now.isoformat(),
+        },
+    ]
+    assert session.calls[1]["body"] == call["body"]
+
+    # all attempts fail: give up after the configured number of retries
+    sender.session = session = StubSession(500, 502, 503, 200)  # type: ignore
+    await sender._send(events)
+    assert len(session.calls) == 3
+
+    # throttled requests are retried
+    sender.session = session = StubSession(429, 200)  # type: ignore
+    await sender._send(events)
+    assert len(session.calls) == 2
+
+    # the batch is dropped when the request is rejected
+    for status in [400, 401, 413]:
+        sender.session = session = StubSession(status, 200)  # type: ignore
+        await sender._send(events)
+        assert len(session.calls) == 1
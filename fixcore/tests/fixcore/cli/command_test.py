@@ -230,12 +230,24 @@ async def test_chunk_command(cli: CLI, json_source: str) -> None:
 async def test_flatten_command(cli: CLI, json_source: str) -> None:
     result = await cli.execute_cli_command(f"{json_source} | chunk 50 | flatten", list_sink)
     assert len(result[0]) == 200
+    # strings and objects are not flattened
+    result = await cli.execute_cli_command('json [["a", {"b": 1}], "cd", {"e": 2}] | flatten', list_sink)
+    assert result[0] == ["a", {"b": 1}, "cd", {"e": 2}]
 
 
 @pytest.mark.asyncio
 async def test_uniq_command(cli: CLI, json_source: str) -> None:
     result = await cli.execute_cli_command(f"{json_source} | uniq", list_sink)
     assert len(result[0]) == 100
+    nested = 'json [{"a": [1, {"b": 2, "c": 3}]}, {"a": [1, {"c": 3, "b": 2}]}, {"a": [{"b": 2, "c": 3}, 1]}]'
+    result = await cli.execute_cli_command(f"{nested} | uniq", list_sink)
+    assert result[0] == [{"a": [1, {"b": 2, "c": 3}]}, {"a": [{"b": 2, "c": 3}, 1]}]
+    # values of different json types are not the same, even if python considers them equal
+    result = await cli.execute_cli_command('json [{"a":1},{"a":true},{"a":1.0},[1],[true]] | uniq', list_sink)
+    assert result[0] == [{"a": 1}, {"a": True}, {"a": 1.0}, [1], [True]]
+    # only the last n distinct elements are remembered
+    result = await cli.execute_cli_command("json [1, 2, 1, 3, 2, 1] | uniq --window 2", list_sink)
+    assert result[0] == [1, 2, 3, 2, 1]
 
 
 @pytest.mark.asyncio
@@ -243,6 +243,17 @@ def test_query_with_preamble() -> None:
     assert q3.aggregate.group_func[0].name == "cpu"  # type: ignore
 
 
+def test_parse_query_cached() -> None:
+    q = parse_query('id("root") -[0:1]->')
+    # same query is parsed only once
+    assert parse_query(' id("root") -[0:1]-> ') is q
+    # a different edge type in env yields a different query
+    q2 = parse_query('id("root") -[0:1]->', dict(edge_type="delete"))
+    assert q2 is not q
+    assert q2.parts[0].navigation.edge_types == ["delete"]  # type: ignore
+    assert q.parts[0].navigation.edge_types == [EdgeTypes.default]  # type: ignore
+
+
 def test_preamble_tags() -> None:
     assert preamble_tags_parser.parse("(edge_type=foo)") == {"edge_type": "foo"}
     assert preamble_tags_parser.parse("(edge_type=23)") == {"edge_type": 23}
@@ -4,8 +4,8 @@ from datetime import datetime, date, timedelta
 from enum import Enum
 from functools import lru_cache, reduce
 from pydoc import locate
-from typing import List, MutableSet, Union, Tuple, Dict, Set, Any, TypeVar, Type, Optional
-from typing import get_args, get_origin
+from typing import List, MutableSet, Union, Tuple, Dict, Set, Any, TypeVar, Type, Optional, FrozenSet
+from typing import get_args, get_origin, cast
 
 import attrs
 from attr import resolve_types
@@ -48,10 +48,12 @@ def is_enum(clazz: Union[type, Tuple[Any], None]) -> bool:
     return isinstance(origin, type) and issubclass(origin, Enum)
 
 
-# List[X] -> X, list -> object
+# List[X] -> X, Tuple[X, ...] -> X, list -> object
 def type_arg(clazz: Union[type, Tuple[Any], None]) -> type:
     maybe_optional = get_args(clazz)[0] if is_optional(clazz) else clazz
     args = get_args(maybe_optional)
+    if len(args) == 2 and args[1] is Ellipsis:
+        return cast(type, args[0])
     return args[0] if args and len(args) == 1 else object
 
 
@@ -435,8 +437,14 @@ def node_from_dict(node_data: Json, include_select_ancestors: bool = False) -> B
     return node
 
 
+@lru_cache(maxsize=None)
+def attrs_field_names(clazz: Type[Any]) -> FrozenSet[str]:
+    # the fields of a class do not change: only look them up once per class
+    return frozenset(field.name for field in attrs.fields(clazz))
+
+
 def cleanup_node_field_types(node_type: BaseResource, node_data_reported: Json) -> None:
-    valid_fields = set(field.name for field in attrs.fields(node_type))  # type: ignore
+    valid_fields = attrs_field_names(node_type)
     for field_name in list(node_data_reported.keys()):
         if field_name not in valid_fields:
             del node_data_reported[field_name]
@@ -2,6 +2,7 @@ import json
 import sys
 from datetime import timedelta, datetime, date
 from typing import TypeVar, Any, Type, Optional, Union, List, get_args, Literal, get_origin, Callable, Iterable, Set
+from weakref import WeakValueDictionary
 
 from dateutil.parser import isoparse
 
@@ -24,7 +25,9 @@ from fixlib.utils import utc_str
 AnyT = TypeVar("AnyT")
 
 # the global converter instance
-__converter = cattrs.Converter()
+# detailed validation collects all errors of all nested attributes, which makes structuring considerably slower.
+# from_json reports the class and the json that could not be parsed, which is sufficient.
+__converter = cattrs.Converter(detailed_validation=False)
 
 # ignore all private attributes
 __converter.register_unstructure_hook_factory(
@@ -65,6 +68,17 @@ def timedelta_from_json(js: Any) -> timedelta:
         raise ValueError(f"Cannot convert {js} to timedelta")
 
 
+# datetime values are usually written by utc_str: fromisoformat handles this format natively and fast
+def datetime_from_json(js: Any) -> datetime:
+    if isinstance(js, datetime):
+        return js
+    try:
+        return datetime.fromisoformat(js)
+    except (TypeError, ValueError):
+        # isoparse supports more variants of ISO 8601
+        return isoparse(js)
+
+
 __converter.register_structure_hook_func(is_primitive_or_primitive_union, lambda v, ty: v)
 
 
@@ -86,8 +100,28 @@ def register_json(
         __converter.register_unstructure_hook(cls, to_json_fn)
 
 
+def register_json_interned(cls: Type[AnyT]) -> None:
+    """
+    Register a json unmarshaller for the given attrs class, that shares equal instances.
+    All json objects with the same field values are unmarshalled to the same object.
+    Since instances are shared, the class should be frozen and only have hashable json values.
+    :param cls: the class to register
+    """
+    names = [f.name for f in attrs.fields(cls)]  # type: ignore
+    pool: WeakValueDictionary[tuple[Any, ...], AnyT] = WeakValueDictionary()
+
+    def from_json_fn(js: Json) -> AnyT:
+        key = tuple(js.get(name) for name in names)
+        if (instance := pool.get(key)) is None:
+            instance = cls(*key)
+            pool[key] = instance
+        return instance
+
+    register_json(cls, from_json_fn=from_json_fn)
+
+
 # Register some default types not covered in cattrs
-register_json(datetime, utc_str, isoparse)
+register_json(datetime, utc_str, datetime_from_json)
 register_json(date, lambda obj: obj.isoformat(), date.fromisoformat)
 register_json(timedelta, duration_str, timedelta_from_json)
 
@@ -2,10 +2,11 @@ from __future__ import annotations
 
 import json
 import logging
+import sys
 from abc import ABC
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Dict, Any, Type, Union, Optional, Callable, List
+from typing import Dict, Any, Type, Union, Optional, Callable, List, Tuple
 
 from jsons import snakecase
 
@@ -314,9 +315,10 @@ class Bend(Bender):
     def __init__(self, mappings: Mapping, **kwargs: Any):
         super().__init__(**kwargs)
         self._mappings = mappings
+        self._bend = compile_mapping(mappings)
 
     def execute(self, value: Optional[Json]) -> Any:
-        return bend(self._mappings, value) if value else None
+        return self._bend(value) if value else None
 
 
 class Sort(Bender):
@@ -502,13 +504,17 @@ class ForallBend(Forall):
         super().__init__(*args, **kwargs)
         self._mapping = mapping
         self._context = context
+        self._bend = compile_mapping(mapping)
+        # ListOp.execute assumes the func is saved on self._func
+        self._func = lambda v: self._bend(v, self._context)
 
     def raw_execute(self, source: Any) -> Transport:
         transport = Transport.from_source(source)
         context = self._context or transport.context
-        # ListOp.execute assumes the func is saved on self._func
-        self._func = lambda v: bend(self._mapping, v, context)
-        return Transport(self.execute(transport.value), transport.context)
+        # Note: benders are shared between threads. Do not maintain any state in this object.
+        value = transport.value
+        result = None if value is None else [self._bend(v, context) for v in value]
+        return Transport(result, transport.context)
 
 
 class MapDict(Bender):
@@ -575,6 +581,16 @@ class CPUCoresToNumber(Bender):
         return float(source[:-1]) / 1000 if isinstance(source, str) and source.endswith("m") else float(source)
 
 
+class Intern(Bender):
+    """
+    Intern string values: useful for values that only have a handful of distinct values (status, type, ...).
+    All bent objects then share the same string instance.
+    """
+
+    def execute(self, source: Any) -> Any:
+        return sys.intern(source) if isinstance(source, str) else source
+
+
 class EmptyToNoneBender(Bender):
     def execute(self, source: Any) -> Any:
         return None if source in (None, "", [], {}) else source
@@ -624,5 +640,157 @@ def bend(mapping: Mapping, source: Any, context: Optional[Dict[str, Any]] = None
     return bend_with_context(mapping, Transport(source, context))
 
 
+def _compile_step(bender: Bender) -> Callable[[Any, Dict[str, Any]], Any]:
+    # turn a bender into a function that maps a value in given context to the bent value
+    if type(bender) is S:
+        # select the path directly: most selectors have only one element
+        path, default = bender._path, bender._default
+        if len(path) == 1:
+            key = path[0]
+
+            def select_key_step(value: Any, context: Dict[str, Any]) -> Any:
+                try:
+                    return value[key]
+                except (KeyError, TypeError, IndexError):
+                    return default
+
+            return select_key_step
+
+        def select_path_step(value: Any, context: Dict[str, Any]) -> Any:
+            try:
+                for elem in path:
+                    value = value[elem]
+                return value
+            except (KeyError, TypeError, IndexError):
+                return default
+
+        return select_path_step
+
+    elif type(bender) is Bend:
+        # call the compiled nested mapping directly
+        bend_one = bender._bend
+
+        def bend_step(value: Any, context: Dict[str, Any]) -> Any:
+            return bend_one(value) if value else None
+
+        return bend_step
+
+    elif type(bender) is ForallBend:
+        # bend all elements in one pass with the compiled nested mapping
+        bend_each, own_context = bender._bend, bender._context
+
+        def forall_bend_step(value: Any, context: Dict[str, Any]) -> Any:
+            if value is None:
+                return None
+            ctx = own_context or context
+            return [bend_each(v, ctx) for v in value]
+
+        return forall_bend_step
+
+    elif type(bender).raw_execute is Bender.raw_execute:
+        # the bender only maps the value: call execute without wrapping the value in a Transport
+        execute = bender.execute
+
+        def map_value_step(value: Any, context: Dict[str, Any]) -> Any:
+            return execute(value)
+
+        return map_value_step
+
+    def execute_step(value: Any, context: Dict[str, Any]) -> Any:
+        return bender.raw_execute(Transport(value, context)).value
+
+    return execute_step
+
+
+# dict mapping id -> (mapping, compiled function). The mapping is held, so the id can not be reused.
+_compiled_mappings: Dict[int, Tuple[Mapping, Callable[..., Any]]] = {}
+
+
+def compile_mapping(mapping: Mapping) -> Callable[..., Any]:
+    """
+    Prepare the given mapping once, so it can be applied many times.
+    The mapping is walked only once: the result does not need to inspect the structure of the mapping again.
+    Dict mappings are defined once on class level and never changed, so the same dict is only compiled once:
+    all nested Bend(Sub.mapping) and ForallBend(Sub.mapping) share the same compiled function.
+
+    mapping: the map of benders
+    returns a function that takes the source and an optional context
+            and returns the same result as bend(mapping, source, context).
+    """
+    is_dict = isinstance(mapping, dict)
+    if is_dict and (existing := _compiled_mappings.get(id(mapping))) is not None and existing[0] is mapping:
+        return existing[1]
+
+    # all compiled functions take the value and the context: no Transport is created for nested values
+    def compile_inner(inner: Mapping) -> Callable[[Any, Dict[str, Any]], Any]:
+        if isinstance(inner, list):
+            fns = [compile_inner(v) for v in inner]
+            return lambda value, context: [fn(value, context) for fn in fns]
+
+        elif isinstance(inner, dict):
+            # most values are plain S("Key") selectors: a dict source is read directly, without calling a step
+            plain = [(k, v._path[0], v._default) for k, v in inner.items() if type(v) is S and len(v._path) == 1]
+            plain_keys = {k for k, _, _ in plain}
+            items = [(k, compile_inner(v)) for k, v in inner.items() if k not in plain_keys]
+            plain_items = [(k, compile_inner(inner[k])) for k, _, _ in plain]
+
+            def bend_dict(value: Any, context: Dict[str, Any]) -> Json:
+                res = {}
+                if type(value) is dict:
+                    get = value.get
+                    for k, key, default in plain:
+                        res[k] = get(key, default)
+                else:
+                    for k, fn in plain_items:
+                        res[k] = fn(value, context)
+                for k, fn in items:
+                    try:
+                        res[k] = fn(value, context)
+                    except Exception as e:
+                        log.error(e, exc_info=True)
+                        m = "Error for key {}: {}".format(k, str(e))
+                        raise BendingError(m)
+                return res
+
+            return bend_dict
+
+        elif isinstance(inner, Bender):
+            return compile_bender(inner)
+
+        else:
+            return lambda value, context: inner
+
+    def compose_steps(bender: Bender) -> List[Bender]:
+        if type(bender) is Compose:
+            return compose_steps(bender._first) + compose_steps(bender._second)
+        return [bender]
+
+    def compile_bender(bender: Bender) -> Callable[[Any, Dict[str, Any]], Any]:
+        # a chain of composed benders (a >> b >> c) is executed as flat list of steps
+        first, *rest = [_compile_step(step) for step in compose_steps(bender)]
+        if not rest:
+            return first
+
+        def bend_chain(value: Any, context: Dict[str, Any]) -> Any:
+            value = first(value, context)
+            for step in rest:
+                # same as Compose: the chain stops on the first None value
+                if value is None:
+                    return None
+                value = step(value, context)
+            return value
+
+        return bend_chain
+
+    compiled = compile_inner(mapping)
+
+    def bend_compiled(source: Any, context: Optional[Dict[str, Any]] = None) -> Any:
+        return compiled(source, {} if context is None else context)
+
+    if is_dict:
+        _compiled_mappings[id(mapping)] = (mapping, bend_compiled)
+    return bend_compiled
+
+
 Lower = F(lambda s: s.lower() if isinstance(s, str) else s)
 Upper = F(lambda s: s.upper() if isinstance(s, str) else s)
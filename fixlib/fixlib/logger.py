@@ -145,14 +145,15 @@ def setup_logger(
         # allow to define the log format via env var
         log_format = os.environ.get("FIX_LOG_FORMAT", log_format)
         basicConfig(format=log_format, datefmt="%y-%m-%d %H:%M:%S", force=force)
-    argv = sys.argv[1:]
+    # scan the command line only once: all log flags are looked up in this set
+    flags = {arg for arg in sys.argv[1:] if arg in ("--trace", "-v", "--verbose", "--quiet")}
     if level:
         getLogger("fix").setLevel(level)
-    elif "--trace" in argv or os.environ.get("FIX_TRACE", "false").lower() == "true":
+    elif "--trace" in flags or os.environ.get("FIX_TRACE", "false").lower() == "true":
         getLogger("fix").setLevel(TRACE)
-    elif verbose or "-v" in argv or "--verbose" in argv or os.environ.get("FIX_VERBOSE", "false").lower() == "true":
+    elif verbose or "-v" in flags or "--verbose" in flags or os.environ.get("FIX_VERBOSE", "false").lower() == "true":
         getLogger("fix").setLevel(DEBUG)
-    elif quiet or "--quiet" in argv or os.environ.get("FIX_QUIET", "false").lower() == "true":
+    elif quiet or "--quiet" in flags or os.environ.get("FIX_QUIET", "false").lower() == "true":
         getLogger().setLevel(WARNING)
         getLogger("fix").setLevel(CRITICAL)
 
@@ -3,6 +3,7 @@ import os
 import re
 import time
 import sys
+from functools import lru_cache
 from typing import Optional, Dict, List
 
 import psutil
@@ -191,6 +192,8 @@ def increase_limits() -> None:
             log.error(f"Failed to increase {limit_name} {soft_limit} -> {hard_limit}")
 
 
+# the cpu affinity is not expected to change during the lifetime of the process
+@lru_cache(maxsize=8)
 def num_default_threads(num_min_threads: int = 2) -> int:
     count = num_min_threads
     try:
@@ -1,6 +1,6 @@
 from datetime import datetime
 from enum import Enum
-from typing import List, Optional, Dict, Union, ClassVar
+from typing import List, Optional, Dict, Union, ClassVar, Tuple
 
 from attrs import define, field
 
@@ -85,6 +85,8 @@ def test_collection() -> None:
 
     assert type_arg(Optional[List[int]]) == int
     assert type_arg(List[datetime]) == datetime
+    assert is_collection(Tuple[str, ...]) is True
+    assert type_arg(Tuple[str, ...]) == str
 
 
 def test_dictionary() -> None:
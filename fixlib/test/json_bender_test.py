@@ -15,6 +15,11 @@ from fixlib.json_bender import (
     StripNones,
     MapDict,
     F,
+    K,
+    Bend,
+    ForallBend,
+    compile_mapping,
+    Intern,
 )
 
 
@@ -87,3 +92,45 @@ def test_array_traversal() -> None:
 
     assert bend(S(0, "a"), src) == 1
     assert bend(S(42, "a"), src) is None
+
+
+def test_compile_mapping() -> None:
+    inner = {"a": S("x"), "b": S("y", default=[]), "c": K(3)}
+    mapping = {
+        "id": S("name"),
+        "nested": S("nested") >> Bend(inner),
+        "all": S("list", default=[]) >> ForallBend(inner),
+        "names": S("list", default=[]) >> ForallBend(S("x")),
+        "const": 5,
+        "list": [S("name"), S("foo")],
+        "chain": S("count") >> F(lambda x: x + 1) >> (F(str) >> F(lambda x: x * 2)),
+        "path": S("nested", "x", default=0),
+        "index": S("list", 1, "x"),
+    }
+    compiled = compile_mapping(mapping)
+    sources = [
+        {"name": "n", "nested": {"x": 1}, "list": [{"x": 2, "y": [1]}, {"x": 3}], "count": 1},
+        {},
+        {"list": None, "nested": {}},
+        ["not", "a", "dict"],
+        None,
+    ]
+    for source in sources:
+        assert compiled(source) == bend(mapping, source)
+    assert compile_mapping(S("a", "b"))({"a": {"b": 1}}) == 1
+
+
+def test_intern() -> None:
+    first = bend(S("status") >> Intern(), {"status": "".join(["ACT", "IVE"])})
+    second = bend(S("status") >> Intern(), {"status": "".join(["ACT", "IVE"])})
+    assert first == "ACTIVE"
+    assert first is second
+    assert bend(S("status") >> Intern(), {"status": 1}) == 1
+    assert bend(S("status") >> Intern(), {}) is None
+
+
+def test_compile_mapping_once() -> None:
+    mapping = {"a": S("a")}
+    assert compile_mapping(mapping) is compile_mapping(mapping)
+    assert Bend(mapping)._bend is ForallBend(mapping)._bend
+    assert compile_mapping({"a": S("a")}) is not compile_mapping(mapping)
@@ -1,10 +1,10 @@
-from datetime import timedelta
+from datetime import timedelta, datetime, timezone
 from typing import Optional, ClassVar, Union, Literal, Any
 
-from attrs import define
+from attrs import define, frozen
 
-from fixlib.json import to_json, from_json, is_primitive_or_primitive_union, sort_json
-from fixlib.utils import utc
+from fixlib.json import to_json, from_json, is_primitive_or_primitive_union, sort_json, register_json_interned
+from fixlib.utils import utc, utc_str
 
 
 @define
@@ -48,6 +48,15 @@ def test_predefined() -> None:
     roundtrip(Foo("foo", 42, "bar"))
 
 
+def test_datetime() -> None:
+    now = utc().replace(microsecond=0)
+    assert from_json(now, datetime) is now
+    assert from_json(utc_str(now), datetime) == now
+    assert from_json("2023-01-02T03:04:05+01:00", datetime) == datetime(2023, 1, 2, 2, 4, 5, tzinfo=timezone.utc)
+    # not supported by fromisoformat, but by isoparse
+    assert from_json("2023-01", datetime) == datetime(2023, 1, 1)
+
+
 def test_primitive_union() -> None:
     # simple types
     assert is_primitive_or_primitive_union(str) is True
@@ -83,3 +92,20 @@ def test_json_sort() -> None:
         },
         "d": [{"a": 2, "b": 3, "c": [2, 3, 4]}, {"a": 3, "b": 4, "c": [2, 3, 5]}, {"a": 1, "b": 2, "c": [1, 2, 3]}],
     }
+
+
+@frozen(eq=False)
+class Shared:
+    name: str
+    count: Optional[int] = None
+
+
+register_json_interned(Shared)
+
+
+def test_interned() -> None:
+    shared = from_json({"name": "a", "count": 1}, Shared)
+    assert shared.name == "a" and shared.count == 1
+    assert from_json({"name": "a", "count": 1}, Shared) is shared
+    assert from_json({"name": "a", "count": 2}, Shared) is not shared
+    assert from_json({"name": "a"}, Shared) is from_json({"name": "a", "count": None}, Shared)
@@ -709,6 +709,9 @@ def collect_account(
         feedback.error(f"Ignore account {account.dname}. Reason: unhandled error occurred: {ex}", log)
         metrics_unhandled_account_exceptions.labels(account=account.dname).inc()
         return None
+    finally:
+        # the shared clients of this account are not needed anymore
+        Config.aws.sessions().purge_account(account.id)
 
     return aac.graph
 
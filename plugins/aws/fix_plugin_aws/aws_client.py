@@ -5,7 +5,6 @@ from datetime import datetime
 from functools import cached_property
 from typing import Any, Callable, List, Optional, TypeVar
 
-from botocore.config import Config
 from botocore.exceptions import ClientError, EndpointConnectionError
 from botocore.model import ServiceModel
 from retrying import retry
@@ -69,12 +68,18 @@ class AwsClient:
         self.error_accumulator = error_accumulator
 
     def __to_json(self, node: Any, **kwargs: Any) -> JsonElement:
+        # The result of a botocore call is owned by this client:
+        # convert lists and dicts in place instead of creating a copy of the whole response.
         if node is None or isinstance(node, (str, int, float, bool)):
             return node
         elif isinstance(node, list):
-            return [self.__to_json(item, **kwargs) for item in node]
+            for idx, item in enumerate(node):
+                node[idx] = self.__to_json(item, **kwargs)
+            return node
         elif isinstance(node, dict):
-            return {key: self.__to_json(value, **kwargs) for key, value in node.items()}
+            for key, value in node.items():
+                node[key] = self.__to_json(value, **kwargs)
+            return node
         elif isinstance(node, datetime):
             return utc_str(node)
         elif isinstance(node, bytes):
@@ -132,43 +137,39 @@ class AwsClient:
             arg_info += " with args " + ", ".join([f"{key}={value}" for key, value in kwargs.items()])
         log.debug(f"[Aws] calling service={aws_service} action={action}{arg_info}")
         py_action = action.replace("-", "_")
-        # adaptive mode allows automated client-side throttling
-        config = Config(retries={"max_attempts": max_attempts, "mode": "adaptive"})
-        client = self.config.sessions().client(
+        # the client is shared: all collector threads of this service and region can use a connection in parallel
+        client = self.config.sessions().shared_client(
             aws_account=self.account_id,
             aws_role=self.role,
             aws_profile=self.profile,
             aws_service=aws_service,
             region_name=self.region,
-            config=config,
+            max_attempts=max_attempts,
+            max_pool_connections=self.config.resource_pool_tasks_per_service_default,
             aws_partition=self.partition,
         )
-
-        try:
-            if client.can_paginate(py_action):
-                paginator = client.get_paginator(py_action)
-                result: List[Json] = []
-                for page in paginator.paginate(**kwargs):
-                    log.debug(f"[Aws] Next page for service={aws_service} action={action}{arg_info}")
-                    next_page: Json = self.__to_json(page)  # type: ignore
-                    if result_name is None:
-                        # the whole object is appended
-                        result.append(next_page)
-                    else:
-                        child = value_in_path(next_page, result_name)
-                        if isinstance(child, list):
-                            result.extend(child)
-                        elif child is not None:
-                            result.append(child)
-                log.debug(f"[Aws] called service={aws_service} action={action}{arg_info}: {len(result)} results.")
-                return result
-            else:
-                result = getattr(client, py_action)(**kwargs)
-                single: Json = self.__to_json(result)  # type: ignore
-                log.debug(f"[Aws] called service={aws_service} action={action}{arg_info}: single result")
-                return value_in_path(single, result_name) if result_name else single
-        finally:
-            client.close()
+        if client.can_paginate(py_action):
+            paginator = client.get_paginator(py_action)
+            result: List[Json] = []
+            for page in paginator.paginate(**kwargs):
+                log.debug(f"[Aws] Next page for service={aws_service} action={action}{arg_info}")
+                next_page: Json = self.__to_json(page)  # type: ignore
+                if result_name is None:
+                    # the whole object is appended
+                    result.append(next_page)
+                else:
+                    child = value_in_path(next_page, result_name)
+                    if isinstance(child, list):
+                        result.extend(child)
+                    elif child is not None:
+                        result.append(child)
+            log.debug(f"[Aws] called service={aws_service} action={action}{arg_info}: {len(result)} results.")
+            return result
+        else:
+            result = getattr(client, py_action)(**kwargs)
+            single: Json = self.__to_json(result)  # type: ignore
+            log.debug(f"[Aws] called service={aws_service} action={action}{arg_info}: single result")
+            return value_in_path(single, result_name) if result_name else single
 
     @retry(  # type: ignore
         stop_max_attempt_number=10,  # 10 attempts: 1000 max 60000: max wait time is 5 minutes
@@ -282,7 +283,7 @@ class AwsClient:
             )
             accumulate("UnauthorizedOperation", "Call to AWS API is not authorized!")
         elif code in SessionErrors and "security token included in the request is invalid" in str(e):
-            # The session is valid for 1h and we refresh it every 10 minutes.
+            # The sts session is valid for 1h and renewed 15 minutes before its credentials expire.
             # There is nothing we can do here - log as warning and give up.
             log.warning(f"Call to {aws_service} action {action} failed: {e}.")
             accumulate(code, f"{aws_service} action {action}: {e}")
@@ -1,11 +1,12 @@
 import logging
+import os
+import secrets
 import threading
 import time
-import uuid
-from datetime import timedelta
+from datetime import datetime, timedelta
 from fnmatch import fnmatch
-from functools import lru_cache
-from typing import Any, Callable, ClassVar, Dict, List, Optional, Type
+from itertools import count
+from typing import Any, Callable, ClassVar, Dict, List, Optional, Type, Tuple
 
 from attrs import define, field, fields_dict
 from boto3.session import Session as BotoSession
@@ -20,9 +21,12 @@ from fixlib.types import Json
 from .utils import global_region_by_partition
 
 log = logging.getLogger("fix.plugins.aws")
+# role session names only need to be distinguishable: a random nonce per import plus a counter is enough
+_role_session_nonce = secrets.token_hex(4)
+_role_session_counter = count()
 
 
-@define(hash=True, slots=False)
+@define(slots=True)
 class AwsSessionHolder:
     access_key_id: Optional[str]
     secret_access_key: Optional[str]
@@ -32,9 +36,21 @@ class AwsSessionHolder:
     session_class_factory: Type[BotoSession] = BotoSession
     kind: ClassVar[str] = "aws_session_holder"
     session_lock: threading.Lock = threading.Lock()
+    # direct sessions by (profile, partition)
+    _direct_sessions: Dict[Tuple[Optional[str], str], BotoSession] = field(
+        factory=dict, init=False, eq=False, repr=False
+    )
+    # sts sessions by (account, role, profile, partition) -> (renew after as epoch seconds, session)
+    _sts_sessions: Dict[Tuple[str, str, Optional[str], str], Tuple[float, BotoSession]] = field(
+        factory=dict, init=False, eq=False, repr=False
+    )
+    # shared clients by (account, role, profile, partition, service, region, attempts, pool size) -> (session, client)
+    _shared_clients: Dict[Tuple[Any, ...], Tuple[BotoSession, BaseClient]] = field(
+        factory=dict, init=False, eq=False, repr=False
+    )
+    # renew sts sessions this amount of time before they expire: clients created from a session need to stay valid
+    sts_renew_before_expiry: ClassVar[timedelta] = timedelta(minutes=15)
 
-    # noinspection PyUnusedLocal
-    @lru_cache(maxsize=128)
     def __direct_session(self, profile: Optional[str], partition: str) -> BotoSession:
         global_region = global_region_by_partition(partition)
         if profile:
@@ -46,11 +62,9 @@ class AwsSessionHolder:
                 region_name=global_region,
             )
 
-    # noinspection PyUnusedLocal
-    @lru_cache(maxsize=128)
     def __sts_session(
-        self, aws_account: str, aws_role: str, profile: Optional[str], partition: str, cache_key: int
-    ) -> BotoSession:
+        self, aws_account: str, aws_role: str, profile: Optional[str], partition: str
+    ) -> Tuple[float, BotoSession]:
         global_region = global_region_by_partition(partition)
         role = self.role if self.role_override else aws_role
         role_arn = f"arn:{partition}:iam::{aws_account}:role/{role}"
@@ -69,11 +83,14 @@ class AwsSessionHolder:
         log.info(f"Create AWS session by assuming role: {role_arn}.")
         token = sts.assume_role(
             RoleArn=role_arn,
-            RoleSessionName=f"{aws_account}-{str(uuid.uuid4())}",
+            RoleSessionName=f"{aws_account}-{_role_session_nonce}-{os.getpid()}-{next(_role_session_counter)}",
             DurationSeconds=3600,  # 1 hour
         )
         credentials = token["Credentials"]
-        return self.session_class_factory(
+        expiration = credentials.get("Expiration")
+        expires_at = expiration.timestamp() if isinstance(expiration, datetime) else time.time() + 3600
+        renew_after = expires_at - self.sts_renew_before_expiry.total_seconds()
+        return renew_after, self.session_class_factory(
             aws_access_key_id=credentials["AccessKeyId"],
             aws_secret_access_key=credentials["SecretAccessKey"],
             aws_session_token=credentials["SessionToken"],
@@ -92,12 +109,24 @@ class AwsSessionHolder:
         Consider using the client() and resource() methods instead.
         """
         if aws_role is None:
-            return self.__direct_session(aws_profile, aws_partition)
+            profile_key = (aws_profile, aws_partition)
+            if (session := self._direct_sessions.get(profile_key)) is None:
+                session = self._direct_sessions[profile_key] = self.__direct_session(aws_profile, aws_partition)
+            return session
         else:
             # Use sts to create a temporary token for the given account and role
-            # Sts session is at least valid for 900 seconds (default 1 hour)
-            # let's renew the session after 10 minutes
-            return self.__sts_session(aws_account, aws_role, aws_profile, aws_partition, int(time.time() / 600))
+            # The session is reused until it is about to expire.
+            role_key = (aws_account, aws_role, aws_profile, aws_partition)
+            now = time.time()
+            cached = self._sts_sessions.get(role_key)
+            if cached is not None and cached[0] > now:
+                return cached[1]
+            # remove all sessions that need renewal
+            for k in [k for k, (renew_after, _) in self._sts_sessions.items() if renew_after <= now]:
+                del self._sts_sessions[k]
+            renew_after, session = self.__sts_session(aws_account, aws_role, aws_profile, aws_partition)
+            self._sts_sessions[role_key] = (renew_after, session)
+            return session
 
     def client(
         self,
@@ -113,6 +142,48 @@ class AwsSessionHolder:
             session = self._session(aws_account, aws_role, aws_profile, aws_partition)
             return session.client(aws_service, region_name=region_name, config=config)
 
+    def shared_client(
+        self,
+        aws_account: str,
+        aws_role: Optional[str],
+        aws_profile: Optional[str],
+        aws_service: str,
+        region_name: Optional[str] = None,
+        max_attempts: int = 1,
+        max_pool_connections: int = 10,
+        aws_partition: str = "aws",
+    ) -> BaseClient:
+        """
+        Boto clients are thread safe and hold a pool of keep-alive connections.
+        The client is reused for all calls to the same service and region, as long as the session is valid.
+        Do not close the returned client.
+        """
+        key = (
+            aws_account,
+            aws_role,
+            aws_profile,
+            aws_partition,
+            aws_service,
+            region_name,
+            max_attempts,
+            max_pool_connections,
+        )
+        with self.session_lock:
+            session = self._session(aws_account, aws_role, aws_profile, aws_partition)
+            cached = self._shared_clients.get(key)
+            # a renewed sts session requires a new client
+            if cached is not None:
+                if cached[0] is session:
+                    return cached[1]
+                cached[1].close()
+            # adaptive mode allows automated client-side throttling
+            config = BotoConfig(
+                retries={"max_attempts": max_attempts, "mode": "adaptive"}, max_pool_connections=max_pool_connections
+            )
+            client = session.client(aws_service, region_name=region_name, config=config)
+            self._shared_clients[key] = (session, client)
+            return client
+
     def resource(
         self,
         aws_account: str,
@@ -127,9 +198,24 @@ class AwsSessionHolder:
             session = self._session(aws_account, aws_role, aws_profile, aws_partition)
             return session.resource(aws_service, region_name=region_name, config=config)
 
+    def purge_account(self, aws_account: str) -> None:
+        """
+        Close and remove all shared clients and sts sessions of the given account.
+        Called when the collect of this account is done.
+        """
+        with self.session_lock:
+            for key in [k for k in self._sts_sessions if k[0] == aws_account]:
+                del self._sts_sessions[key]
+            for key in [k for k in self._shared_clients if k[0] == aws_account]:
+                self._shared_clients.pop(key)[1].close()
+
     def purge_caches(self) -> None:
-        self.__direct_session.cache_clear()
-        self.__sts_session.cache_clear()
+        with self.session_lock:
+            for _, client in self._shared_clients.values():
+                client.close()
+            self._direct_sessions.clear()
+            self._sts_sessions.clear()
+            self._shared_clients.clear()
 
 
 @define(slots=False)
@@ -288,6 +374,12 @@ class AwsConfig:
         return parse_duration(self.cloudwatch_metrics_for_atime_mtime_granularity)
 
     def should_collect(self, name: str) -> bool:
+        # called for every resource kind in every region: only match the glob patterns once per name
+        if (result := self._should_collect.get(name)) is None:
+            result = self._should_collect[name] = self.__should_collect(name)
+        return result
+
+    def __should_collect(self, name: str) -> bool:
         # no_collect has precedence over collect
         if self.no_collect and any(fnmatch(name, p) for p in self.no_collect):
             return False
@@ -309,6 +401,7 @@ class AwsConfig:
 
     _lock: threading.RLock = field(factory=threading.RLock)
     _holder: Optional[AwsSessionHolder] = field(default=None)
+    _should_collect: Dict[str, bool] = field(factory=dict, init=False, eq=False, repr=False)
 
     def __getstate__(self) -> Dict[str, Any]:
         d = self.__dict__.copy()
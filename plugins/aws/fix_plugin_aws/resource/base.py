@@ -6,7 +6,7 @@ from abc import ABC
 from concurrent.futures import Future
 from datetime import datetime, timezone, timedelta
 from functools import lru_cache
-from typing import Any, Callable, ClassVar, Dict, Iterator, List, Optional, Type, TypeVar, Tuple
+from typing import Any, Callable, ClassVar, Dict, Iterator, List, Optional, Type, TypeVar, Tuple, Union
 from urllib.parse import quote_plus as urlquote
 
 from attr import evolve
@@ -36,7 +36,7 @@ from fixlib.config import Config, current_config
 from fixlib.core.actions import CoreFeedback, SuppressWithFeedback
 from fixlib.graph import ByNodeId, BySearchCriteria, EdgeKey, Graph, NodeSelector
 from fixlib.json import from_json, value_in_path
-from fixlib.json_bender import Bender, bend
+from fixlib.json_bender import Bender, bend, compile_mapping
 from fixlib.lock import RWLock
 from fixlib.proc import set_thread_name
 from fixlib.threading import ExecutorQueue
@@ -65,7 +65,10 @@ TemplateFn: Dict[str, Callable[[AwsResource], Optional[str]]] = {
 
 
 def parse_json(
-    json: Json, clazz: Type[T], builder: GraphBuilder, mapping: Optional[Dict[str, Bender]] = None
+    json: Json,
+    clazz: Type[T],
+    builder: GraphBuilder,
+    mapping: Optional[Union[Dict[str, Bender], Callable[[Json], Any]]] = None,
 ) -> Optional[T]:
     """
     Use this method to parse json into a class. If the json can not be parsed, the error is reported to the core.
@@ -73,11 +76,16 @@ def parse_json(
     :param json: the json to parse.
     :param clazz: the class to parse into.
     :param builder: the graph builder.
-    :param mapping: the optional mapping to apply before parsing.
+    :param mapping: the optional mapping to apply before parsing. Either a mapping or a compiled mapping.
     :return: The parsed object or None.
     """
     try:
-        mapped = bend(mapping, json) if mapping is not None else json
+        if mapping is None:
+            mapped = json
+        elif callable(mapping):
+            mapped = mapping(json)
+        else:
+            mapped = bend(mapping, json)
         return from_json(mapped, clazz)
     except Exception as e:
         # report and log the error
@@ -128,12 +136,18 @@ class AwsResource(BaseResource, ABC):
     _aws_metadata: ClassVar[Dict[str, Any]] = {}
     # The mapping to transform the incoming API json into the internal representation.
     mapping: ClassVar[Dict[str, Bender]] = {}
+    # The mapping compiled once per class. Maintained automatically, do not override.
+    _compiled_mapping: ClassVar[Callable[..., Any]] = compile_mapping({})
     # Which API to call and what to expect in the result.
     api_spec: ClassVar[Optional[AwsApiSpec]] = None
 
     # The AWS specific identifier of the resource. If not set, it is created from template in GraphBuilder.
     arn: Optional[str] = None
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._compiled_mapping = compile_mapping(cls.mapping)
+
     def _keys(self) -> Tuple[Any, ...]:
         if self.arn is not None:
             return tuple(list(super()._keys()) + [self.arn])
@@ -195,7 +209,7 @@ class AwsResource(BaseResource, ABC):
 
     @classmethod
     def from_api(cls: Type[AwsResourceType], json: Json, builder: GraphBuilder) -> Optional[AwsResourceType]:
-        return parse_json(json, cls, builder, cls.mapping)
+        return parse_json(json, cls, builder, cls._compiled_mapping)
 
     @classmethod
     def collect_resources(cls, builder: GraphBuilder) -> None:
@@ -10,7 +10,7 @@ from fix_plugin_aws.resource.iam import AwsIamRole
 from fix_plugin_aws.aws_client import AwsClient
 from fixlib.baseresources import ModelReference, BaseManagedKubernetesClusterProvider
 from fixlib.graph import Graph
-from fixlib.json_bender import Bender, S, Bend, ForallBend
+from fixlib.json_bender import Bender, S, Bend, ForallBend, Intern
 from fixlib.types import Json
 
 service_name = "eks"
@@ -18,33 +18,37 @@ service_name = "eks"
 
 # noinspection PyUnresolvedReferences
 class EKSTaggable:
+    # the tagging service is resolved once, when the resource class is defined
+    _tag_service: ClassVar[Optional[str]] = None
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        assert issubclass(cls, AwsResource), f"{cls.__name__} has to be an AwsResource"
+        cls._tag_service = cls.api_spec.service if cls.api_spec else None
+
     def update_resource_tag(self, client: AwsClient, key: str, value: str) -> bool:
-        if isinstance(self, AwsResource):
-            if spec := self.api_spec:
-                client.call(
-                    aws_service=spec.service,
-                    action="tag-resource",
-                    result_name=None,
-                    resourceArn=self.arn,
-                    tags={key: value},
-                )
-                return True
+        if (service := self._tag_service) is None:
             return False
-        return False
+        client.call(
+            aws_service=service,
+            action="tag-resource",
+            result_name=None,
+            resourceArn=cast(AwsResource, self).arn,
+            tags={key: value},
+        )
+        return True
 
     def delete_resource_tag(self, client: AwsClient, key: str) -> bool:
-        if isinstance(self, AwsResource):
-            if spec := self.api_spec:
-                client.call(
-                    aws_service=spec.service,
-                    action="untag-resource",
-                    result_name=None,
-                    resourceArn=self.arn,
-                    tagKeys=[key],
-                )
-                return True
+        if (service := self._tag_service) is None:
             return False
-        return False
+        client.call(
+            aws_service=service,
+            action="untag-resource",
+            result_name=None,
+            resourceArn=cast(AwsResource, self).arn,
+            tagKeys=[key],
+        )
+        return True
 
     @classmethod
     def called_mutator_apis(cls) -> List[AwsApiSpec]:
@@ -55,7 +59,7 @@ class EKSTaggable:
         return service_name
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsEksNodegroupScalingConfig:
     kind: ClassVar[str] = "aws_eks_nodegroup_scaling_config"
     kind_display: ClassVar[str] = "AWS EKS Nodegroup Scaling Config"
@@ -74,7 +78,7 @@ class AwsEksNodegroupScalingConfig:
     desired_size: Optional[int] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsEksRemoteAccessConfig:
     kind: ClassVar[str] = "aws_eks_remote_access_config"
     kind_display: ClassVar[str] = "AWS EKS Remote Access Config"
@@ -91,7 +95,7 @@ class AwsEksRemoteAccessConfig:
     source_security_groups: List[str] = field(factory=list)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsEksTaint:
     kind: ClassVar[str] = "aws_eks_taint"
     kind_display: ClassVar[str] = "AWS EKS Taint"
@@ -100,13 +104,13 @@ class AwsEksTaint:
         " as unschedulable for certain pods, preventing them from being deployed on"
         " those nodes."
     )
-    mapping: ClassVar[Dict[str, Bender]] = {"key": S("key"), "value": S("value"), "effect": S("effect")}
+    mapping: ClassVar[Dict[str, Bender]] = {"key": S("key"), "value": S("value"), "effect": S("effect") >> Intern()}
     key: Optional[str] = field(default=None)
     value: Optional[str] = field(default=None)
     effect: Optional[str] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsEksNodegroupResources:
     kind: ClassVar[str] = "aws_eks_nodegroup_resources"
     kind_display: ClassVar[str] = "AWS EKS Nodegroup Resources"
@@ -122,7 +126,7 @@ class AwsEksNodegroupResources:
     remote_access_security_group: Optional[str] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsEksIssue:
     kind: ClassVar[str] = "aws_eks_issue"
     kind_display: ClassVar[str] = "AWS EKS Issue"
@@ -141,7 +145,7 @@ class AwsEksIssue:
     resource_ids: List[str] = field(factory=list)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsEksNodegroupHealth:
     kind: ClassVar[str] = "aws_eks_nodegroup_health"
     kind_display: ClassVar[str] = "AWS EKS Nodegroup Health"
@@ -153,7 +157,7 @@ class AwsEksNodegroupHealth:
     issues: List[AwsEksIssue] = field(factory=list)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsEksNodegroupUpdateConfig:
     kind: ClassVar[str] = "aws_eks_nodegroup_update_config"
     kind_display: ClassVar[str] = "AWS EKS Nodegroup Update Config"
@@ -170,7 +174,7 @@ class AwsEksNodegroupUpdateConfig:
     max_unavailable_percentage: Optional[int] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsEksLaunchTemplateSpecification:
     kind: ClassVar[str] = "aws_eks_launch_template_specification"
     kind_display: ClassVar[str] = "AWS EKS Launch Template Specification"
@@ -209,13 +213,13 @@ class AwsEksNodegroup(EKSTaggable, AwsResource):
         "version": S("version"),
         "group_release_version": S("releaseVersion"),
         "group_modified_at": S("modifiedAt"),
-        "group_status": S("status"),
-        "group_capacity_type": S("capacityType"),
+        "group_status": S("status") >> Intern(),
+        "group_capacity_type": S("capacityType") >> Intern(),
         "group_scaling_config": S("scalingConfig") >> Bend(AwsEksNodegroupScalingConfig.mapping),
         "group_instance_types": S("instanceTypes", default=[]),
         "group_subnets": S("subnets", default=[]),
         "group_remote_access": S("remoteAccess") >> Bend(AwsEksRemoteAccessConfig.mapping),
-        "group_ami_type": S("amiType"),
+        "group_ami_type": S("amiType") >> Intern(),
         "group_node_role": S("nodeRole"),
         "group_labels": S("labels"),
         "group_taints": S("taints", default=[]) >> ForallBend(AwsEksTaint.mapping),
@@ -270,7 +274,7 @@ class AwsEksNodegroup(EKSTaggable, AwsResource):
         return super().called_mutator_apis() + [AwsApiSpec(service_name, "delete-nodegroup")]
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsEksVpcConfigResponse:
     kind: ClassVar[str] = "aws_eks_vpc_config_response"
     kind_display: ClassVar[str] = "AWS EKS VPC Config Response"
@@ -297,7 +301,7 @@ class AwsEksVpcConfigResponse:
     public_access_cidrs: List[str] = field(factory=list)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsEksKubernetesNetworkConfigResponse:
     kind: ClassVar[str] = "aws_eks_kubernetes_network_config_response"
     kind_display: ClassVar[str] = "AWS EKS Kubernetes Network Config Response"
@@ -309,14 +313,14 @@ class AwsEksKubernetesNetworkConfigResponse:
     mapping: ClassVar[Dict[str, Bender]] = {
         "service_ipv4_cidr": S("serviceIpv4Cidr"),
         "service_ipv6_cidr": S("serviceIpv6Cidr"),
-        "ip_family": S("ipFamily"),
+        "ip_family": S("ipFamily") >> Intern(),
     }
     service_ipv4_cidr: Optional[str] = field(default=None)
     service_ipv6_cidr: Optional[str] = field(default=None)
     ip_family: Optional[str] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsEksLogSetup:
     kind: ClassVar[str] = "aws_eks_log_setup"
     kind_display: ClassVar[str] = "AWS EKS Log Setup"
@@ -330,7 +334,7 @@ class AwsEksLogSetup:
     enabled: Optional[bool] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsEksLogging:
     kind: ClassVar[str] = "aws_eks_logging"
     kind_display: ClassVar[str] = "AWS EKS Logging"
@@ -345,7 +349,7 @@ class AwsEksLogging:
     cluster_logging: List[AwsEksLogSetup] = field(factory=list)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsEksIdentity:
     kind: ClassVar[str] = "aws_eks_identity"
     kind_display: ClassVar[str] = "AWS EKS Identity"
@@ -358,7 +362,7 @@ class AwsEksIdentity:
     oidc: Optional[str] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsEksEncryptionConfig:
     kind: ClassVar[str] = "aws_eks_encryption_config"
     kind_display: ClassVar[str] = "AWS EKS Encryption Config"
@@ -375,7 +379,7 @@ class AwsEksEncryptionConfig:
     provider: Optional[str] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsEksConnectorConfig:
     kind: ClassVar[str] = "aws_eks_connector_config"
     kind_display: ClassVar[str] = "AWS EKS Connector Config"
@@ -428,7 +432,7 @@ class AwsEksCluster(EKSTaggable, BaseManagedKubernetesClusterProvider, AwsResour
         >> Bend(AwsEksKubernetesNetworkConfigResponse.mapping),
         "cluster_logging": S("logging") >> Bend(AwsEksLogging.mapping),
         "cluster_identity": S("identity") >> Bend(AwsEksIdentity.mapping),
-        "cluster_status": S("status"),
+        "cluster_status": S("status") >> Intern(),
         "cluster_certificate_authority": S("certificateAuthority", "data"),
         "cluster_client_request_token": S("clientRequestToken"),
         "cluster_platform_version": S("platformVersion"),
@@ -458,20 +462,32 @@ class AwsEksCluster(EKSTaggable, BaseManagedKubernetesClusterProvider, AwsResour
 
     @classmethod
     def collect(cls: Type[AwsResource], json: List[Json], builder: GraphBuilder) -> None:
+        # bound once: used by all workers for every cluster and node group
+        client = builder.client
+        submit_work = builder.submit_work
+
+        def add_nodegroup(cluster_name: str, ng_name: str) -> None:
+            ng_json = client.get(
+                service_name, "describe-nodegroup", "nodegroup", clusterName=cluster_name, nodegroupName=ng_name
+            )
+            if ng_json is not None and (ng := AwsEksNodegroup.from_api(ng_json, builder)):
+                builder.add_node(ng, ng_json)
+
+        def add_nodegroups(cluster_name: str) -> None:
+            # describe all node groups in parallel
+            for ng_name in client.list(service_name, "list-nodegroups", "nodegroups", clusterName=cluster_name):
+                submit_work(service_name, add_nodegroup, cluster_name, ng_name)
+
         def add_instance(name: str) -> None:
-            cluster_json = builder.client.get(service_name, "describe-cluster", "cluster", name=name)
+            cluster_json = client.get(service_name, "describe-cluster", "cluster", name=name)
             if cluster_json is not None:
                 if cluster := AwsEksCluster.from_api(cluster_json, builder):
                     builder.add_node(cluster, cluster_json)
-                    for ng_name in builder.client.list(service_name, "list-nodegroups", "nodegroups", clusterName=name):
-                        ng_json = builder.client.get(
-                            service_name, "describe-nodegroup", "nodegroup", clusterName=name, nodegroupName=ng_name
-                        )
-                        if ng_json is not None and (ng := AwsEksNodegroup.from_api(ng_json, builder)):
-                            builder.add_node(ng, ng_json)
+                    # list node groups as separate work, so it can overlap with describing other clusters
+                    submit_work(service_name, add_nodegroups, name)
 
         for name in cast(List[str], json):
-            builder.submit_work(service_name, add_instance, name)
+            submit_work(service_name, add_instance, name)
 
     def connect_in_graph(self, builder: GraphBuilder, source: Json) -> None:
         builder.dependant_node(
@@ -1,4 +1,4 @@
-from typing import ClassVar, Dict, Optional, List, Any
+from typing import ClassVar, Dict, Optional, List, Tuple, Any, cast
 
 from attrs import define, field
 
@@ -7,7 +7,8 @@ from fix_plugin_aws.resource.kms import AwsKmsKey
 from fix_plugin_aws.resource.sns import AwsSnsTopic
 from fixlib.baseresources import ModelReference
 from fixlib.graph import Graph
-from fixlib.json_bender import Bender, S, Bend, ForallBend, K, bend
+from fixlib.json import register_json_interned
+from fixlib.json_bender import Bender, S, Bend, ForallBend, K, Intern
 from fix_plugin_aws.aws_client import AwsClient
 from fix_plugin_aws.utils import ToDict
 from typing import Type
@@ -16,33 +17,36 @@ from fixlib.types import Json
 from fix_plugin_aws.resource.ec2 import AwsEc2SecurityGroup
 
 service_name = "elasticache"
+# benders are stateless and can be shared
+tags_to_dict = ToDict()
 
 
 # noinspection PyUnresolvedReferences
 class ElastiCacheTaggable:
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # checked once, when the resource class is defined
+        assert issubclass(cls, AwsResource), f"{cls.__name__} has to be an AwsResource"
+
     def update_resource_tag(self, client: AwsClient, key: str, value: str) -> bool:
-        if isinstance(self, AwsResource):
-            client.call(
-                aws_service=service_name,
-                action="add-tags-to-resource",
-                result_name=None,
-                ResourceName=self.arn,
-                Tags=[{"Key": key, "Value": value}],
-            )
-            return True
-        return False
+        client.call(
+            aws_service=service_name,
+            action="add-tags-to-resource",
+            result_name=None,
+            ResourceName=cast(AwsResource, self).arn,
+            Tags=[{"Key": key, "Value": value}],
+        )
+        return True
 
     def delete_resource_tag(self, client: AwsClient, key: str) -> bool:
-        if isinstance(self, AwsResource):
-            client.call(
-                aws_service=service_name,
-                action="remove-tags-from-resource",
-                result_name=None,
-                ResourceName=self.arn,
-                TagKeys=[key],
-            )
-            return True
-        return False
+        client.call(
+            aws_service=service_name,
+            action="remove-tags-from-resource",
+            result_name=None,
+            ResourceName=cast(AwsResource, self).arn,
+            TagKeys=[key],
+        )
+        return True
 
     @classmethod
     def called_mutator_apis(cls) -> List[AwsApiSpec]:
@@ -52,7 +56,7 @@ class ElastiCacheTaggable:
         ]
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True, frozen=True)
 class AwsElastiCacheEndpoint:
     kind: ClassVar[str] = "aws_elasticache_endpoint"
     kind_display: ClassVar[str] = "AWS ElastiCache Endpoint"
@@ -66,24 +70,11 @@ class AwsElastiCacheEndpoint:
     port: Optional[int] = field(default=None)
 
 
-@define(eq=False, slots=False)
-class AwsElastiCacheDestinationDetails:
-    kind: ClassVar[str] = "aws_elasticache_destination_details"
-    kind_display: ClassVar[str] = "AWS ElastiCache Destination Details"
-    kind_description: ClassVar[str] = (
-        "AWS ElastiCache Destination Details encompass the configuration specifics for where ElastiCache"
-        " can send logs, including details for both Amazon CloudWatch Logs and Amazon Kinesis Firehose"
-        " as potential log delivery destinations."
-    )
-    mapping: ClassVar[Dict[str, Bender]] = {
-        "cloud_watch_logs_details": S("CloudWatchLogsDetails", "LogGroup"),
-        "kinesis_firehose_details": S("KinesisFirehoseDetails", "DeliveryStream"),
-    }
-    cloud_watch_logs_details: Optional[str] = field(default=None)
-    kinesis_firehose_details: Optional[str] = field(default=None)
+# primary and reader endpoints repeat across the members of a replication group: only create them once
+register_json_interned(AwsElastiCacheEndpoint)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsElastiCachePendingLogDeliveryConfiguration:
     kind: ClassVar[str] = "aws_elasticache_pending_log_delivery_configuration"
     kind_display: ClassVar[str] = "AWS ElastiCache Pending Log Delivery Configuration"
@@ -93,18 +84,20 @@ class AwsElastiCachePendingLogDeliveryConfiguration:
         " service, the format of the logs, and additional details about the destination."
     )
     mapping: ClassVar[Dict[str, Bender]] = {
-        "log_type": S("LogType"),
-        "destination_type": S("DestinationType"),
-        "destination_details": S("DestinationDetails") >> Bend(AwsElastiCacheDestinationDetails.mapping),
-        "log_format": S("LogFormat"),
+        "log_type": S("LogType") >> Intern(),
+        "destination_type": S("DestinationType") >> Intern(),
+        "cloud_watch_log_group": S("DestinationDetails", "CloudWatchLogsDetails", "LogGroup"),
+        "kinesis_firehose_delivery_stream": S("DestinationDetails", "KinesisFirehoseDetails", "DeliveryStream"),
+        "log_format": S("LogFormat") >> Intern(),
     }
     log_type: Optional[str] = field(default=None)
     destination_type: Optional[str] = field(default=None)
-    destination_details: Optional[AwsElastiCacheDestinationDetails] = field(default=None)
+    cloud_watch_log_group: Optional[str] = field(default=None)
+    kinesis_firehose_delivery_stream: Optional[str] = field(default=None)
     log_format: Optional[str] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsElastiCachePendingModifiedValues:
     kind: ClassVar[str] = "aws_elasticache_pending_modified_values"
     kind_display: ClassVar[str] = "AWS ElastiCache Pending Modified Values"
@@ -116,21 +109,21 @@ class AwsElastiCachePendingModifiedValues:
     mapping: ClassVar[Dict[str, Bender]] = {
         "num_cache_nodes": S("NumCacheNodes"),
         "cache_node_ids_to_remove": S("CacheNodeIdsToRemove", default=[]),
-        "engine_version": S("EngineVersion"),
-        "cache_node_type": S("CacheNodeType"),
-        "auth_token_status": S("AuthTokenStatus"),
+        "engine_version": S("EngineVersion") >> Intern(),
+        "cache_node_type": S("CacheNodeType") >> Intern(),
+        "auth_token_status": S("AuthTokenStatus") >> Intern(),
         "log_delivery_configurations": S("LogDeliveryConfigurations", default=[])
         >> ForallBend(AwsElastiCachePendingLogDeliveryConfiguration.mapping),
     }
     num_cache_nodes: Optional[int] = field(default=None)
-    cache_node_ids_to_remove: List[str] = field(factory=list)
+    cache_node_ids_to_remove: Tuple[str, ...] = field(default=())
     engine_version: Optional[str] = field(default=None)
     cache_node_type: Optional[str] = field(default=None)
     auth_token_status: Optional[str] = field(default=None)
-    log_delivery_configurations: List[AwsElastiCachePendingLogDeliveryConfiguration] = field(factory=list)
+    log_delivery_configurations: Tuple[AwsElastiCachePendingLogDeliveryConfiguration, ...] = field(default=())
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsElastiCacheNotificationConfiguration:
     kind: ClassVar[str] = "aws_elasticache_notification_configuration"
     kind_display: ClassVar[str] = "AWS ElastiCache Notification Configuration"
@@ -139,12 +132,12 @@ class AwsElastiCacheNotificationConfiguration:
         " ElastiCache instance, including the Amazon Resource Name (ARN) of the notification topic and the status"
         " of notification delivery."
     )
-    mapping: ClassVar[Dict[str, Bender]] = {"topic_arn": S("TopicArn"), "topic_status": S("TopicStatus")}
+    mapping: ClassVar[Dict[str, Bender]] = {"topic_arn": S("TopicArn"), "topic_status": S("TopicStatus") >> Intern()}
     topic_arn: Optional[str] = field(default=None)
     topic_status: Optional[str] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsElastiCacheCacheSecurityGroupMembership:
     kind: ClassVar[str] = "aws_elasticache_cache_security_group_membership"
     kind_display: ClassVar[str] = "AWS ElastiCache Cache Security Group Membership"
@@ -154,13 +147,13 @@ class AwsElastiCacheCacheSecurityGroupMembership:
     )
     mapping: ClassVar[Dict[str, Bender]] = {
         "cache_security_group_name": S("CacheSecurityGroupName"),
-        "status": S("Status"),
+        "status": S("Status") >> Intern(),
     }
     cache_security_group_name: Optional[str] = field(default=None)
     status: Optional[str] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsElastiCacheCacheParameterGroupStatus:
     kind: ClassVar[str] = "aws_elasticache_cache_parameter_group_status"
     kind_display: ClassVar[str] = "AWS Elasticache Cache Parameter Group Status"
@@ -171,15 +164,15 @@ class AwsElastiCacheCacheParameterGroupStatus:
     )
     mapping: ClassVar[Dict[str, Bender]] = {
         "cache_parameter_group_name": S("CacheParameterGroupName"),
-        "parameter_apply_status": S("ParameterApplyStatus"),
+        "parameter_apply_status": S("ParameterApplyStatus") >> Intern(),
         "cache_node_ids_to_reboot": S("CacheNodeIdsToReboot", default=[]),
     }
     cache_parameter_group_name: Optional[str] = field(default=None)
     parameter_apply_status: Optional[str] = field(default=None)
-    cache_node_ids_to_reboot: List[str] = field(factory=list)
+    cache_node_ids_to_reboot: Tuple[str, ...] = field(default=())
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsElastiCacheCacheNode:
     kind: ClassVar[str] = "aws_elasticache_cache_node"
     kind_display: ClassVar[str] = "AWS ElastiCache Cache Node"
@@ -190,12 +183,12 @@ class AwsElastiCacheCacheNode:
     )
     mapping: ClassVar[Dict[str, Bender]] = {
         "cache_node_id": S("CacheNodeId"),
-        "cache_node_status": S("CacheNodeStatus"),
+        "cache_node_status": S("CacheNodeStatus") >> Intern(),
         "cache_node_create_time": S("CacheNodeCreateTime"),
         "endpoint": S("Endpoint") >> Bend(AwsElastiCacheEndpoint.mapping),
-        "parameter_group_status": S("ParameterGroupStatus"),
+        "parameter_group_status": S("ParameterGroupStatus") >> Intern(),
         "source_cache_node_id": S("SourceCacheNodeId"),
-        "customer_availability_zone": S("CustomerAvailabilityZone"),
+        "customer_availability_zone": S("CustomerAvailabilityZone") >> Intern(),
         "customer_outpost_arn": S("CustomerOutpostArn"),
     }
     cache_node_id: Optional[str] = field(default=None)
@@ -208,7 +201,7 @@ class AwsElastiCacheCacheNode:
     customer_outpost_arn: Optional[str] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsElastiCacheSecurityGroupMembership:
     kind: ClassVar[str] = "aws_elasticache_security_group_membership"
     kind_display: ClassVar[str] = "AWS ElastiCache Security Group Membership"
@@ -216,12 +209,15 @@ class AwsElastiCacheSecurityGroupMembership:
         "The AWS ElastiCache Security Group Membership manages an ElastiCache cluster's access permissions"
         " by linking it with a security group to control network traffic to and from the cache nodes."
     )
-    mapping: ClassVar[Dict[str, Bender]] = {"security_group_id": S("SecurityGroupId"), "status": S("Status")}
+    mapping: ClassVar[Dict[str, Bender]] = {
+        "security_group_id": S("SecurityGroupId"),
+        "status": S("Status") >> Intern(),
+    }
     security_group_id: Optional[str] = field(default=None)
     status: Optional[str] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsElastiCacheLogDeliveryConfiguration:
     kind: ClassVar[str] = "aws_elasticache_log_delivery_configuration"
     kind_display: ClassVar[str] = "AWS ElastiCache Log Delivery Configuration"
@@ -230,16 +226,18 @@ class AwsElastiCacheLogDeliveryConfiguration:
         " from ElastiCache to designated AWS services."
     )
     mapping: ClassVar[Dict[str, Bender]] = {
-        "log_type": S("LogType"),
-        "destination_type": S("DestinationType"),
-        "destination_details": S("DestinationDetails") >> Bend(AwsElastiCacheDestinationDetails.mapping),
-        "log_format": S("LogFormat"),
-        "status": S("Status"),
+        "log_type": S("LogType") >> Intern(),
+        "destination_type": S("DestinationType") >> Intern(),
+        "cloud_watch_log_group": S("DestinationDetails", "CloudWatchLogsDetails", "LogGroup"),
+        "kinesis_firehose_delivery_stream": S("DestinationDetails", "KinesisFirehoseDetails", "DeliveryStream"),
+        "log_format": S("LogFormat") >> Intern(),
+        "status": S("Status") >> Intern(),
         "message": S("Message"),
     }
     log_type: Optional[str] = field(default=None)
     destination_type: Optional[str] = field(default=None)
-    destination_details: Optional[AwsElastiCacheDestinationDetails] = field(default=None)
+    cloud_watch_log_group: Optional[str] = field(default=None)
+    kinesis_firehose_delivery_stream: Optional[str] = field(default=None)
     log_format: Optional[str] = field(default=None)
     status: Optional[str] = field(default=None)
     message: Optional[str] = field(default=None)
@@ -270,12 +268,12 @@ class AwsElastiCacheCacheCluster(ElastiCacheTaggable, AwsResource):
         "ctime": S("CacheClusterCreateTime"),
         "cluster_configuration_endpoint": S("ConfigurationEndpoint") >> Bend(AwsElastiCacheEndpoint.mapping),
         "cluster_client_download_landing_page": S("ClientDownloadLandingPage"),
-        "cluster_cache_node_type": S("CacheNodeType"),
-        "cluster_engine": S("Engine"),
-        "cluster_engine_version": S("EngineVersion"),
-        "cluster_cache_cluster_status": S("CacheClusterStatus"),
+        "cluster_cache_node_type": S("CacheNodeType") >> Intern(),
+        "cluster_engine": S("Engine") >> Intern(),
+        "cluster_engine_version": S("EngineVersion") >> Intern(),
+        "cluster_cache_cluster_status": S("CacheClusterStatus") >> Intern(),
         "cluster_num_cache_nodes": S("NumCacheNodes"),
-        "cluster_preferred_availability_zone": S("PreferredAvailabilityZone"),
+        "cluster_preferred_availability_zone": S("PreferredAvailabilityZone") >> Intern(),
         "cluster_preferred_outpost_arn": S("PreferredOutpostArn"),
         "cluster_cache_cluster_create_time": S("CacheClusterCreateTime"),
         "cluster_preferred_maintenance_window": S("PreferredMaintenanceWindow"),
@@ -315,12 +313,12 @@ class AwsElastiCacheCacheCluster(ElastiCacheTaggable, AwsResource):
     cluster_preferred_maintenance_window: Optional[str] = field(default=None)
     cluster_pending_modified_values: Optional[AwsElastiCachePendingModifiedValues] = field(default=None)
     cluster_notification_configuration: Optional[AwsElastiCacheNotificationConfiguration] = field(default=None)
-    cluster_cache_security_groups: List[AwsElastiCacheCacheSecurityGroupMembership] = field(factory=list)
+    cluster_cache_security_groups: Tuple[AwsElastiCacheCacheSecurityGroupMembership, ...] = field(default=())
     cluster_cache_parameter_group: Optional[AwsElastiCacheCacheParameterGroupStatus] = field(default=None)
     cluster_cache_subnet_group_name: Optional[str] = field(default=None)
-    cluster_cache_nodes: List[AwsElastiCacheCacheNode] = field(factory=list)
+    cluster_cache_nodes: Tuple[AwsElastiCacheCacheNode, ...] = field(default=())
     cluster_auto_minor_version_upgrade: Optional[bool] = field(default=None)
-    cluster_security_groups: List[AwsElastiCacheSecurityGroupMembership] = field(factory=list)
+    cluster_security_groups: Tuple[AwsElastiCacheSecurityGroupMembership, ...] = field(default=())
     cluster_replication_group_id: Optional[str] = field(default=None)
     cluster_snapshot_retention_limit: Optional[int] = field(default=None)
     cluster_snapshot_window: Optional[str] = field(default=None)
@@ -329,7 +327,7 @@ class AwsElastiCacheCacheCluster(ElastiCacheTaggable, AwsResource):
     cluster_transit_encryption_enabled: Optional[bool] = field(default=None)
     cluster_at_rest_encryption_enabled: Optional[bool] = field(default=None)
     cluster_replication_group_log_delivery_enabled: Optional[bool] = field(default=None)
-    cluster_log_delivery_configurations: List[AwsElastiCacheLogDeliveryConfiguration] = field(factory=list)
+    cluster_log_delivery_configurations: Tuple[AwsElastiCacheLogDeliveryConfiguration, ...] = field(default=())
 
     def delete_resource(self, client: AwsClient, graph: Graph) -> bool:
         client.call(
@@ -352,7 +350,7 @@ class AwsElastiCacheCacheCluster(ElastiCacheTaggable, AwsResource):
                 resource.api_spec.service, "list-tags-for-resource", "TagList", ResourceName=resource.arn
             )
             if tags:
-                resource.tags = bend(ToDict(), tags)
+                resource.tags = tags_to_dict(tags)
 
         for js in json:
             if instance := cls.from_api(js, builder):
@@ -370,7 +368,7 @@ class AwsElastiCacheCacheCluster(ElastiCacheTaggable, AwsResource):
                 builder.add_edge(self, clazz=AwsSnsTopic, arn=cnc.topic_arn)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsElastiCacheGlobalReplicationGroupInfo:
     kind: ClassVar[str] = "aws_elasticache_global_replication_group_info"
     kind_display: ClassVar[str] = "AWS ElastiCache Global Replication Group Info"
@@ -387,20 +385,7 @@ class AwsElastiCacheGlobalReplicationGroupInfo:
     global_replication_group_member_role: Optional[str] = field(default=None)
 
 
-@define(eq=False, slots=False)
-class AwsElastiCacheReshardingStatus:
-    kind: ClassVar[str] = "aws_elasticache_resharding_status"
-    kind_display: ClassVar[str] = "AWS ElastiCache Resharding Status"
-    kind_description: ClassVar[str] = (
-        "ElastiCache resharding status provides information about the status of the"
-        " data resharding process in AWS ElastiCache, which is a fully managed in-"
-        " memory data store service for caching frequently accessed data."
-    )
-    mapping: ClassVar[Dict[str, Bender]] = {"slot_migration": S("SlotMigration", "ProgressPercentage")}
-    slot_migration: Optional[float] = field(default=None)
-
-
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsElastiCacheUserGroupsUpdateStatus:
     kind: ClassVar[str] = "aws_elasticache_user_groups_update_status"
     kind_display: ClassVar[str] = "AWS ElastiCache User Groups Update Status"
@@ -412,11 +397,11 @@ class AwsElastiCacheUserGroupsUpdateStatus:
         "user_group_ids_to_add": S("UserGroupIdsToAdd", default=[]),
         "user_group_ids_to_remove": S("UserGroupIdsToRemove", default=[]),
     }
-    user_group_ids_to_add: List[str] = field(factory=list)
-    user_group_ids_to_remove: List[str] = field(factory=list)
+    user_group_ids_to_add: Tuple[str, ...] = field(default=())
+    user_group_ids_to_remove: Tuple[str, ...] = field(default=())
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsElastiCacheReplicationGroupPendingModifiedValues:
     kind: ClassVar[str] = "aws_elasticache_replication_group_pending_modified_values"
     kind_display: ClassVar[str] = "AWS ElastiCache Replication Group Pending Modified Values"
@@ -427,22 +412,22 @@ class AwsElastiCacheReplicationGroupPendingModifiedValues:
     )
     mapping: ClassVar[Dict[str, Bender]] = {
         "primary_cluster_id": S("PrimaryClusterId"),
-        "automatic_failover_status": S("AutomaticFailoverStatus"),
-        "resharding": S("Resharding") >> Bend(AwsElastiCacheReshardingStatus.mapping),
-        "auth_token_status": S("AuthTokenStatus"),
+        "automatic_failover_status": S("AutomaticFailoverStatus") >> Intern(),
+        "resharding_slot_migration": S("Resharding", "SlotMigration", "ProgressPercentage"),
+        "auth_token_status": S("AuthTokenStatus") >> Intern(),
         "user_groups": S("UserGroups") >> Bend(AwsElastiCacheUserGroupsUpdateStatus.mapping),
         "log_delivery_configurations": S("LogDeliveryConfigurations", default=[])
         >> ForallBend(AwsElastiCachePendingLogDeliveryConfiguration.mapping),
     }
     primary_cluster_id: Optional[str] = field(default=None)
     automatic_failover_status: Optional[str] = field(default=None)
-    resharding: Optional[AwsElastiCacheReshardingStatus] = field(default=None)
+    resharding_slot_migration: Optional[float] = field(default=None)
     auth_token_status: Optional[str] = field(default=None)
     user_groups: Optional[AwsElastiCacheUserGroupsUpdateStatus] = field(default=None)
-    log_delivery_configurations: List[AwsElastiCachePendingLogDeliveryConfiguration] = field(factory=list)
+    log_delivery_configurations: Tuple[AwsElastiCachePendingLogDeliveryConfiguration, ...] = field(default=())
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsElastiCacheNodeGroupMember:
     kind: ClassVar[str] = "aws_elasticache_node_group_member"
     kind_display: ClassVar[str] = "AWS ElastiCache Node Group Member"
@@ -455,9 +440,9 @@ class AwsElastiCacheNodeGroupMember:
         "cache_cluster_id": S("CacheClusterId"),
         "cache_node_id": S("CacheNodeId"),
         "read_endpoint": S("ReadEndpoint") >> Bend(AwsElastiCacheEndpoint.mapping),
-        "preferred_availability_zone": S("PreferredAvailabilityZone"),
+        "preferred_availability_zone": S("PreferredAvailabilityZone") >> Intern(),
         "preferred_outpost_arn": S("PreferredOutpostArn"),
-        "current_role": S("CurrentRole"),
+        "current_role": S("CurrentRole") >> Intern(),
     }
     cache_cluster_id: Optional[str] = field(default=None)
     cache_node_id: Optional[str] = field(default=None)
@@ -467,7 +452,7 @@ class AwsElastiCacheNodeGroupMember:
     current_role: Optional[str] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsElastiCacheNodeGroup:
     kind: ClassVar[str] = "aws_elasticache_node_group"
     kind_display: ClassVar[str] = "AWS ElastiCache Node Group"
@@ -479,7 +464,7 @@ class AwsElastiCacheNodeGroup:
     )
     mapping: ClassVar[Dict[str, Bender]] = {
         "node_group_id": S("NodeGroupId"),
-        "status": S("Status"),
+        "status": S("Status") >> Intern(),
         "primary_endpoint": S("PrimaryEndpoint") >> Bend(AwsElastiCacheEndpoint.mapping),
         "reader_endpoint": S("ReaderEndpoint") >> Bend(AwsElastiCacheEndpoint.mapping),
         "slots": S("Slots"),
@@ -490,7 +475,7 @@ class AwsElastiCacheNodeGroup:
     primary_endpoint: Optional[AwsElastiCacheEndpoint] = field(default=None)
     reader_endpoint: Optional[AwsElastiCacheEndpoint] = field(default=None)
     slots: Optional[str] = field(default=None)
-    node_group_members: List[AwsElastiCacheNodeGroupMember] = field(factory=list)
+    node_group_members: Tuple[AwsElastiCacheNodeGroupMember, ...] = field(default=())
 
 
 @define(eq=False, slots=False)
@@ -517,19 +502,19 @@ class AwsElastiCacheReplicationGroup(ElastiCacheTaggable, AwsResource):
         "replication_group_description": S("Description"),
         "replication_group_global_replication_group_info": S("GlobalReplicationGroupInfo")
         >> Bend(AwsElastiCacheGlobalReplicationGroupInfo.mapping),
-        "replication_group_status": S("Status"),
+        "replication_group_status": S("Status") >> Intern(),
         "replication_group_pending_modified_values": S("PendingModifiedValues")
         >> Bend(AwsElastiCacheReplicationGroupPendingModifiedValues.mapping),
         "replication_group_member_clusters": S("MemberClusters", default=[]),
         "replication_group_node_groups": S("NodeGroups", default=[]) >> ForallBend(AwsElastiCacheNodeGroup.mapping),
         "replication_group_snapshotting_cluster_id": S("SnapshottingClusterId"),
-        "replication_group_automatic_failover": S("AutomaticFailover"),
-        "replication_group_multi_az": S("MultiAZ"),
+        "replication_group_automatic_failover": S("AutomaticFailover") >> Intern(),
+        "replication_group_multi_az": S("MultiAZ") >> Intern(),
         "replication_group_configuration_endpoint": S("ConfigurationEndpoint") >> Bend(AwsElastiCacheEndpoint.mapping),
         "replication_group_snapshot_retention_limit": S("SnapshotRetentionLimit"),
         "replication_group_snapshot_window": S("SnapshotWindow"),
         "replication_group_cluster_enabled": S("ClusterEnabled"),
-        "replication_group_cache_node_type": S("CacheNodeType"),
+        "replication_group_cache_node_type": S("CacheNodeType") >> Intern(),
         "replication_group_auth_token_enabled": S("AuthTokenEnabled"),
         "replication_group_auth_token_last_modified_date": S("AuthTokenLastModifiedDate"),
         "replication_group_transit_encryption_enabled": S("TransitEncryptionEnabled"),
@@ -540,7 +525,7 @@ class AwsElastiCacheReplicationGroup(ElastiCacheTaggable, AwsResource):
         "replication_group_user_group_ids": S("UserGroupIds", default=[]),
         "replication_group_log_delivery_configurations": S("LogDeliveryConfigurations", default=[])
         >> ForallBend(AwsElastiCacheLogDeliveryConfiguration.mapping),
-        "replication_group_data_tiering": S("DataTiering"),
+        "replication_group_data_tiering": S("DataTiering") >> Intern(),
     }
     replication_group_description: Optional[str] = field(default=None)
     replication_group_global_replication_group_info: Optional[AwsElastiCacheGlobalReplicationGroupInfo] = field(
@@ -550,8 +535,8 @@ class AwsElastiCacheReplicationGroup(ElastiCacheTaggable, AwsResource):
     replication_group_pending_modified_values: Optional[AwsElastiCacheReplicationGroupPendingModifiedValues] = field(
         default=None
     )
-    replication_group_member_clusters: List[str] = field(factory=list)
-    replication_group_node_groups: List[AwsElastiCacheNodeGroup] = field(factory=list)
+    replication_group_member_clusters: Tuple[str, ...] = field(default=())
+    replication_group_node_groups: Tuple[AwsElastiCacheNodeGroup, ...] = field(default=())
     replication_group_snapshotting_cluster_id: Optional[str] = field(default=None)
     replication_group_automatic_failover: Optional[str] = field(default=None)
     replication_group_multi_az: Optional[str] = field(default=None)
@@ -564,11 +549,13 @@ class AwsElastiCacheReplicationGroup(ElastiCacheTaggable, AwsResource):
     replication_group_auth_token_last_modified_date: Optional[datetime] = field(default=None)
     replication_group_transit_encryption_enabled: Optional[bool] = field(default=None)
     replication_group_at_rest_encryption_enabled: Optional[bool] = field(default=None)
-    replication_group_member_clusters_outpost_arns: List[str] = field(factory=list)
+    replication_group_member_clusters_outpost_arns: Tuple[str, ...] = field(default=())
     replication_group_kms_key_id: Optional[str] = field(default=None)
     replication_group_arn: Optional[str] = field(default=None)
-    replication_group_user_group_ids: List[str] = field(factory=list)
-    replication_group_log_delivery_configurations: List[AwsElastiCacheLogDeliveryConfiguration] = field(factory=list)
+    replication_group_user_group_ids: Tuple[str, ...] = field(default=())
+    replication_group_log_delivery_configurations: Tuple[AwsElastiCacheLogDeliveryConfiguration, ...] = field(
+        default=()
+    )
     replication_group_data_tiering: Optional[str] = field(default=None)
 
     @classmethod
@@ -582,7 +569,7 @@ class AwsElastiCacheReplicationGroup(ElastiCacheTaggable, AwsResource):
                 resource.api_spec.service, "list-tags-for-resource", "TagList", ResourceName=resource.arn
             )
             if tags:
-                resource.tags = bend(ToDict(), tags)
+                resource.tags = tags_to_dict(tags)
 
         for js in json:
             if instance := cls.from_api(js, builder):
@@ -1,6 +1,6 @@
 from datetime import datetime
 from attrs import define, field
-from typing import ClassVar, Dict, List, Optional, Type, Any
+from typing import ClassVar, Dict, List, Optional, Type, Tuple, Any
 
 from fix_plugin_aws.aws_client import AwsClient
 from fix_plugin_aws.resource.athena import AwsAthenaDataCatalog, AwsAthenaWorkGroup
@@ -17,8 +17,8 @@ from fix_plugin_aws.resource.sns import AwsSnsTopic
 from fix_plugin_aws.utils import ToDict
 from fixlib.baseresources import ModelReference
 from fixlib.graph import Graph
-from fixlib.json import value_in_path
-from fixlib.json_bender import S, Bend, Bender, ForallBend, bend
+from fixlib.json import register_json_interned, value_in_path
+from fixlib.json_bender import S, Bend, Bender, ForallBend, Intern, bend
 from fixlib.types import Json
 
 service_name = "sagemaker"
@@ -99,16 +99,16 @@ class AwsSagemakerNotebook(SagemakerTaggable, AwsResource):
         "ctime": S("CreationTime"),
         "mtime": S("LastModifiedTime"),
         "arn": S("NotebookInstanceArn"),
-        "notebook_instance_status": S("NotebookInstanceStatus"),
+        "notebook_instance_status": S("NotebookInstanceStatus") >> Intern(),
         "notebook_failure_reason": S("FailureReason"),
         "notebook_url": S("Url"),
-        "notebook_instance_type": S("InstanceType"),
+        "notebook_instance_type": S("InstanceType") >> Intern(),
         "notebook_instance_lifecycle_config_name": S("NotebookInstanceLifecycleConfigName"),
         "notebook_direct_internet_access": S("DirectInternetAccess"),
         "notebook_volume_size_in_gb": S("VolumeSizeInGB"),
-        "notebook_accelerator_types": S("AcceleratorTypes", default=[]),
+        "notebook_accelerator_types": S("AcceleratorTypes", default=()),
         "notebook_default_code_repository": S("DefaultCodeRepository"),
-        "notebook_additional_code_repositories": S("AdditionalCodeRepositories", default=[]),
+        "notebook_additional_code_repositories": S("AdditionalCodeRepositories", default=()),
         "notebook_root_access": S("RootAccess"),
         "notebook_platform_identifier": S("PlatformIdentifier"),
         "notebook_instance_metadata_service_configuration": S(
@@ -122,9 +122,9 @@ class AwsSagemakerNotebook(SagemakerTaggable, AwsResource):
     notebook_instance_lifecycle_config_name: Optional[str] = field(default=None)
     notebook_direct_internet_access: Optional[str] = field(default=None)
     notebook_volume_size_in_gb: Optional[int] = field(default=None)
-    notebook_accelerator_types: List[str] = field(factory=list)
+    notebook_accelerator_types: Tuple[str, ...] = field(default=())
     notebook_default_code_repository: Optional[str] = field(default=None)
-    notebook_additional_code_repositories: List[str] = field(factory=list)
+    notebook_additional_code_repositories: Tuple[str, ...] = field(default=())
     notebook_root_access: Optional[str] = field(default=None)
     notebook_platform_identifier: Optional[str] = field(default=None)
     notebook_instance_metadata_service_configuration: Optional[str] = field(default=None)
@@ -168,7 +168,7 @@ class AwsSagemakerNotebook(SagemakerTaggable, AwsResource):
             builder.dependant_node(self, clazz=AwsKmsKey, id=AwsKmsKey.normalise_id(key))
         if nw_interface := value_in_path(source, "NetworkInterfaceId"):
             builder.dependant_node(self, clazz=AwsEc2NetworkInterface, id=nw_interface)
-        code_repos = [self.notebook_default_code_repository] + self.notebook_additional_code_repositories
+        code_repos = [self.notebook_default_code_repository, *self.notebook_additional_code_repositories]
         for repo in code_repos:
             builder.add_edge(self, reverse=True, clazz=AwsSagemakerCodeRepository, name=repo)
 
@@ -192,7 +192,7 @@ class AwsSagemakerNotebook(SagemakerTaggable, AwsResource):
         return super().called_mutator_apis() + [AwsApiSpec(service_name, "delete-notebook-instance")]
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerParameterRangeSpecification:
     kind: ClassVar[str] = "aws_sagemaker_integer_parameter_range_specification"
     kind_display: ClassVar[str] = "AWS SageMaker Integer Parameter Range Specification"
@@ -206,7 +206,7 @@ class AwsSagemakerParameterRangeSpecification:
     max_value: Optional[str] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerParameterRange:
     kind: ClassVar[str] = "aws_sagemaker_parameter_range"
     kind_display: ClassVar[str] = "AWS SageMaker Parameter Range"
@@ -220,14 +220,14 @@ class AwsSagemakerParameterRange:
         >> Bend(AwsSagemakerParameterRangeSpecification.mapping),
         "continuous_parameter_range_specification": S("ContinuousParameterRangeSpecification")
         >> Bend(AwsSagemakerParameterRangeSpecification.mapping),
-        "categorical_parameter_range_specification": S("CategoricalParameterRangeSpecification", "Values", default=[]),
+        "categorical_parameter_range_specification": S("CategoricalParameterRangeSpecification", "Values", default=()),
     }
     integer_parameter_range_specification: Optional[AwsSagemakerParameterRangeSpecification] = field(default=None)
     continuous_parameter_range_specification: Optional[AwsSagemakerParameterRangeSpecification] = field(default=None)
-    categorical_parameter_range_specification: List[str] = field(factory=list)
+    categorical_parameter_range_specification: Tuple[str, ...] = field(default=())
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerHyperParameterSpecification:
     kind: ClassVar[str] = "aws_sagemaker_hyper_parameter_specification"
     kind_display: ClassVar[str] = "AWS SageMaker Hyper Parameter Specification"
@@ -255,7 +255,7 @@ class AwsSagemakerHyperParameterSpecification:
     default_value: Optional[str] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True, frozen=True)
 class AwsSagemakerMetricDefinition:
     kind: ClassVar[str] = "aws_sagemaker_metric_definition"
     kind_display: ClassVar[str] = "AWS SageMaker Metric Definition"
@@ -269,7 +269,11 @@ class AwsSagemakerMetricDefinition:
     regex: Optional[str] = field(default=None)
 
 
-@define(eq=False, slots=False)
+# built-in algorithms define the same metrics for every algorithm, tuning and training job: only create them once
+register_json_interned(AwsSagemakerMetricDefinition)
+
+
+@define(eq=False, slots=True)
 class AwsSagemakerChannelSpecification:
     kind: ClassVar[str] = "aws_sagemaker_channel_specification"
     kind_display: ClassVar[str] = "AWS SageMaker Channel Specification"
@@ -282,19 +286,19 @@ class AwsSagemakerChannelSpecification:
         "name": S("Name"),
         "description": S("Description"),
         "is_required": S("IsRequired"),
-        "supported_content_types": S("SupportedContentTypes", default=[]),
-        "supported_compression_types": S("SupportedCompressionTypes", default=[]),
-        "supported_input_modes": S("SupportedInputModes", default=[]),
+        "supported_content_types": S("SupportedContentTypes", default=()),
+        "supported_compression_types": S("SupportedCompressionTypes", default=()),
+        "supported_input_modes": S("SupportedInputModes", default=()),
     }
     name: Optional[str] = field(default=None)
     description: Optional[str] = field(default=None)
     is_required: Optional[bool] = field(default=None)
-    supported_content_types: List[str] = field(factory=list)
-    supported_compression_types: List[str] = field(factory=list)
-    supported_input_modes: List[str] = field(factory=list)
+    supported_content_types: Tuple[str, ...] = field(default=())
+    supported_compression_types: Tuple[str, ...] = field(default=())
+    supported_input_modes: Tuple[str, ...] = field(default=())
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerHyperParameterTuningJobObjective:
     kind: ClassVar[str] = "aws_sagemaker_hyper_parameter_tuning_job_objective"
     kind_display: ClassVar[str] = "AWS SageMaker Hyperparameter Tuning Job Objective"
@@ -308,7 +312,7 @@ class AwsSagemakerHyperParameterTuningJobObjective:
     metric_name: Optional[str] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerTrainingSpecification:
     kind: ClassVar[str] = "aws_sagemaker_training_specification"
     kind_display: ClassVar[str] = "AWS SageMaker Training Specification"
@@ -320,26 +324,26 @@ class AwsSagemakerTrainingSpecification:
     mapping: ClassVar[Dict[str, Bender]] = {
         "training_image": S("TrainingImage"),
         "training_image_digest": S("TrainingImageDigest"),
-        "supported_hyper_parameters": S("SupportedHyperParameters", default=[])
+        "supported_hyper_parameters": S("SupportedHyperParameters", default=())
         >> ForallBend(AwsSagemakerHyperParameterSpecification.mapping),
-        "supported_training_instance_types": S("SupportedTrainingInstanceTypes", default=[]),
+        "supported_training_instance_types": S("SupportedTrainingInstanceTypes", default=()),
         "supports_distributed_training": S("SupportsDistributedTraining"),
-        "metric_definitions": S("MetricDefinitions", default=[]) >> ForallBend(AwsSagemakerMetricDefinition.mapping),
-        "training_channels": S("TrainingChannels", default=[]) >> ForallBend(AwsSagemakerChannelSpecification.mapping),
-        "supported_tuning_job_objective_metrics": S("SupportedTuningJobObjectiveMetrics", default=[])
+        "metric_definitions": S("MetricDefinitions", default=()) >> ForallBend(AwsSagemakerMetricDefinition.mapping),
+        "training_channels": S("TrainingChannels", default=()) >> ForallBend(AwsSagemakerChannelSpecification.mapping),
+        "supported_tuning_job_objective_metrics": S("SupportedTuningJobObjectiveMetrics", default=())
         >> ForallBend(AwsSagemakerHyperParameterTuningJobObjective.mapping),
     }
     training_image: Optional[str] = field(default=None)
     training_image_digest: Optional[str] = field(default=None)
-    supported_hyper_parameters: List[AwsSagemakerHyperParameterSpecification] = field(factory=list)
-    supported_training_instance_types: List[str] = field(factory=list)
+    supported_hyper_parameters: Tuple[AwsSagemakerHyperParameterSpecification, ...] = field(default=())
+    supported_training_instance_types: Tuple[str, ...] = field(default=())
     supports_distributed_training: Optional[bool] = field(default=None)
-    metric_definitions: List[AwsSagemakerMetricDefinition] = field(factory=list)
-    training_channels: List[AwsSagemakerChannelSpecification] = field(factory=list)
-    supported_tuning_job_objective_metrics: List[AwsSagemakerHyperParameterTuningJobObjective] = field(factory=list)
+    metric_definitions: Tuple[AwsSagemakerMetricDefinition, ...] = field(default=())
+    training_channels: Tuple[AwsSagemakerChannelSpecification, ...] = field(default=())
+    supported_tuning_job_objective_metrics: Tuple[AwsSagemakerHyperParameterTuningJobObjective, ...] = field(default=())
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerModelPackageContainerDefinition:
     kind: ClassVar[str] = "aws_sagemaker_model_package_container_definition"
     kind_display: ClassVar[str] = "AWS SageMaker Model Package Container Definition"
@@ -372,7 +376,7 @@ class AwsSagemakerModelPackageContainerDefinition:
     nearest_model_name: Optional[str] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerInferenceSpecification:
     kind: ClassVar[str] = "aws_sagemaker_inference_specification"
     kind_display: ClassVar[str] = "AWS SageMaker Inference Specification"
@@ -382,20 +386,20 @@ class AwsSagemakerInferenceSpecification:
         " SageMaker for making predictions."
     )
     mapping: ClassVar[Dict[str, Bender]] = {
-        "containers": S("Containers", default=[]) >> ForallBend(AwsSagemakerModelPackageContainerDefinition.mapping),
-        "supported_transform_instance_types": S("SupportedTransformInstanceTypes", default=[]),
-        "supported_realtime_inference_instance_types": S("SupportedRealtimeInferenceInstanceTypes", default=[]),
-        "supported_content_types": S("SupportedContentTypes", default=[]),
-        "supported_response_mime_types": S("SupportedResponseMIMETypes", default=[]),
+        "containers": S("Containers", default=()) >> ForallBend(AwsSagemakerModelPackageContainerDefinition.mapping),
+        "supported_transform_instance_types": S("SupportedTransformInstanceTypes", default=()),
+        "supported_realtime_inference_instance_types": S("SupportedRealtimeInferenceInstanceTypes", default=()),
+        "supported_content_types": S("SupportedContentTypes", default=()),
+        "supported_response_mime_types": S("SupportedResponseMIMETypes", default=()),
     }
-    containers: List[AwsSagemakerModelPackageContainerDefinition] = field(factory=list)
-    supported_transform_instance_types: List[str] = field(factory=list)
-    supported_realtime_inference_instance_types: List[str] = field(factory=list)
-    supported_content_types: List[str] = field(factory=list)
-    supported_response_mime_types: List[str] = field(factory=list)
+    containers: Tuple[AwsSagemakerModelPackageContainerDefinition, ...] = field(default=())
+    supported_transform_instance_types: Tuple[str, ...] = field(default=())
+    supported_realtime_inference_instance_types: Tuple[str, ...] = field(default=())
+    supported_content_types: Tuple[str, ...] = field(default=())
+    supported_response_mime_types: Tuple[str, ...] = field(default=())
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerS3DataSource:
     kind: ClassVar[str] = "aws_sagemaker_s3_data_source"
     kind_display: ClassVar[str] = "AWS SageMaker S3 Data Source"
@@ -408,17 +412,17 @@ class AwsSagemakerS3DataSource:
         "s3_data_type": S("S3DataType"),
         "s3_uri": S("S3Uri"),
         "s3_data_distribution_type": S("S3DataDistributionType"),
-        "attribute_names": S("AttributeNames", default=[]),
-        "instance_group_names": S("InstanceGroupNames", default=[]),
+        "attribute_names": S("AttributeNames", default=()),
+        "instance_group_names": S("InstanceGroupNames", default=()),
     }
     s3_data_type: Optional[str] = field(default=None)
     s3_uri: Optional[str] = field(default=None)
     s3_data_distribution_type: Optional[str] = field(default=None)
-    attribute_names: List[str] = field(factory=list)
-    instance_group_names: List[str] = field(factory=list)
+    attribute_names: Tuple[str, ...] = field(default=())
+    instance_group_names: Tuple[str, ...] = field(default=())
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerFileSystemDataSource:
     kind: ClassVar[str] = "aws_sagemaker_file_system_data_source"
     kind_display: ClassVar[str] = "AWS SageMaker File System Data Source"
@@ -429,8 +433,8 @@ class AwsSagemakerFileSystemDataSource:
     )
     mapping: ClassVar[Dict[str, Bender]] = {
         "file_system_id": S("FileSystemId"),
-        "file_system_access_mode": S("FileSystemAccessMode"),
-        "file_system_type": S("FileSystemType"),
+        "file_system_access_mode": S("FileSystemAccessMode") >> Intern(),
+        "file_system_type": S("FileSystemType") >> Intern(),
         "directory_path": S("DirectoryPath"),
     }
     file_system_id: Optional[str] = field(default=None)
@@ -439,7 +443,7 @@ class AwsSagemakerFileSystemDataSource:
     directory_path: Optional[str] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerDataSource:
     kind: ClassVar[str] = "aws_sagemaker_data_source"
     kind_display: ClassVar[str] = "AWS SageMaker Data Source"
@@ -455,7 +459,7 @@ class AwsSagemakerDataSource:
     file_system_data_source: Optional[AwsSagemakerFileSystemDataSource] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerChannel:
     kind: ClassVar[str] = "aws_sagemaker_channel"
     kind_display: ClassVar[str] = "AWS SageMaker Channel"
@@ -467,10 +471,10 @@ class AwsSagemakerChannel:
     mapping: ClassVar[Dict[str, Bender]] = {
         "channel_name": S("ChannelName"),
         "data_source": S("DataSource") >> Bend(AwsSagemakerDataSource.mapping),
-        "content_type": S("ContentType"),
-        "compression_type": S("CompressionType"),
-        "record_wrapper_type": S("RecordWrapperType"),
-        "input_mode": S("InputMode"),
+        "content_type": S("ContentType") >> Intern(),
+        "compression_type": S("CompressionType") >> Intern(),
+        "record_wrapper_type": S("RecordWrapperType") >> Intern(),
+        "input_mode": S("InputMode") >> Intern(),
         "shuffle_config": S("ShuffleConfig", "Seed"),
     }
     channel_name: Optional[str] = field(default=None)
@@ -482,7 +486,7 @@ class AwsSagemakerChannel:
     shuffle_config: Optional[int] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerOutputDataConfig:
     kind: ClassVar[str] = "aws_sagemaker_output_data_config"
     kind_display: ClassVar[str] = "AWS SageMaker Output Data Config"
@@ -495,7 +499,7 @@ class AwsSagemakerOutputDataConfig:
     s3_output_path: Optional[str] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerInstanceGroup:
     kind: ClassVar[str] = "aws_sagemaker_instance_group"
     kind_display: ClassVar[str] = "AWS SageMaker Instance Group"
@@ -504,7 +508,7 @@ class AwsSagemakerInstanceGroup:
         " training and deploying machine learning models with Amazon SageMaker."
     )
     mapping: ClassVar[Dict[str, Bender]] = {
-        "instance_type": S("InstanceType"),
+        "instance_type": S("InstanceType") >> Intern(),
         "instance_count": S("InstanceCount"),
         "instance_group_name": S("InstanceGroupName"),
     }
@@ -513,7 +517,7 @@ class AwsSagemakerInstanceGroup:
     instance_group_name: Optional[str] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerResourceConfig:
     kind: ClassVar[str] = "aws_sagemaker_resource_config"
     kind_display: ClassVar[str] = "AWS SageMaker Resource Config"
@@ -523,22 +527,22 @@ class AwsSagemakerResourceConfig:
         " allows users to build, train, and deploy machine learning models at scale."
     )
     mapping: ClassVar[Dict[str, Bender]] = {
-        "instance_type": S("InstanceType"),
+        "instance_type": S("InstanceType") >> Intern(),
         "instance_count": S("InstanceCount"),
         "volume_size_in_gb": S("VolumeSizeInGB"),
         "volume_kms_key_id": S("VolumeKmsKeyId"),
-        "instance_groups": S("InstanceGroups", default=[]) >> ForallBend(AwsSagemakerInstanceGroup.mapping),
+        "instance_groups": S("InstanceGroups", default=()) >> ForallBend(AwsSagemakerInstanceGroup.mapping),
         "keep_alive_period_in_seconds": S("KeepAlivePeriodInSeconds"),
     }
     instance_type: Optional[str] = field(default=None)
     instance_count: Optional[int] = field(default=None)
     volume_size_in_gb: Optional[int] = field(default=None)
     volume_kms_key_id: Optional[str] = field(default=None)
-    instance_groups: List[AwsSagemakerInstanceGroup] = field(factory=list)
+    instance_groups: Tuple[AwsSagemakerInstanceGroup, ...] = field(default=())
     keep_alive_period_in_seconds: Optional[int] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerStoppingCondition:
     kind: ClassVar[str] = "aws_sagemaker_stopping_condition"
     kind_display: ClassVar[str] = "AWS SageMaker Stopping Condition"
@@ -555,7 +559,7 @@ class AwsSagemakerStoppingCondition:
     max_wait_time_in_seconds: Optional[int] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerTrainingJobDefinition:
     kind: ClassVar[str] = "aws_sagemaker_training_job_definition"
     kind_display: ClassVar[str] = "AWS SageMaker Training Job Definition"
@@ -566,22 +570,22 @@ class AwsSagemakerTrainingJobDefinition:
         " train, and deploy machine learning models quickly and easily."
     )
     mapping: ClassVar[Dict[str, Bender]] = {
-        "training_input_mode": S("TrainingInputMode"),
+        "training_input_mode": S("TrainingInputMode") >> Intern(),
         "hyper_parameters": S("HyperParameters"),
-        "input_data_config": S("InputDataConfig", default=[]) >> ForallBend(AwsSagemakerChannel.mapping),
+        "input_data_config": S("InputDataConfig", default=()) >> ForallBend(AwsSagemakerChannel.mapping),
         "output_data_config": S("OutputDataConfig") >> Bend(AwsSagemakerOutputDataConfig.mapping),
         "resource_config": S("ResourceConfig") >> Bend(AwsSagemakerResourceConfig.mapping),
         "stopping_condition": S("StoppingCondition") >> Bend(AwsSagemakerStoppingCondition.mapping),
     }
     training_input_mode: Optional[str] = field(default=None)
     hyper_parameters: Optional[Dict[str, str]] = field(default=None)
-    input_data_config: List[AwsSagemakerChannel] = field(factory=list)
+    input_data_config: Tuple[AwsSagemakerChannel, ...] = field(default=())
     output_data_config: Optional[AwsSagemakerOutputDataConfig] = field(default=None)
     resource_config: Optional[AwsSagemakerResourceConfig] = field(default=None)
     stopping_condition: Optional[AwsSagemakerStoppingCondition] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerTransformS3DataSource:
     kind: ClassVar[str] = "aws_sagemaker_transform_s3_data_source"
     kind_display: ClassVar[str] = "AWS SageMaker Transform S3 Data Source"
@@ -594,7 +598,7 @@ class AwsSagemakerTransformS3DataSource:
     s3_uri: Optional[str] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerTransformDataSource:
     kind: ClassVar[str] = "aws_sagemaker_transform_data_source"
     kind_display: ClassVar[str] = "AWS SageMaker Transform Data Source"
@@ -609,7 +613,7 @@ class AwsSagemakerTransformDataSource:
     s3_data_source: Optional[AwsSagemakerTransformS3DataSource] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerTransformInput:
     kind: ClassVar[str] = "aws_sagemaker_transform_input"
     kind_display: ClassVar[str] = "AWS SageMaker Transform Input"
@@ -620,9 +624,9 @@ class AwsSagemakerTransformInput:
     )
     mapping: ClassVar[Dict[str, Bender]] = {
         "data_source": S("DataSource") >> Bend(AwsSagemakerTransformDataSource.mapping),
-        "content_type": S("ContentType"),
-        "compression_type": S("CompressionType"),
-        "split_type": S("SplitType"),
+        "content_type": S("ContentType") >> Intern(),
+        "compression_type": S("CompressionType") >> Intern(),
+        "split_type": S("SplitType") >> Intern(),
     }
     data_source: Optional[AwsSagemakerTransformDataSource] = field(default=None)
     content_type: Optional[str] = field(default=None)
@@ -630,7 +634,7 @@ class AwsSagemakerTransformInput:
     split_type: Optional[str] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerTransformOutput:
     kind: ClassVar[str] = "aws_sagemaker_transform_output"
     kind_display: ClassVar[str] = "AWS SageMaker Transform Output"
@@ -651,7 +655,7 @@ class AwsSagemakerTransformOutput:
     kms_key_id: Optional[str] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerTransformResources:
     kind: ClassVar[str] = "aws_sagemaker_transform_resources"
     kind_display: ClassVar[str] = "AWS SageMaker Transform Resources"
@@ -661,7 +665,7 @@ class AwsSagemakerTransformResources:
         " predictions or inferences."
     )
     mapping: ClassVar[Dict[str, Bender]] = {
-        "instance_type": S("InstanceType"),
+        "instance_type": S("InstanceType") >> Intern(),
         "instance_count": S("InstanceCount"),
         "volume_kms_key_id": S("VolumeKmsKeyId"),
     }
@@ -670,7 +674,7 @@ class AwsSagemakerTransformResources:
     volume_kms_key_id: Optional[str] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerTransformJobDefinition:
     kind: ClassVar[str] = "aws_sagemaker_transform_job_definition"
     kind_display: ClassVar[str] = "AWS SageMaker Transform Job Definition"
@@ -697,7 +701,7 @@ class AwsSagemakerTransformJobDefinition:
     transform_resources: Optional[AwsSagemakerTransformResources] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerAlgorithmValidationProfile:
     kind: ClassVar[str] = "aws_sagemaker_algorithm_validation_profile"
     kind_display: ClassVar[str] = "AWS SageMaker Algorithm Validation Profile"
@@ -715,7 +719,7 @@ class AwsSagemakerAlgorithmValidationProfile:
     transform_job_definition: Optional[AwsSagemakerTransformJobDefinition] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerAlgorithmStatusItem:
     kind: ClassVar[str] = "aws_sagemaker_algorithm_status_item"
     kind_display: ClassVar[str] = "AWS SageMaker Algorithm Status Item"
@@ -725,7 +729,7 @@ class AwsSagemakerAlgorithmStatusItem:
     )
     mapping: ClassVar[Dict[str, Bender]] = {
         "name": S("Name"),
-        "status": S("Status"),
+        "status": S("Status") >> Intern(),
         "failure_reason": S("FailureReason"),
     }
     name: Optional[str] = field(default=None)
@@ -733,7 +737,7 @@ class AwsSagemakerAlgorithmStatusItem:
     failure_reason: Optional[str] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerAlgorithmStatusDetails:
     kind: ClassVar[str] = "aws_sagemaker_algorithm_status_details"
     kind_display: ClassVar[str] = "AWS SageMaker Algorithm Status Details"
@@ -743,13 +747,13 @@ class AwsSagemakerAlgorithmStatusDetails:
         " learning service."
     )
     mapping: ClassVar[Dict[str, Bender]] = {
-        "validation_statuses": S("ValidationStatuses", default=[])
+        "validation_statuses": S("ValidationStatuses", default=())
         >> ForallBend(AwsSagemakerAlgorithmStatusItem.mapping),
-        "image_scan_statuses": S("ImageScanStatuses", default=[])
+        "image_scan_statuses": S("ImageScanStatuses", default=())
         >> ForallBend(AwsSagemakerAlgorithmStatusItem.mapping),
     }
-    validation_statuses: List[AwsSagemakerAlgorithmStatusItem] = field(factory=list)
-    image_scan_statuses: List[AwsSagemakerAlgorithmStatusItem] = field(factory=list)
+    validation_statuses: Tuple[AwsSagemakerAlgorithmStatusItem, ...] = field(default=())
+    image_scan_statuses: Tuple[AwsSagemakerAlgorithmStatusItem, ...] = field(default=())
 
 
 @define(eq=False, slots=False)
@@ -775,8 +779,8 @@ class AwsSagemakerAlgorithm(AwsResource):
         >> Bend(AwsSagemakerTrainingSpecification.mapping),
         "algorithm_inference_specification": S("InferenceSpecification")
         >> Bend(AwsSagemakerInferenceSpecification.mapping),
-        "algorithm_validation_profiles": S("ValidationSpecification", "ValidationProfiles", default=[]),
-        "algorithm_status": S("AlgorithmStatus"),
+        "algorithm_validation_profiles": S("ValidationSpecification", "ValidationProfiles", default=()),
+        "algorithm_status": S("AlgorithmStatus") >> Intern(),
         "algorithm_status_details": S("AlgorithmStatusDetails") >> Bend(AwsSagemakerAlgorithmStatusDetails.mapping),
         "algorithm_product_id": S("ProductId"),
         "algorithm_certify_for_marketplace": S("CertifyForMarketplace"),
@@ -784,7 +788,7 @@ class AwsSagemakerAlgorithm(AwsResource):
     algorithm_description: Optional[str] = field(default=None)
     algorithm_training_specification: Optional[AwsSagemakerTrainingSpecification] = field(default=None)
     algorithm_inference_specification: Optional[AwsSagemakerInferenceSpecification] = field(default=None)
-    algorithm_validation_profiles: List[AwsSagemakerAlgorithmValidationProfile] = field(factory=list)
+    algorithm_validation_profiles: Tuple[AwsSagemakerAlgorithmValidationProfile, ...] = field(default=())
     algorithm_status: Optional[str] = field(default=None)
     algorithm_status_details: Optional[AwsSagemakerAlgorithmStatusDetails] = field(default=None)
     algorithm_product_id: Optional[str] = field(default=None)
@@ -827,7 +831,7 @@ class AwsSagemakerAlgorithm(AwsResource):
         return super().called_mutator_apis() + [AwsApiSpec(service_name, "delete-algorithm")]
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerImageConfig:
     kind: ClassVar[str] = "aws_sagemaker_image_config"
     kind_display: ClassVar[str] = "AWS SageMaker Image Configuration"
@@ -836,14 +840,14 @@ class AwsSagemakerImageConfig:
         " to define and package custom ML environments for training and inference."
     )
     mapping: ClassVar[Dict[str, Bender]] = {
-        "repository_access_mode": S("RepositoryAccessMode"),
+        "repository_access_mode": S("RepositoryAccessMode") >> Intern(),
         "repository_auth_config": S("RepositoryAuthConfig", "RepositoryCredentialsProviderArn"),
     }
     repository_access_mode: Optional[str] = field(default=None)
     repository_auth_config: Optional[str] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerContainerDefinition:
     kind: ClassVar[str] = "aws_sagemaker_container_definition"
     kind_display: ClassVar[str] = "AWS SageMaker Container Definition"
@@ -874,7 +878,7 @@ class AwsSagemakerContainerDefinition:
     multi_model_config: Optional[str] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerVpcConfig:
     kind: ClassVar[str] = "aws_sagemaker_vpc_config"
     kind_display: ClassVar[str] = "AWS SageMaker VPC Config"
@@ -885,11 +889,11 @@ class AwsSagemakerVpcConfig:
         " environment."
     )
     mapping: ClassVar[Dict[str, Bender]] = {
-        "security_group_ids": S("SecurityGroupIds", default=[]),
-        "subnets": S("Subnets", default=[]),
+        "security_group_ids": S("SecurityGroupIds", default=()),
+        "subnets": S("Subnets", default=()),
     }
-    security_group_ids: List[str] = field(factory=list)
-    subnets: List[str] = field(factory=list)
+    security_group_ids: Tuple[str, ...] = field(default=())
+    subnets: Tuple[str, ...] = field(default=())
 
 
 @define(eq=False, slots=False)
@@ -915,13 +919,13 @@ class AwsSagemakerModel(SagemakerTaggable, AwsResource):
         "ctime": S("CreationTime"),
         "arn": S("ModelArn"),
         "model_primary_container": S("PrimaryContainer") >> Bend(AwsSagemakerContainerDefinition.mapping),
-        "model_containers": S("Containers", default=[]) >> ForallBend(AwsSagemakerContainerDefinition.mapping),
+        "model_containers": S("Containers", default=()) >> ForallBend(AwsSagemakerContainerDefinition.mapping),
         "model_inference_execution_config": S("InferenceExecutionConfig", "Mode"),
         "model_vpc_config": S("VpcConfig") >> Bend(AwsSagemakerVpcConfig.mapping),
         "model_enable_network_isolation": S("EnableNetworkIsolation"),
     }
     model_primary_container: Optional[AwsSagemakerContainerDefinition] = field(default=None)
-    model_containers: List[AwsSagemakerContainerDefinition] = field(factory=list)
+    model_containers: Tuple[AwsSagemakerContainerDefinition, ...] = field(default=())
     model_inference_execution_config: Optional[str] = field(default=None)
     model_vpc_config: Optional[AwsSagemakerVpcConfig] = field(default=None)
     model_enable_network_isolation: Optional[bool] = field(default=None)
@@ -969,7 +973,7 @@ class AwsSagemakerModel(SagemakerTaggable, AwsResource):
         return super().called_mutator_apis() + [AwsApiSpec(service_name, "delete-model")]
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True, frozen=True)
 class AwsSagemakerResourceSpec:
     kind: ClassVar[str] = "aws_sagemaker_resource_spec"
     kind_display: ClassVar[str] = "AWS SageMaker Resource Spec"
@@ -981,7 +985,7 @@ class AwsSagemakerResourceSpec:
     mapping: ClassVar[Dict[str, Bender]] = {
         "sage_maker_image_arn": S("SageMakerImageArn"),
         "sage_maker_image_version_arn": S("SageMakerImageVersionArn"),
-        "instance_type": S("InstanceType"),
+        "instance_type": S("InstanceType") >> Intern(),
         "lifecycle_config_arn": S("LifecycleConfigArn"),
     }
     sage_maker_image_arn: Optional[str] = field(default=None)
@@ -990,6 +994,10 @@ class AwsSagemakerResourceSpec:
     lifecycle_config_arn: Optional[str] = field(default=None)
 
 
+# domains and user profiles define a resource spec per app type, with only a handful of distinct specs
+register_json_interned(AwsSagemakerResourceSpec)
+
+
 @define(eq=False, slots=False)
 class AwsSagemakerApp(AwsResource):
     kind: ClassVar[str] = "aws_sagemaker_app"
@@ -1012,10 +1020,10 @@ class AwsSagemakerApp(AwsResource):
         "ctime": S("CreationTime"),
         "atime": S("LastUserActivityTimestamp"),
         "arn": S("AppArn"),
-        "app_type": S("AppType"),
+        "app_type": S("AppType") >> Intern(),
         "app_domain_id": S("DomainId"),
         "app_user_profile_name": S("UserProfileName"),
-        "app_status": S("Status"),
+        "app_status": S("Status") >> Intern(),
         "app_last_health_check_timestamp": S("LastHealthCheckTimestamp"),
         "app_failure_reason": S("FailureReason"),
         "app_resource_spec": S("ResourceSpec") >> Bend(AwsSagemakerResourceSpec.mapping),
@@ -1111,7 +1119,7 @@ class AwsSagemakerApp(AwsResource):
         return super().called_mutator_apis() + [AwsApiSpec(service_name, "delete-app")]
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerSharingSettings:
     kind: ClassVar[str] = "aws_sagemaker_sharing_settings"
     kind_display: ClassVar[str] = "AWS SageMaker Sharing Settings"
@@ -1130,7 +1138,7 @@ class AwsSagemakerSharingSettings:
     s3_kms_key_id: Optional[str] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerJupyterServerAppSettings:
     kind: ClassVar[str] = "aws_sagemaker_jupyter_server_app_settings"
     kind_display: ClassVar[str] = "AWS SageMaker Jupyter Server App Settings"
@@ -1141,15 +1149,15 @@ class AwsSagemakerJupyterServerAppSettings:
     )
     mapping: ClassVar[Dict[str, Bender]] = {
         "default_resource_spec": S("DefaultResourceSpec") >> Bend(AwsSagemakerResourceSpec.mapping),
-        "lifecycle_config_arns": S("LifecycleConfigArns", default=[]),
-        "code_repositories": S("CodeRepositories", default=[]),
+        "lifecycle_config_arns": S("LifecycleConfigArns", default=()),
+        "code_repositories": S("CodeRepositories", default=()),
     }
     default_resource_spec: Optional[AwsSagemakerResourceSpec] = field(default=None)
-    lifecycle_config_arns: List[str] = field(factory=list)
-    code_repositories: List[Dict[str, str]] = field(factory=list)
+    lifecycle_config_arns: Tuple[str, ...] = field(default=())
+    code_repositories: Tuple[Dict[str, str], ...] = field(default=())
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerCustomImage:
     kind: ClassVar[str] = "aws_sagemaker_custom_image"
     kind_display: ClassVar[str] = "AWS SageMaker Custom Image"
@@ -1168,7 +1176,7 @@ class AwsSagemakerCustomImage:
     app_image_config_name: Optional[str] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerKernelGatewayAppSettings:
     kind: ClassVar[str] = "aws_sagemaker_kernel_gateway_app_settings"
     kind_display: ClassVar[str] = "AWS SageMaker Kernel Gateway App Settings"
@@ -1178,15 +1186,15 @@ class AwsSagemakerKernelGatewayAppSettings:
     )
     mapping: ClassVar[Dict[str, Bender]] = {
         "default_resource_spec": S("DefaultResourceSpec") >> Bend(AwsSagemakerResourceSpec.mapping),
-        "custom_images": S("CustomImages", default=[]) >> ForallBend(AwsSagemakerCustomImage.mapping),
-        "lifecycle_config_arns": S("LifecycleConfigArns", default=[]),
+        "custom_images": S("CustomImages", default=()) >> ForallBend(AwsSagemakerCustomImage.mapping),
+        "lifecycle_config_arns": S("LifecycleConfigArns", default=()),
     }
     default_resource_spec: Optional[AwsSagemakerResourceSpec] = field(default=None)
-    custom_images: List[AwsSagemakerCustomImage] = field(factory=list)
-    lifecycle_config_arns: List[str] = field(factory=list)
+    custom_images: Tuple[AwsSagemakerCustomImage, ...] = field(default=())
+    lifecycle_config_arns: Tuple[str, ...] = field(default=())
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerTensorBoardAppSettings:
     kind: ClassVar[str] = "aws_sagemaker_tensor_board_app_settings"
     kind_display: ClassVar[str] = "AWS SageMaker Tensor Board App Settings"
@@ -1201,7 +1209,7 @@ class AwsSagemakerTensorBoardAppSettings:
     default_resource_spec: Optional[AwsSagemakerResourceSpec] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerRStudioServerProAppSettings:
     kind: ClassVar[str] = "aws_sagemaker_r_studio_server_pro_app_settings"
     kind_display: ClassVar[str] = "AWS SageMaker RStudio Server Pro App Settings"
@@ -1216,7 +1224,7 @@ class AwsSagemakerRStudioServerProAppSettings:
     user_group: Optional[str] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerRSessionAppSettings:
     kind: ClassVar[str] = "aws_sagemaker_r_session_app_settings"
     kind_display: ClassVar[str] = "AWS SageMaker R Session App Settings"
@@ -1226,13 +1234,13 @@ class AwsSagemakerRSessionAppSettings:
     )
     mapping: ClassVar[Dict[str, Bender]] = {
         "default_resource_spec": S("DefaultResourceSpec") >> Bend(AwsSagemakerResourceSpec.mapping),
-        "custom_images": S("CustomImages", default=[]) >> ForallBend(AwsSagemakerCustomImage.mapping),
+        "custom_images": S("CustomImages", default=()) >> ForallBend(AwsSagemakerCustomImage.mapping),
     }
     default_resource_spec: Optional[AwsSagemakerResourceSpec] = field(default=None)
-    custom_images: List[AwsSagemakerCustomImage] = field(factory=list)
+    custom_images: Tuple[AwsSagemakerCustomImage, ...] = field(default=())
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerTimeSeriesForecastingSettings:
     kind: ClassVar[str] = "aws_sagemaker_time_series_forecasting_settings"
     kind_display: ClassVar[str] = "AWS SageMaker Time Series Forecasting Settings"
@@ -1242,14 +1250,14 @@ class AwsSagemakerTimeSeriesForecastingSettings:
         " platform."
     )
     mapping: ClassVar[Dict[str, Bender]] = {
-        "status": S("Status"),
+        "status": S("Status") >> Intern(),
         "amazon_forecast_role_arn": S("AmazonForecastRoleArn"),
     }
     status: Optional[str] = field(default=None)
     amazon_forecast_role_arn: Optional[str] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerCanvasAppSettings:
     kind: ClassVar[str] = "aws_sagemaker_canvas_app_settings"
     kind_display: ClassVar[str] = "AWS SageMaker Canvas App Settings"
@@ -1264,7 +1272,7 @@ class AwsSagemakerCanvasAppSettings:
     time_series_forecasting_settings: Optional[AwsSagemakerTimeSeriesForecastingSettings] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerUserSettings:
     kind: ClassVar[str] = "aws_sagemaker_user_settings"
     kind_display: ClassVar[str] = "AWS SageMaker User Settings"
@@ -1296,7 +1304,7 @@ class AwsSagemakerUserSettings:
     canvas_app_settings: Optional[AwsSagemakerCanvasAppSettings] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerRStudioServerProDomainSettings:
     kind: ClassVar[str] = "aws_sagemaker_r_studio_server_pro_domain_settings"
     kind_display: ClassVar[str] = "AWS SageMaker R Studio Server Pro Domain Settings"
@@ -1317,7 +1325,7 @@ class AwsSagemakerRStudioServerProDomainSettings:
     default_resource_spec: Optional[AwsSagemakerResourceSpec] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerDomainSettings:
     kind: ClassVar[str] = "aws_sagemaker_domain_settings"
     kind_display: ClassVar[str] = "AWS SageMaker Domain Settings"
@@ -1327,17 +1335,17 @@ class AwsSagemakerDomainSettings:
         " environment for R), security settings, and resource management policies. "
     )
     mapping: ClassVar[Dict[str, Bender]] = {
-        "security_group_ids": S("SecurityGroupIds", default=[]),
+        "security_group_ids": S("SecurityGroupIds", default=()),
         "r_studio_server_pro_domain_settings": S("RStudioServerProDomainSettings")
         >> Bend(AwsSagemakerRStudioServerProDomainSettings.mapping),
         "execution_role_identity_config": S("ExecutionRoleIdentityConfig"),
     }
-    security_group_ids: List[str] = field(factory=list)
+    security_group_ids: Tuple[str, ...] = field(default=())
     r_studio_server_pro_domain_settings: Optional[AwsSagemakerRStudioServerProDomainSettings] = field(default=None)
     execution_role_identity_config: Optional[str] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerDefaultSpaceSettings:
     kind: ClassVar[str] = "aws_sagemaker_default_space_settings"
     kind_display: ClassVar[str] = "AWS SageMaker Default Space Settings"
@@ -1347,14 +1355,14 @@ class AwsSagemakerDefaultSpaceSettings:
     )
     mapping: ClassVar[Dict[str, Bender]] = {
         "execution_role": S("ExecutionRole"),
-        "security_groups": S("SecurityGroups", default=[]),
+        "security_groups": S("SecurityGroups", default=()),
         "jupyter_server_app_settings": S("JupyterServerAppSettings")
         >> Bend(AwsSagemakerJupyterServerAppSettings.mapping),
         "kernel_gateway_app_settings": S("KernelGatewayAppSettings")
         >> Bend(AwsSagemakerKernelGatewayAppSettings.mapping),
     }
     execution_role: Optional[str] = field(default=None)
-    security_groups: List[str] = field(factory=list)
+    security_groups: Tuple[str, ...] = field(default=())
     jupyter_server_app_settings: Optional[AwsSagemakerJupyterServerAppSettings] = field(default=None)
     kernel_gateway_app_settings: Optional[AwsSagemakerKernelGatewayAppSettings] = field(default=None)
 
@@ -1390,13 +1398,13 @@ class AwsSagemakerDomain(AwsResource):
         "arn": S("DomainArn"),
         "domain_home_efs_file_system_id": S("HomeEfsFileSystemId"),
         "domain_single_sign_on_managed_application_instance_id": S("SingleSignOnManagedApplicationInstanceId"),
-        "domain_status": S("Status"),
+        "domain_status": S("Status") >> Intern(),
         "domain_failure_reason": S("FailureReason"),
-        "domain_auth_mode": S("AuthMode"),
+        "domain_auth_mode": S("AuthMode") >> Intern(),
         "domain_default_user_settings": S("DefaultUserSettings") >> Bend(AwsSagemakerUserSettings.mapping),
-        "domain_app_network_access_type": S("AppNetworkAccessType"),
+        "domain_app_network_access_type": S("AppNetworkAccessType") >> Intern(),
         "domain_home_efs_file_system_kms_key_id": S("HomeEfsFileSystemKmsKeyId"),
-        "domain_subnet_ids": S("SubnetIds", default=[]),
+        "domain_subnet_ids": S("SubnetIds", default=()),
         "domain_url": S("Url"),
         "domain_vpc_id": S("VpcId"),
         "domain_kms_key_id": S("KmsKeyId"),
@@ -1413,7 +1421,7 @@ class AwsSagemakerDomain(AwsResource):
     domain_default_user_settings: Optional[AwsSagemakerUserSettings] = field(default=None)
     domain_app_network_access_type: Optional[str] = field(default=None)
     domain_home_efs_file_system_kms_key_id: Optional[str] = field(default=None)
-    domain_subnet_ids: List[str] = field(factory=list)
+    domain_subnet_ids: Tuple[str, ...] = field(default=())
     domain_url: Optional[str] = field(default=None)
     domain_vpc_id: Optional[str] = field(default=None)
     domain_kms_key_id: Optional[str] = field(default=None)
@@ -1545,7 +1553,7 @@ class AwsSagemakerDomain(AwsResource):
         return super().called_mutator_apis() + [AwsApiSpec(service_name, "delete-domain")]
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerExperimentSource:
     kind: ClassVar[str] = "aws_sagemaker_experiment_source"
     kind_display: ClassVar[str] = "AWS SageMaker Experiment Source"
@@ -1591,7 +1599,7 @@ class AwsSagemakerExperiment(AwsResource):
         return super().called_mutator_apis() + [AwsApiSpec(service_name, "delete-experiment")]
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerTrialSource:
     kind: ClassVar[str] = "aws_sagemaker_trial_source"
     kind_display: ClassVar[str] = "AWS SageMaker Trial Source"
@@ -1604,7 +1612,7 @@ class AwsSagemakerTrialSource:
     source_type: Optional[str] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerUserContext:
     kind: ClassVar[str] = "aws_sagemaker_user_context"
     kind_display: ClassVar[str] = "AWS SageMaker User Context"
@@ -1622,7 +1630,7 @@ class AwsSagemakerUserContext:
     domain_id: Optional[str] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerMetadataProperties:
     kind: ClassVar[str] = "aws_sagemaker_metadata_properties"
     kind_display: ClassVar[str] = "AWS SageMaker Metadata Properties"
@@ -1738,7 +1746,7 @@ class AwsSagemakerProject(AwsResource):
         "ctime": S("CreationTime"),
         "project_description": S("ProjectDescription"),
         "arn": S("ProjectArn"),
-        "project_status": S("ProjectStatus"),
+        "project_status": S("ProjectStatus") >> Intern(),
     }
     project_description: Optional[str] = field(default=None)
     arn: Optional[str] = field(default=None)
@@ -1753,7 +1761,7 @@ class AwsSagemakerProject(AwsResource):
         return super().called_mutator_apis() + [AwsApiSpec(service_name, "delete-project")]
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerGitConfig:
     kind: ClassVar[str] = "aws_sagemaker_git_config"
     kind_display: ClassVar[str] = "AWS SageMaker Git Config"
@@ -1806,7 +1814,7 @@ class AwsSagemakerCodeRepository(AwsResource):
         return super().called_mutator_apis() + [AwsApiSpec(service_name, "delete-code-repository")]
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerDeployedImage:
     kind: ClassVar[str] = "aws_sagemaker_deployed_image"
     kind_display: ClassVar[str] = "AWS SageMaker Deployed Image"
@@ -1823,7 +1831,7 @@ class AwsSagemakerDeployedImage:
     resolution_time: Optional[datetime] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerProductionVariantStatus:
     kind: ClassVar[str] = "aws_sagemaker_production_variant_status"
     kind_display: ClassVar[str] = "AWS SageMaker Production Variant Status"
@@ -1833,7 +1841,7 @@ class AwsSagemakerProductionVariantStatus:
         " developers to build, train, and deploy machine learning models at scale."
     )
     mapping: ClassVar[Dict[str, Bender]] = {
-        "status": S("Status"),
+        "status": S("Status") >> Intern(),
         "status_message": S("StatusMessage"),
         "start_time": S("StartTime"),
     }
@@ -1842,7 +1850,7 @@ class AwsSagemakerProductionVariantStatus:
     start_time: Optional[datetime] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerProductionVariantServerlessConfig:
     kind: ClassVar[str] = "aws_sagemaker_production_variant_serverless_config"
     kind_display: ClassVar[str] = "AWS SageMaker Production Variant Serverless Config"
@@ -1859,7 +1867,7 @@ class AwsSagemakerProductionVariantServerlessConfig:
     max_concurrency: Optional[int] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerProductionVariantSummary:
     kind: ClassVar[str] = "aws_sagemaker_production_variant_summary"
     kind_display: ClassVar[str] = "AWS SageMaker Production Variant Summary"
@@ -1870,29 +1878,29 @@ class AwsSagemakerProductionVariantSummary:
     )
     mapping: ClassVar[Dict[str, Bender]] = {
         "variant_name": S("VariantName"),
-        "deployed_images": S("DeployedImages", default=[]) >> ForallBend(AwsSagemakerDeployedImage.mapping),
+        "deployed_images": S("DeployedImages", default=()) >> ForallBend(AwsSagemakerDeployedImage.mapping),
         "current_weight": S("CurrentWeight"),
         "desired_weight": S("DesiredWeight"),
         "current_instance_count": S("CurrentInstanceCount"),
         "desired_instance_count": S("DesiredInstanceCount"),
-        "variant_status": S("VariantStatus", default=[]) >> ForallBend(AwsSagemakerProductionVariantStatus.mapping),
+        "variant_status": S("VariantStatus", default=()) >> ForallBend(AwsSagemakerProductionVariantStatus.mapping),
         "current_serverless_config": S("CurrentServerlessConfig")
         >> Bend(AwsSagemakerProductionVariantServerlessConfig.mapping),
         "desired_serverless_config": S("DesiredServerlessConfig")
         >> Bend(AwsSagemakerProductionVariantServerlessConfig.mapping),
     }
     variant_name: Optional[str] = field(default=None)
-    deployed_images: List[AwsSagemakerDeployedImage] = field(factory=list)
+    deployed_images: Tuple[AwsSagemakerDeployedImage, ...] = field(default=())
     current_weight: Optional[float] = field(default=None)
     desired_weight: Optional[float] = field(default=None)
     current_instance_count: Optional[int] = field(default=None)
     desired_instance_count: Optional[int] = field(default=None)
-    variant_status: List[AwsSagemakerProductionVariantStatus] = field(factory=list)
+    variant_status: Tuple[AwsSagemakerProductionVariantStatus, ...] = field(default=())
     current_serverless_config: Optional[AwsSagemakerProductionVariantServerlessConfig] = field(default=None)
     desired_serverless_config: Optional[AwsSagemakerProductionVariantServerlessConfig] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerDataCaptureConfigSummary:
     kind: ClassVar[str] = "aws_sagemaker_data_capture_config_summary"
     kind_display: ClassVar[str] = "AWS SageMaker Data Capture Config Summary"
@@ -1904,7 +1912,7 @@ class AwsSagemakerDataCaptureConfigSummary:
     )
     mapping: ClassVar[Dict[str, Bender]] = {
         "enable_capture": S("EnableCapture"),
-        "capture_status": S("CaptureStatus"),
+        "capture_status": S("CaptureStatus") >> Intern(),
         "current_sampling_percentage": S("CurrentSamplingPercentage"),
         "destination_s3_uri": S("DestinationS3Uri"),
         "kms_key_id": S("KmsKeyId"),
@@ -1916,7 +1924,7 @@ class AwsSagemakerDataCaptureConfigSummary:
     kms_key_id: Optional[str] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerCapacitySize:
     kind: ClassVar[str] = "aws_sagemaker_capacity_size"
     kind_display: ClassVar[str] = "AWS SageMaker Capacity Size"
@@ -1931,7 +1939,7 @@ class AwsSagemakerCapacitySize:
     value: Optional[int] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerTrafficRoutingConfig:
     kind: ClassVar[str] = "aws_sagemaker_traffic_routing_config"
     kind_display: ClassVar[str] = "AWS SageMaker Traffic Routing Config"
@@ -1952,7 +1960,7 @@ class AwsSagemakerTrafficRoutingConfig:
     linear_step_size: Optional[AwsSagemakerCapacitySize] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerBlueGreenUpdatePolicy:
     kind: ClassVar[str] = "aws_sagemaker_blue_green_update_policy"
     kind_display: ClassVar[str] = "AWS SageMaker Blue-Green Update Policy"
@@ -1972,7 +1980,7 @@ class AwsSagemakerBlueGreenUpdatePolicy:
     maximum_execution_timeout_in_seconds: Optional[int] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerAutoRollbackConfig:
     kind: ClassVar[str] = "aws_sagemaker_auto_rollback_config"
     kind_display: ClassVar[str] = "AWS SageMaker Auto Rollback Configuration"
@@ -1980,11 +1988,11 @@ class AwsSagemakerAutoRollbackConfig:
         "The AWS SageMaker Auto Rollback Configuration automatically reverts"
         " a deployment if specified alarms are triggered."
     )
-    mapping: ClassVar[Dict[str, Bender]] = {"alarms": S("Alarms", default=[]) >> ForallBend(S("AlarmName"))}
-    alarms: List[str] = field(factory=list)
+    mapping: ClassVar[Dict[str, Bender]] = {"alarms": S("Alarms", default=()) >> ForallBend(S("AlarmName"))}
+    alarms: Tuple[str, ...] = field(default=())
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerDeploymentConfig:
     kind: ClassVar[str] = "aws_sagemaker_deployment_config"
     kind_display: ClassVar[str] = "AWS SageMaker Deployment Configuration"
@@ -2000,7 +2008,7 @@ class AwsSagemakerDeploymentConfig:
     auto_rollback_configuration: Optional[AwsSagemakerAutoRollbackConfig] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerAsyncInferenceNotificationConfig:
     kind: ClassVar[str] = "aws_sagemaker_async_inference_notification_config"
     kind_display: ClassVar[str] = "AWS SageMaker Async Inference Notification Config"
@@ -2014,7 +2022,7 @@ class AwsSagemakerAsyncInferenceNotificationConfig:
     error_topic: Optional[str] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerAsyncInferenceOutputConfig:
     kind: ClassVar[str] = "aws_sagemaker_async_inference_output_config"
     kind_display: ClassVar[str] = "AWS SageMaker Async Inference Output Config"
@@ -2033,7 +2041,7 @@ class AwsSagemakerAsyncInferenceOutputConfig:
     notification_config: Optional[AwsSagemakerAsyncInferenceNotificationConfig] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerAsyncInferenceConfig:
     kind: ClassVar[str] = "aws_sagemaker_async_inference_config"
     kind_display: ClassVar[str] = "AWS Sagemaker Async Inference Config"
@@ -2050,7 +2058,7 @@ class AwsSagemakerAsyncInferenceConfig:
     output_config: Optional[AwsSagemakerAsyncInferenceOutputConfig] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerPendingProductionVariantSummary:
     kind: ClassVar[str] = "aws_sagemaker_pending_production_variant_summary"
     kind_display: ClassVar[str] = "AWS SageMaker Pending Production Variant Summary"
@@ -2061,33 +2069,33 @@ class AwsSagemakerPendingProductionVariantSummary:
     )
     mapping: ClassVar[Dict[str, Bender]] = {
         "variant_name": S("VariantName"),
-        "deployed_images": S("DeployedImages", default=[]) >> ForallBend(AwsSagemakerDeployedImage.mapping),
+        "deployed_images": S("DeployedImages", default=()) >> ForallBend(AwsSagemakerDeployedImage.mapping),
         "current_weight": S("CurrentWeight"),
         "desired_weight": S("DesiredWeight"),
         "current_instance_count": S("CurrentInstanceCount"),
         "desired_instance_count": S("DesiredInstanceCount"),
-        "instance_type": S("InstanceType"),
-        "accelerator_type": S("AcceleratorType"),
-        "variant_status": S("VariantStatus", default=[]) >> ForallBend(AwsSagemakerProductionVariantStatus.mapping),
+        "instance_type": S("InstanceType") >> Intern(),
+        "accelerator_type": S("AcceleratorType") >> Intern(),
+        "variant_status": S("VariantStatus", default=()) >> ForallBend(AwsSagemakerProductionVariantStatus.mapping),
         "current_serverless_config": S("CurrentServerlessConfig")
         >> Bend(AwsSagemakerProductionVariantServerlessConfig.mapping),
         "desired_serverless_config": S("DesiredServerlessConfig")
         >> Bend(AwsSagemakerProductionVariantServerlessConfig.mapping),
     }
     variant_name: Optional[str] = field(default=None)
-    deployed_images: List[AwsSagemakerDeployedImage] = field(factory=list)
+    deployed_images: Tuple[AwsSagemakerDeployedImage, ...] = field(default=())
     current_weight: Optional[float] = field(default=None)
     desired_weight: Optional[float] = field(default=None)
     current_instance_count: Optional[int] = field(default=None)
     desired_instance_count: Optional[int] = field(default=None)
     instance_type: Optional[str] = field(default=None)
     accelerator_type: Optional[str] = field(default=None)
-    variant_status: List[AwsSagemakerProductionVariantStatus] = field(factory=list)
+    variant_status: Tuple[AwsSagemakerProductionVariantStatus, ...] = field(default=())
     current_serverless_config: Optional[AwsSagemakerProductionVariantServerlessConfig] = field(default=None)
     desired_serverless_config: Optional[AwsSagemakerProductionVariantServerlessConfig] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerPendingDeploymentSummary:
     kind: ClassVar[str] = "aws_sagemaker_pending_deployment_summary"
     kind_display: ClassVar[str] = "AWS SageMaker Pending Deployment Summary"
@@ -2098,16 +2106,16 @@ class AwsSagemakerPendingDeploymentSummary:
     )
     mapping: ClassVar[Dict[str, Bender]] = {
         "endpoint_config_name": S("EndpointConfigName"),
-        "production_variants": S("ProductionVariants", default=[])
+        "production_variants": S("ProductionVariants", default=())
         >> ForallBend(AwsSagemakerPendingProductionVariantSummary.mapping),
         "start_time": S("StartTime"),
     }
     endpoint_config_name: Optional[str] = field(default=None)
-    production_variants: List[AwsSagemakerPendingProductionVariantSummary] = field(factory=list)
+    production_variants: Tuple[AwsSagemakerPendingProductionVariantSummary, ...] = field(default=())
     start_time: Optional[datetime] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerClarifyInferenceConfig:
     kind: ClassVar[str] = "aws_sagemaker_clarify_inference_config"
     kind_display: ClassVar[str] = "AWS SageMaker Clarify Inference Config"
@@ -2125,9 +2133,9 @@ class AwsSagemakerClarifyInferenceConfig:
         "label_index": S("LabelIndex"),
         "probability_attribute": S("ProbabilityAttribute"),
         "label_attribute": S("LabelAttribute"),
-        "label_headers": S("LabelHeaders", default=[]),
-        "feature_headers": S("FeatureHeaders", default=[]),
-        "feature_types": S("FeatureTypes", default=[]),
+        "label_headers": S("LabelHeaders", default=()),
+        "feature_headers": S("FeatureHeaders", default=()),
+        "feature_types": S("FeatureTypes", default=()),
     }
     features_attribute: Optional[str] = field(default=None)
     content_template: Optional[str] = field(default=None)
@@ -2137,12 +2145,12 @@ class AwsSagemakerClarifyInferenceConfig:
     label_index: Optional[int] = field(default=None)
     probability_attribute: Optional[str] = field(default=None)
     label_attribute: Optional[str] = field(default=None)
-    label_headers: List[str] = field(factory=list)
-    feature_headers: List[str] = field(factory=list)
-    feature_types: List[str] = field(factory=list)
+    label_headers: Tuple[str, ...] = field(default=())
+    feature_headers: Tuple[str, ...] = field(default=())
+    feature_types: Tuple[str, ...] = field(default=())
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerClarifyShapBaselineConfig:
     kind: ClassVar[str] = "aws_sagemaker_clarify_shap_baseline_config"
     kind_display: ClassVar[str] = "AWS SageMaker Clarify SHAP Baseline Config"
@@ -2154,7 +2162,7 @@ class AwsSagemakerClarifyShapBaselineConfig:
         " model behavior."
     )
     mapping: ClassVar[Dict[str, Bender]] = {
-        "mime_type": S("MimeType"),
+        "mime_type": S("MimeType") >> Intern(),
         "shap_baseline": S("ShapBaseline"),
         "shap_baseline_uri": S("ShapBaselineUri"),
     }
@@ -2163,7 +2171,7 @@ class AwsSagemakerClarifyShapBaselineConfig:
     shap_baseline_uri: Optional[str] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerClarifyTextConfig:
     kind: ClassVar[str] = "aws_sagemaker_clarify_text_config"
     kind_display: ClassVar[str] = "AWS SageMaker Clarify Text Config"
@@ -2177,7 +2185,7 @@ class AwsSagemakerClarifyTextConfig:
     granularity: Optional[str] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerClarifyShapConfig:
     kind: ClassVar[str] = "aws_sagemaker_clarify_shap_config"
     kind_display: ClassVar[str] = "AWS SageMaker Clarify SHAP Config"
@@ -2200,7 +2208,7 @@ class AwsSagemakerClarifyShapConfig:
     text_config: Optional[AwsSagemakerClarifyTextConfig] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerClarifyExplainerConfig:
     kind: ClassVar[str] = "aws_sagemaker_clarify_explainer_config"
     kind_display: ClassVar[str] = "AWS SageMaker Clarify Explainer Config"
@@ -2219,7 +2227,7 @@ class AwsSagemakerClarifyExplainerConfig:
     shap_config: Optional[AwsSagemakerClarifyShapConfig] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerExplainerConfig:
     kind: ClassVar[str] = "aws_sagemaker_explainer_config"
     kind_display: ClassVar[str] = "AWS Sagemaker Explainer Config"
@@ -2259,10 +2267,10 @@ class AwsSagemakerEndpoint(SagemakerTaggable, AwsResource):
         "mtime": S("LastModifiedTime"),
         "arn": S("EndpointArn"),
         "endpoint_config_name": S("EndpointConfigName"),
-        "endpoint_production_variants": S("ProductionVariants", default=[])
+        "endpoint_production_variants": S("ProductionVariants", default=())
         >> ForallBend(AwsSagemakerProductionVariantSummary.mapping),
         "endpoint_data_capture_config": S("DataCaptureConfig") >> Bend(AwsSagemakerDataCaptureConfigSummary.mapping),
-        "endpoint_status": S("EndpointStatus"),
+        "endpoint_status": S("EndpointStatus") >> Intern(),
         "endpoint_failure_reason": S("FailureReason"),
         "endpoint_last_deployment_config": S("LastDeploymentConfig") >> Bend(AwsSagemakerDeploymentConfig.mapping),
         "endpoint_async_inference_config": S("AsyncInferenceConfig") >> Bend(AwsSagemakerAsyncInferenceConfig.mapping),
@@ -2271,7 +2279,7 @@ class AwsSagemakerEndpoint(SagemakerTaggable, AwsResource):
         "endpoint_explainer_config": S("ExplainerConfig") >> Bend(AwsSagemakerExplainerConfig.mapping),
     }
     endpoint_config_name: Optional[str] = field(default=None)
-    endpoint_production_variants: List[AwsSagemakerProductionVariantSummary] = field(factory=list)
+    endpoint_production_variants: Tuple[AwsSagemakerProductionVariantSummary, ...] = field(default=())
     endpoint_data_capture_config: Optional[AwsSagemakerDataCaptureConfigSummary] = field(default=None)
     endpoint_status: Optional[str] = field(default=None)
     endpoint_failure_reason: Optional[str] = field(default=None)
@@ -2359,7 +2367,7 @@ class AwsSagemakerImage(AwsResource):
         "image_description": S("Description"),
         "image_display_name": S("DisplayName"),
         "image_failure_reason": S("FailureReason"),
-        "image_image_status": S("ImageStatus"),
+        "image_image_status": S("ImageStatus") >> Intern(),
     }
     image_description: Optional[str] = field(default=None)
     image_display_name: Optional[str] = field(default=None)
@@ -2395,7 +2403,7 @@ class AwsSagemakerImage(AwsResource):
         return super().called_mutator_apis() + [AwsApiSpec(service_name, "delete-image")]
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerArtifactSourceType:
     kind: ClassVar[str] = "aws_sagemaker_artifact_source_type"
     kind_display: ClassVar[str] = "AWS SageMaker Artifact Source Type"
@@ -2408,7 +2416,7 @@ class AwsSagemakerArtifactSourceType:
     value: Optional[str] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerArtifactSource:
     kind: ClassVar[str] = "aws_sagemaker_artifact_source"
     kind_display: ClassVar[str] = "AWS SageMaker Artifact Source"
@@ -2419,10 +2427,10 @@ class AwsSagemakerArtifactSource:
     )
     mapping: ClassVar[Dict[str, Bender]] = {
         "source_uri": S("SourceUri"),
-        "source_types": S("SourceTypes", default=[]) >> ForallBend(AwsSagemakerArtifactSourceType.mapping),
+        "source_types": S("SourceTypes", default=()) >> ForallBend(AwsSagemakerArtifactSourceType.mapping),
     }
     source_uri: Optional[str] = field(default=None)
-    source_types: List[AwsSagemakerArtifactSourceType] = field(factory=list)
+    source_types: Tuple[AwsSagemakerArtifactSourceType, ...] = field(default=())
 
 
 @define(eq=False, slots=False)
@@ -2452,7 +2460,7 @@ class AwsSagemakerArtifact(AwsResource):
         "mtime": S("LastModifiedTime"),
         "arn": S("ArtifactArn"),
         "artifact_source": S("Source") >> Bend(AwsSagemakerArtifactSource.mapping),
-        "artifact_artifact_type": S("ArtifactType"),
+        "artifact_artifact_type": S("ArtifactType") >> Intern(),
         "artifact_properties": S("Properties"),
         "artifact_created_by": S("CreatedBy") >> Bend(AwsSagemakerUserContext.mapping),
         "artifact_last_modified_by": S("LastModifiedBy") >> Bend(AwsSagemakerUserContext.mapping),
@@ -2532,7 +2540,7 @@ class AwsSagemakerUserProfile(AwsResource):
         "ctime": S("CreationTime"),
         "mtime": S("LastModifiedTime"),
         "user_profile_domain_id": S("DomainId"),
-        "user_profile_status": S("Status"),
+        "user_profile_status": S("Status") >> Intern(),
     }
     user_profile_domain_id: Optional[str] = field(default=None)
     user_profile_status: Optional[str] = field(default=None)
@@ -2582,7 +2590,7 @@ class AwsSagemakerPipeline(AwsResource):
         "pipeline_display_name": S("PipelineDisplayName"),
         "pipeline_definition": S("PipelineDefinition"),
         "pipeline_description": S("PipelineDescription"),
-        "pipeline_status": S("PipelineStatus"),
+        "pipeline_status": S("PipelineStatus") >> Intern(),
         "pipeline_created_by": S("CreatedBy") >> Bend(AwsSagemakerUserContext.mapping),
         "pipeline_last_modified_by": S("LastModifiedBy") >> Bend(AwsSagemakerUserContext.mapping),
         "pipeline_parallelism_configuration": S("ParallelismConfiguration", "MaxParallelExecutionSteps"),
@@ -2640,7 +2648,7 @@ class AwsSagemakerPipeline(AwsResource):
         return super().called_mutator_apis() + [AwsApiSpec(service_name, "delete-pipeline")]
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerCognitoMemberDefinition:
     kind: ClassVar[str] = "aws_sagemaker_cognito_member_definition"
     kind_display: ClassVar[str] = "AWS SageMaker Cognito Member Definition"
@@ -2660,7 +2668,7 @@ class AwsSagemakerCognitoMemberDefinition:
     client_id: Optional[str] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerOidcMemberDefinition:
     kind: ClassVar[str] = "aws_sagemaker_oidc_member_definition"
     kind_display: ClassVar[str] = "AWS SageMaker OIDC Member Definition"
@@ -2669,11 +2677,11 @@ class AwsSagemakerOidcMemberDefinition:
         " specifying groups from an OpenID Connect (OIDC) identity provider that are allowed to perform"
         " certain actions or access specific resources within SageMaker."
     )
-    mapping: ClassVar[Dict[str, Bender]] = {"groups": S("Groups", default=[])}
-    groups: List[str] = field(factory=list)
+    mapping: ClassVar[Dict[str, Bender]] = {"groups": S("Groups", default=())}
+    groups: Tuple[str, ...] = field(default=())
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerMemberDefinition:
     kind: ClassVar[str] = "aws_sagemaker_member_definition"
     kind_display: ClassVar[str] = "AWS SageMaker Member Definition"
@@ -2714,17 +2722,17 @@ class AwsSagemakerWorkteam(SagemakerTaggable, AwsResource):
         "ctime": S("CreateDate"),
         "mtime": S("LastUpdatedDate"),
         "arn": S("WorkteamArn"),
-        "workteam_member_definitions": S("MemberDefinitions", default=[])
+        "workteam_member_definitions": S("MemberDefinitions", default=())
         >> ForallBend(AwsSagemakerMemberDefinition.mapping),
         "workteam_workforce_arn": S("WorkforceArn"),
-        "workteam_product_listing_ids": S("ProductListingIds", default=[]),
+        "workteam_product_listing_ids": S("ProductListingIds", default=()),
         "workteam_description": S("Description"),
         "workteam_sub_domain": S("SubDomain"),
         "workteam_notification_configuration": S("NotificationConfiguration", "NotificationTopicArn"),
     }
-    workteam_member_definitions: List[AwsSagemakerMemberDefinition] = field(factory=list)
+    workteam_member_definitions: Tuple[AwsSagemakerMemberDefinition, ...] = field(default=())
     workteam_workforce_arn: Optional[str] = field(default=None)
-    workteam_product_listing_ids: List[str] = field(factory=list)
+    workteam_product_listing_ids: Tuple[str, ...] = field(default=())
     workteam_description: Optional[str] = field(default=None)
     workteam_sub_domain: Optional[str] = field(default=None)
     workteam_notification_configuration: Optional[str] = field(default=None)
@@ -2778,7 +2786,7 @@ class AwsSagemakerJob(AwsResource):
     _aws_metadata: ClassVar[Dict[str, Any]] = {"arn_tpl": "arn:{partition}:sagemaker:{region}:{account}:job/{id}"}  # fmt: skip
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerAutoMLS3DataSource:
     kind: ClassVar[str] = "aws_sagemaker_auto_mls3_data_source"
     kind_display: ClassVar[str] = "AWS SageMaker AutoML S3 Data Source"
@@ -2792,7 +2800,7 @@ class AwsSagemakerAutoMLS3DataSource:
     s3_uri: Optional[str] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerAutoMLDataSource:
     kind: ClassVar[str] = "aws_sagemaker_auto_ml_data_source"
     kind_display: ClassVar[str] = "AWS SageMaker AutoML Data Source"
@@ -2807,7 +2815,7 @@ class AwsSagemakerAutoMLDataSource:
     s3_data_source: Optional[AwsSagemakerAutoMLS3DataSource] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerAutoMLChannel:
     kind: ClassVar[str] = "aws_sagemaker_auto_ml_channel"
     kind_display: ClassVar[str] = "AWS SageMaker AutoML Channel"
@@ -2817,10 +2825,10 @@ class AwsSagemakerAutoMLChannel:
     )
     mapping: ClassVar[Dict[str, Bender]] = {
         "data_source": S("DataSource") >> Bend(AwsSagemakerAutoMLDataSource.mapping),
-        "compression_type": S("CompressionType"),
+        "compression_type": S("CompressionType") >> Intern(),
         "target_attribute_name": S("TargetAttributeName"),
-        "content_type": S("ContentType"),
-        "channel_type": S("ChannelType"),
+        "content_type": S("ContentType") >> Intern(),
+        "channel_type": S("ChannelType") >> Intern(),
     }
     data_source: Optional[AwsSagemakerAutoMLDataSource] = field(default=None)
     compression_type: Optional[str] = field(default=None)
@@ -2829,7 +2837,7 @@ class AwsSagemakerAutoMLChannel:
     channel_type: Optional[str] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerAutoMLOutputDataConfig:
     kind: ClassVar[str] = "aws_sagemaker_auto_ml_output_data_config"
     kind_display: ClassVar[str] = "AWS Sagemaker Auto ML Output Data Config"
@@ -2843,7 +2851,7 @@ class AwsSagemakerAutoMLOutputDataConfig:
     s3_output_path: Optional[str] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerAutoMLJobCompletionCriteria:
     kind: ClassVar[str] = "aws_sagemaker_auto_ml_job_completion_criteria"
     kind_display: ClassVar[str] = "AWS SageMaker AutoML Job Completion Criteria"
@@ -2861,7 +2869,7 @@ class AwsSagemakerAutoMLJobCompletionCriteria:
     max_auto_ml_job_runtime_in_seconds: Optional[int] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerAutoMLSecurityConfig:
     kind: ClassVar[str] = "aws_sagemaker_auto_ml_security_config"
     kind_display: ClassVar[str] = "AWS SageMaker AutoML Security Config"
@@ -2879,7 +2887,7 @@ class AwsSagemakerAutoMLSecurityConfig:
     vpc_config: Optional[AwsSagemakerVpcConfig] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerAutoMLJobConfig:
     kind: ClassVar[str] = "aws_sagemaker_auto_ml_job_config"
     kind_display: ClassVar[str] = "AWS SageMaker Auto ML Job Config"
@@ -2901,7 +2909,7 @@ class AwsSagemakerAutoMLJobConfig:
     mode: Optional[str] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerFinalAutoMLJobObjectiveMetric:
     kind: ClassVar[str] = "aws_sagemaker_final_auto_ml_job_objective_metric"
     kind_display: ClassVar[str] = "AWS SageMaker Final AutoML Job Objective Metric"
@@ -2914,7 +2922,7 @@ class AwsSagemakerFinalAutoMLJobObjectiveMetric:
     value: Optional[float] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerAutoMLCandidateStep:
     kind: ClassVar[str] = "aws_sagemaker_auto_ml_candidate_step"
     kind_display: ClassVar[str] = "AWS SageMaker AutoML Candidate Step"
@@ -2923,7 +2931,7 @@ class AwsSagemakerAutoMLCandidateStep:
         " workflow that represents a candidate model trained by AutoML."
     )
     mapping: ClassVar[Dict[str, Bender]] = {
-        "candidate_step_type": S("CandidateStepType"),
+        "candidate_step_type": S("CandidateStepType") >> Intern(),
         "candidate_step_arn": S("CandidateStepArn"),
         "candidate_step_name": S("CandidateStepName"),
     }
@@ -2932,7 +2940,7 @@ class AwsSagemakerAutoMLCandidateStep:
     candidate_step_name: Optional[str] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerAutoMLContainerDefinition:
     kind: ClassVar[str] = "aws_sagemaker_auto_ml_container_definition"
     kind_display: ClassVar[str] = "AWS SageMaker AutoML Container Definition"
@@ -2951,7 +2959,7 @@ class AwsSagemakerAutoMLContainerDefinition:
     environment: Optional[Dict[str, str]] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerCandidateArtifactLocations:
     kind: ClassVar[str] = "aws_sagemaker_candidate_artifact_locations"
     kind_display: ClassVar[str] = "AWS SageMaker Candidate Artifact Locations"
@@ -2964,7 +2972,7 @@ class AwsSagemakerCandidateArtifactLocations:
     model_insights: Optional[str] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerMetricDatum:
     kind: ClassVar[str] = "aws_sagemaker_metric_datum"
     kind_display: ClassVar[str] = "AWS SageMaker Metric Datum"
@@ -2985,7 +2993,7 @@ class AwsSagemakerMetricDatum:
     standard_metric_name: Optional[str] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerCandidateProperties:
     kind: ClassVar[str] = "aws_sagemaker_candidate_properties"
     kind_display: ClassVar[str] = "AWS SageMaker Candidate Properties"
@@ -2998,13 +3006,13 @@ class AwsSagemakerCandidateProperties:
     mapping: ClassVar[Dict[str, Bender]] = {
         "candidate_artifact_locations": S("CandidateArtifactLocations")
         >> Bend(AwsSagemakerCandidateArtifactLocations.mapping),
-        "candidate_metrics": S("CandidateMetrics", default=[]) >> ForallBend(AwsSagemakerMetricDatum.mapping),
+        "candidate_metrics": S("CandidateMetrics", default=()) >> ForallBend(AwsSagemakerMetricDatum.mapping),
     }
     candidate_artifact_locations: Optional[AwsSagemakerCandidateArtifactLocations] = field(default=None)
-    candidate_metrics: List[AwsSagemakerMetricDatum] = field(factory=list)
+    candidate_metrics: Tuple[AwsSagemakerMetricDatum, ...] = field(default=())
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerAutoMLCandidate:
     kind: ClassVar[str] = "aws_sagemaker_auto_ml_candidate"
     kind_display: ClassVar[str] = "AWS SageMaker AutoML Candidate"
@@ -3017,10 +3025,10 @@ class AwsSagemakerAutoMLCandidate:
         "candidate_name": S("CandidateName"),
         "final_auto_ml_job_objective_metric": S("FinalAutoMLJobObjectiveMetric")
         >> Bend(AwsSagemakerFinalAutoMLJobObjectiveMetric.mapping),
-        "objective_status": S("ObjectiveStatus"),
-        "candidate_steps": S("CandidateSteps", default=[]) >> ForallBend(AwsSagemakerAutoMLCandidateStep.mapping),
-        "candidate_status": S("CandidateStatus"),
-        "inference_containers": S("InferenceContainers", default=[])
+        "objective_status": S("ObjectiveStatus") >> Intern(),
+        "candidate_steps": S("CandidateSteps", default=()) >> ForallBend(AwsSagemakerAutoMLCandidateStep.mapping),
+        "candidate_status": S("CandidateStatus") >> Intern(),
+        "inference_containers": S("InferenceContainers", default=())
         >> ForallBend(AwsSagemakerAutoMLContainerDefinition.mapping),
         "creation_time": S("CreationTime"),
         "end_time": S("EndTime"),
@@ -3031,9 +3039,9 @@ class AwsSagemakerAutoMLCandidate:
     candidate_name: Optional[str] = field(default=None)
     final_auto_ml_job_objective_metric: Optional[AwsSagemakerFinalAutoMLJobObjectiveMetric] = field(default=None)
     objective_status: Optional[str] = field(default=None)
-    candidate_steps: List[AwsSagemakerAutoMLCandidateStep] = field(factory=list)
+    candidate_steps: Tuple[AwsSagemakerAutoMLCandidateStep, ...] = field(default=())
     candidate_status: Optional[str] = field(default=None)
-    inference_containers: List[AwsSagemakerAutoMLContainerDefinition] = field(factory=list)
+    inference_containers: Tuple[AwsSagemakerAutoMLContainerDefinition, ...] = field(default=())
     creation_time: Optional[datetime] = field(default=None)
     end_time: Optional[datetime] = field(default=None)
     last_modified_time: Optional[datetime] = field(default=None)
@@ -3041,7 +3049,7 @@ class AwsSagemakerAutoMLCandidate:
     candidate_properties: Optional[AwsSagemakerCandidateProperties] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerAutoMLJobArtifacts:
     kind: ClassVar[str] = "aws_sagemaker_auto_ml_job_artifacts"
     kind_display: ClassVar[str] = "AWS SageMaker AutoML Job Artifacts"
@@ -3058,7 +3066,7 @@ class AwsSagemakerAutoMLJobArtifacts:
     data_exploration_notebook_location: Optional[str] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerResolvedAttributes:
     kind: ClassVar[str] = "aws_sagemaker_resolved_attributes"
     kind_display: ClassVar[str] = "AWS SageMaker Resolved Attributes"
@@ -3068,7 +3076,7 @@ class AwsSagemakerResolvedAttributes:
     )
     mapping: ClassVar[Dict[str, Bender]] = {
         "auto_ml_job_objective": S("AutoMLJobObjective", "MetricName"),
-        "problem_type": S("ProblemType"),
+        "problem_type": S("ProblemType") >> Intern(),
         "completion_criteria": S("CompletionCriteria") >> Bend(AwsSagemakerAutoMLJobCompletionCriteria.mapping),
     }
     auto_ml_job_objective: Optional[str] = field(default=None)
@@ -3076,7 +3084,7 @@ class AwsSagemakerResolvedAttributes:
     completion_criteria: Optional[AwsSagemakerAutoMLJobCompletionCriteria] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerModelDeployConfig:
     kind: ClassVar[str] = "aws_sagemaker_model_deploy_config"
     kind_display: ClassVar[str] = "AWS SageMaker Model Deploy Config"
@@ -3126,33 +3134,33 @@ class AwsSagemakerAutoMLJob(AwsSagemakerJob):
         "ctime": S("CreationTime"),
         "mtime": S("LastModifiedTime"),
         "arn": S("AutoMLJobArn"),
-        "auto_ml_job_input_data_config": S("InputDataConfig", default=[])
+        "auto_ml_job_input_data_config": S("InputDataConfig", default=())
         >> ForallBend(AwsSagemakerAutoMLChannel.mapping),
         "auto_ml_job_output_data_config": S("OutputDataConfig") >> Bend(AwsSagemakerAutoMLOutputDataConfig.mapping),
         "auto_ml_job_objective": S("AutoMLJobObjective", "MetricName"),
-        "auto_ml_job_problem_type": S("ProblemType"),
+        "auto_ml_job_problem_type": S("ProblemType") >> Intern(),
         "auto_ml_job_config": S("AutoMLJobConfig") >> Bend(AwsSagemakerAutoMLJobConfig.mapping),
         "auto_ml_job_end_time": S("EndTime"),
         "auto_ml_job_failure_reason": S("FailureReason"),
-        "auto_ml_job_partial_failure_reasons": S("PartialFailureReasons", default=[])
+        "auto_ml_job_partial_failure_reasons": S("PartialFailureReasons", default=())
         >> ForallBend(S("PartialFailureMessage")),
         "auto_ml_job_best_candidate": S("BestCandidate") >> Bend(AwsSagemakerAutoMLCandidate.mapping),
-        "auto_ml_job_status": S("AutoMLJobStatus"),
-        "auto_ml_job_secondary_status": S("AutoMLJobSecondaryStatus"),
+        "auto_ml_job_status": S("AutoMLJobStatus") >> Intern(),
+        "auto_ml_job_secondary_status": S("AutoMLJobSecondaryStatus") >> Intern(),
         "auto_ml_job_generate_candidate_definitions_only": S("GenerateCandidateDefinitionsOnly"),
         "auto_ml_job_artifacts": S("AutoMLJobArtifacts") >> Bend(AwsSagemakerAutoMLJobArtifacts.mapping),
         "auto_ml_job_resolved_attributes": S("ResolvedAttributes") >> Bend(AwsSagemakerResolvedAttributes.mapping),
         "auto_ml_job_model_deploy_config": S("ModelDeployConfig") >> Bend(AwsSagemakerModelDeployConfig.mapping),
         "auto_ml_job_model_deploy_result": S("ModelDeployResult", "EndpointName"),
     }
-    auto_ml_job_input_data_config: List[AwsSagemakerAutoMLChannel] = field(factory=list)
+    auto_ml_job_input_data_config: Tuple[AwsSagemakerAutoMLChannel, ...] = field(default=())
     auto_ml_job_output_data_config: Optional[AwsSagemakerAutoMLOutputDataConfig] = field(default=None)
     auto_ml_job_objective: Optional[str] = field(default=None)
     auto_ml_job_problem_type: Optional[str] = field(default=None)
     auto_ml_job_config: Optional[AwsSagemakerAutoMLJobConfig] = field(default=None)
     auto_ml_job_end_time: Optional[datetime] = field(default=None)
     auto_ml_job_failure_reason: Optional[str] = field(default=None)
-    auto_ml_job_partial_failure_reasons: List[str] = field(factory=list)
+    auto_ml_job_partial_failure_reasons: Tuple[str, ...] = field(default=())
     auto_ml_job_best_candidate: Optional[AwsSagemakerAutoMLCandidate] = field(default=None)
     auto_ml_job_status: Optional[str] = field(default=None)
     auto_ml_job_secondary_status: Optional[str] = field(default=None)
@@ -3225,7 +3233,7 @@ class AwsSagemakerAutoMLJob(AwsSagemakerJob):
                         builder.add_edge(self, clazz=AwsSagemakerProcessingJob, arn=step.candidate_step_arn)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerInputConfig:
     kind: ClassVar[str] = "aws_sagemaker_input_config"
     kind_display: ClassVar[str] = "AWS SageMaker Input Config"
@@ -3245,7 +3253,7 @@ class AwsSagemakerInputConfig:
     framework_version: Optional[str] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerTargetPlatform:
     kind: ClassVar[str] = "aws_sagemaker_target_platform"
     kind_display: ClassVar[str] = "AWS SageMaker Target Platform"
@@ -3260,7 +3268,7 @@ class AwsSagemakerTargetPlatform:
     accelerator: Optional[str] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerOutputConfig:
     kind: ClassVar[str] = "aws_sagemaker_output_config"
     kind_display: ClassVar[str] = "AWS SageMaker Output Config"
@@ -3283,7 +3291,7 @@ class AwsSagemakerOutputConfig:
     kms_key_id: Optional[str] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerNeoVpcConfig:
     kind: ClassVar[str] = "aws_sagemaker_neo_vpc_config"
     kind_display: ClassVar[str] = "AWS SageMaker Neo VPC Config"
@@ -3293,11 +3301,11 @@ class AwsSagemakerNeoVpcConfig:
         " hardware platforms."
     )
     mapping: ClassVar[Dict[str, Bender]] = {
-        "security_group_ids": S("SecurityGroupIds", default=[]),
-        "subnets": S("Subnets", default=[]),
+        "security_group_ids": S("SecurityGroupIds", default=()),
+        "subnets": S("Subnets", default=()),
     }
-    security_group_ids: List[str] = field(factory=list)
-    subnets: List[str] = field(factory=list)
+    security_group_ids: Tuple[str, ...] = field(default=())
+    subnets: Tuple[str, ...] = field(default=())
 
 
 @define(eq=False, slots=False)
@@ -3327,7 +3335,7 @@ class AwsSagemakerCompilationJob(AwsSagemakerJob):
         "ctime": S("CreationTime"),
         "mtime": S("LastModifiedTime"),
         "arn": S("CompilationJobArn"),
-        "compilation_job_status": S("CompilationJobStatus"),
+        "compilation_job_status": S("CompilationJobStatus") >> Intern(),
         "compilation_job_start_time": S("CompilationStartTime"),
         "compilation_job_end_time": S("CompilationEndTime"),
         "compilation_job_stopping_condition": S("StoppingCondition") >> Bend(AwsSagemakerStoppingCondition.mapping),
@@ -3395,7 +3403,7 @@ class AwsSagemakerCompilationJob(AwsSagemakerJob):
                 builder.dependant_node(self, reverse=True, delete_same_as_default=True, clazz=AwsEc2Subnet, id=subnet)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerHyperbandStrategyConfig:
     kind: ClassVar[str] = "aws_sagemaker_hyperband_strategy_config"
     kind_display: ClassVar[str] = "AWS SageMaker Hyperband Strategy Config"
@@ -3409,7 +3417,7 @@ class AwsSagemakerHyperbandStrategyConfig:
     max_resource: Optional[int] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerHyperParameterTuningJobStrategyConfig:
     kind: ClassVar[str] = "aws_sagemaker_hyper_parameter_tuning_job_strategy_config"
     kind_display: ClassVar[str] = "AWS Sagemaker Hyper Parameter Tuning Job Strategy Config"
@@ -3424,7 +3432,7 @@ class AwsSagemakerHyperParameterTuningJobStrategyConfig:
     hyperband_strategy_config: Optional[AwsSagemakerHyperbandStrategyConfig] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerResourceLimits:
     kind: ClassVar[str] = "aws_sagemaker_resource_limits"
     kind_display: ClassVar[str] = "AWS SageMaker Resource Limits"
@@ -3441,7 +3449,7 @@ class AwsSagemakerResourceLimits:
     max_parallel_training_jobs: Optional[int] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerScalingParameterRange:
     kind: ClassVar[str] = "aws_sagemaker_scaling_parameter_range"
     kind_display: ClassVar[str] = "AWS SageMaker Scaling Parameter Range"
@@ -3454,7 +3462,7 @@ class AwsSagemakerScalingParameterRange:
         "name": S("Name"),
         "min_value": S("MinValue"),
         "max_value": S("MaxValue"),
-        "scaling_type": S("ScalingType"),
+        "scaling_type": S("ScalingType") >> Intern(),
     }
     name: Optional[str] = field(default=None)
     min_value: Optional[str] = field(default=None)
@@ -3462,7 +3470,7 @@ class AwsSagemakerScalingParameterRange:
     scaling_type: Optional[str] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerCategoricalParameterRange:
     kind: ClassVar[str] = "aws_sagemaker_categorical_parameter_range"
     kind_display: ClassVar[str] = "AWS SageMaker Categorical Parameter Range"
@@ -3472,12 +3480,12 @@ class AwsSagemakerCategoricalParameterRange:
         " machine learning models developed using Amazon SageMaker, which is a fully"
         " managed machine learning service."
     )
-    mapping: ClassVar[Dict[str, Bender]] = {"name": S("Name"), "values": S("Values", default=[])}
+    mapping: ClassVar[Dict[str, Bender]] = {"name": S("Name"), "values": S("Values", default=())}
     name: Optional[str] = field(default=None)
-    values: List[str] = field(factory=list)
+    values: Tuple[str, ...] = field(default=())
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerParameterRanges:
     kind: ClassVar[str] = "aws_sagemaker_parameter_ranges"
     kind_display: ClassVar[str] = "AWS SageMaker Parameter Ranges"
@@ -3486,19 +3494,19 @@ class AwsSagemakerParameterRanges:
         " hyperparameters used in training machine learning models with AWS SageMaker."
     )
     mapping: ClassVar[Dict[str, Bender]] = {
-        "integer_parameter_ranges": S("IntegerParameterRanges", default=[])
+        "integer_parameter_ranges": S("IntegerParameterRanges", default=())
         >> ForallBend(AwsSagemakerScalingParameterRange.mapping),
-        "continuous_parameter_ranges": S("ContinuousParameterRanges", default=[])
+        "continuous_parameter_ranges": S("ContinuousParameterRanges", default=())
         >> ForallBend(AwsSagemakerScalingParameterRange.mapping),
-        "categorical_parameter_ranges": S("CategoricalParameterRanges", default=[])
+        "categorical_parameter_ranges": S("CategoricalParameterRanges", default=())
         >> ForallBend(AwsSagemakerCategoricalParameterRange.mapping),
     }
-    integer_parameter_ranges: List[AwsSagemakerScalingParameterRange] = field(factory=list)
-    continuous_parameter_ranges: List[AwsSagemakerScalingParameterRange] = field(factory=list)
-    categorical_parameter_ranges: List[AwsSagemakerCategoricalParameterRange] = field(factory=list)
+    integer_parameter_ranges: Tuple[AwsSagemakerScalingParameterRange, ...] = field(default=())
+    continuous_parameter_ranges: Tuple[AwsSagemakerScalingParameterRange, ...] = field(default=())
+    categorical_parameter_ranges: Tuple[AwsSagemakerCategoricalParameterRange, ...] = field(default=())
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerHyperParameterTuningJobConfig:
     kind: ClassVar[str] = "aws_sagemaker_hyper_parameter_tuning_job_config"
     kind_display: ClassVar[str] = "AWS SageMaker Hyper Parameter Tuning Job Config"
@@ -3514,7 +3522,7 @@ class AwsSagemakerHyperParameterTuningJobConfig:
         >> Bend(AwsSagemakerHyperParameterTuningJobObjective.mapping),
         "resource_limits": S("ResourceLimits") >> Bend(AwsSagemakerResourceLimits.mapping),
         "parameter_ranges": S("ParameterRanges") >> Bend(AwsSagemakerParameterRanges.mapping),
-        "training_job_early_stopping_type": S("TrainingJobEarlyStoppingType"),
+        "training_job_early_stopping_type": S("TrainingJobEarlyStoppingType") >> Intern(),
         "tuning_job_completion_criteria": S("TuningJobCompletionCriteria", "TargetObjectiveMetricValue"),
     }
     strategy: Optional[str] = field(default=None)
@@ -3526,7 +3534,7 @@ class AwsSagemakerHyperParameterTuningJobConfig:
     tuning_job_completion_criteria: Optional[float] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerHyperParameterAlgorithmSpecification:
     kind: ClassVar[str] = "aws_sagemaker_hyper_parameter_algorithm_specification"
     kind_display: ClassVar[str] = "AWS SageMaker Hyper Parameter Algorithm Specification"
@@ -3537,17 +3545,17 @@ class AwsSagemakerHyperParameterAlgorithmSpecification:
     )
     mapping: ClassVar[Dict[str, Bender]] = {
         "training_image": S("TrainingImage"),
-        "training_input_mode": S("TrainingInputMode"),
+        "training_input_mode": S("TrainingInputMode") >> Intern(),
         "algorithm_name": S("AlgorithmName"),
-        "metric_definitions": S("MetricDefinitions", default=[]) >> ForallBend(AwsSagemakerMetricDefinition.mapping),
+        "metric_definitions": S("MetricDefinitions", default=()) >> ForallBend(AwsSagemakerMetricDefinition.mapping),
     }
     training_image: Optional[str] = field(default=None)
     training_input_mode: Optional[str] = field(default=None)
     algorithm_name: Optional[str] = field(default=None)
-    metric_definitions: List[AwsSagemakerMetricDefinition] = field(factory=list)
+    metric_definitions: Tuple[AwsSagemakerMetricDefinition, ...] = field(default=())
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerCheckpointConfig:
     kind: ClassVar[str] = "aws_sagemaker_checkpoint_config"
     kind_display: ClassVar[str] = "AWS SageMaker Checkpoint Config"
@@ -3562,7 +3570,7 @@ class AwsSagemakerCheckpointConfig:
     local_path: Optional[str] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerHyperParameterTuningInstanceConfig:
     kind: ClassVar[str] = "aws_sagemaker_hyper_parameter_tuning_instance_config"
     kind_display: ClassVar[str] = "AWS SageMaker HyperParameter Tuning Instance Configuration"
@@ -3572,7 +3580,7 @@ class AwsSagemakerHyperParameterTuningInstanceConfig:
         " hyperparameter tuning of machine learning models."
     )
     mapping: ClassVar[Dict[str, Bender]] = {
-        "instance_type": S("InstanceType"),
+        "instance_type": S("InstanceType") >> Intern(),
         "instance_count": S("InstanceCount"),
         "volume_size_in_gb": S("VolumeSizeInGB"),
     }
@@ -3581,7 +3589,7 @@ class AwsSagemakerHyperParameterTuningInstanceConfig:
     volume_size_in_gb: Optional[int] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerHyperParameterTuningResourceConfig:
     kind: ClassVar[str] = "aws_sagemaker_hyper_parameter_tuning_resource_config"
     kind_display: ClassVar[str] = "AWS SageMaker Hyper Parameter Tuning Resource Config"
@@ -3591,12 +3599,12 @@ class AwsSagemakerHyperParameterTuningResourceConfig:
         " platform."
     )
     mapping: ClassVar[Dict[str, Bender]] = {
-        "instance_type": S("InstanceType"),
+        "instance_type": S("InstanceType") >> Intern(),
         "instance_count": S("InstanceCount"),
         "volume_size_in_gb": S("VolumeSizeInGB"),
         "volume_kms_key_id": S("VolumeKmsKeyId"),
         "allocation_strategy": S("AllocationStrategy"),
-        "instance_configs": S("InstanceConfigs", default=[])
+        "instance_configs": S("InstanceConfigs", default=())
         >> ForallBend(AwsSagemakerHyperParameterTuningInstanceConfig.mapping),
     }
     instance_type: Optional[str] = field(default=None)
@@ -3604,10 +3612,10 @@ class AwsSagemakerHyperParameterTuningResourceConfig:
     volume_size_in_gb: Optional[int] = field(default=None)
     volume_kms_key_id: Optional[str] = field(default=None)
     allocation_strategy: Optional[str] = field(default=None)
-    instance_configs: List[AwsSagemakerHyperParameterTuningInstanceConfig] = field(factory=list)
+    instance_configs: Tuple[AwsSagemakerHyperParameterTuningInstanceConfig, ...] = field(default=())
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerHyperParameterTrainingJobDefinition:
     kind: ClassVar[str] = "aws_sagemaker_hyper_parameter_training_job_definition"
     kind_display: ClassVar[str] = "AWS SageMaker Hyperparameter Training Job Definition"
@@ -3625,7 +3633,7 @@ class AwsSagemakerHyperParameterTrainingJobDefinition:
         "algorithm_specification": S("AlgorithmSpecification")
         >> Bend(AwsSagemakerHyperParameterAlgorithmSpecification.mapping),
         "role_arn": S("RoleArn"),
-        "input_data_config": S("InputDataConfig", default=[]) >> ForallBend(AwsSagemakerChannel.mapping),
+        "input_data_config": S("InputDataConfig", default=()) >> ForallBend(AwsSagemakerChannel.mapping),
         "vpc_config": S("VpcConfig") >> Bend(AwsSagemakerVpcConfig.mapping),
         "output_data_config": S("OutputDataConfig") >> Bend(AwsSagemakerOutputDataConfig.mapping),
         "resource_config": S("ResourceConfig") >> Bend(AwsSagemakerResourceConfig.mapping),
@@ -3644,7 +3652,7 @@ class AwsSagemakerHyperParameterTrainingJobDefinition:
     static_hyper_parameters: Optional[Dict[str, str]] = field(default=None)
     algorithm_specification: Optional[AwsSagemakerHyperParameterAlgorithmSpecification] = field(default=None)
     role_arn: Optional[str] = field(default=None)
-    input_data_config: List[AwsSagemakerChannel] = field(factory=list)
+    input_data_config: Tuple[AwsSagemakerChannel, ...] = field(default=())
     vpc_config: Optional[AwsSagemakerVpcConfig] = field(default=None)
     output_data_config: Optional[AwsSagemakerOutputDataConfig] = field(default=None)
     resource_config: Optional[AwsSagemakerResourceConfig] = field(default=None)
@@ -3659,7 +3667,7 @@ class AwsSagemakerHyperParameterTrainingJobDefinition:
     )
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerTrainingJobStatusCounters:
     kind: ClassVar[str] = "aws_sagemaker_training_job_status_counters"
     kind_display: ClassVar[str] = "AWS SageMaker Training Job Status Counters"
@@ -3682,7 +3690,7 @@ class AwsSagemakerTrainingJobStatusCounters:
     stopped: Optional[int] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerObjectiveStatusCounters:
     kind: ClassVar[str] = "aws_sagemaker_objective_status_counters"
     kind_display: ClassVar[str] = "AWS SageMaker Objective Status Counters"
@@ -3696,7 +3704,7 @@ class AwsSagemakerObjectiveStatusCounters:
     failed: Optional[int] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerFinalHyperParameterTuningJobObjectiveMetric:
     kind: ClassVar[str] = "aws_sagemaker_final_hyper_parameter_tuning_job_objective_metric"
     kind_display: ClassVar[str] = "AWS SageMaker Final Hyper Parameter Tuning Job Objective Metric"
@@ -3713,7 +3721,7 @@ class AwsSagemakerFinalHyperParameterTuningJobObjectiveMetric:
     value: Optional[float] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerHyperParameterTrainingJobSummary:
     kind: ClassVar[str] = "aws_sagemaker_hyper_parameter_training_job_summary"
     kind_display: ClassVar[str] = "AWS SageMaker Hyper Parameter Training Job Summary"
@@ -3730,12 +3738,12 @@ class AwsSagemakerHyperParameterTrainingJobSummary:
         "creation_time": S("CreationTime"),
         "training_start_time": S("TrainingStartTime"),
         "training_end_time": S("TrainingEndTime"),
-        "training_job_status": S("TrainingJobStatus"),
+        "training_job_status": S("TrainingJobStatus") >> Intern(),
         "tuned_hyper_parameters": S("TunedHyperParameters"),
         "failure_reason": S("FailureReason"),
         "final_hyper_parameter_tuning_job_objective_metric": S("FinalHyperParameterTuningJobObjectiveMetric")
         >> Bend(AwsSagemakerFinalHyperParameterTuningJobObjectiveMetric.mapping),
-        "objective_status": S("ObjectiveStatus"),
+        "objective_status": S("ObjectiveStatus") >> Intern(),
     }
     training_job_definition_name: Optional[str] = field(default=None)
     training_job_name: Optional[str] = field(default=None)
@@ -3753,7 +3761,7 @@ class AwsSagemakerHyperParameterTrainingJobSummary:
     objective_status: Optional[str] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerHyperParameterTuningJobWarmStartConfig:
     kind: ClassVar[str] = "aws_sagemaker_hyper_parameter_tuning_job_warm_start_config"
     kind_display: ClassVar[str] = "AWS SageMaker Hyperparameter Tuning Job Warm Start Config"
@@ -3763,11 +3771,11 @@ class AwsSagemakerHyperParameterTuningJobWarmStartConfig:
         " optimization process for machine learning models."
     )
     mapping: ClassVar[Dict[str, Bender]] = {
-        "parent_hyper_parameter_tuning_jobs": S("ParentHyperParameterTuningJobs", default=[])
+        "parent_hyper_parameter_tuning_jobs": S("ParentHyperParameterTuningJobs", default=())
         >> ForallBend(S("HyperParameterTuningJobName")),
-        "warm_start_type": S("WarmStartType"),
+        "warm_start_type": S("WarmStartType") >> Intern(),
     }
-    parent_hyper_parameter_tuning_jobs: List[str] = field(factory=list)
+    parent_hyper_parameter_tuning_jobs: Tuple[str, ...] = field(default=())
     warm_start_type: Optional[str] = field(default=None)
 
 
@@ -3799,9 +3807,9 @@ class AwsSagemakerHyperParameterTuningJob(SagemakerTaggable, AwsSagemakerJob):
         >> Bend(AwsSagemakerHyperParameterTuningJobConfig.mapping),
         "hyper_parameter_tuning_job_training_job_definition": S("TrainingJobDefinition")
         >> Bend(AwsSagemakerHyperParameterTrainingJobDefinition.mapping),
-        "hyper_parameter_tuning_job_training_job_definitions": S("TrainingJobDefinitions", default=[])
+        "hyper_parameter_tuning_job_training_job_definitions": S("TrainingJobDefinitions", default=())
         >> ForallBend(AwsSagemakerHyperParameterTrainingJobDefinition.mapping),
-        "hyper_parameter_tuning_job_status": S("HyperParameterTuningJobStatus"),
+        "hyper_parameter_tuning_job_status": S("HyperParameterTuningJobStatus") >> Intern(),
         "hyper_parameter_tuning_job_hyper_parameter_tuning_end_time": S("HyperParameterTuningEndTime"),
         "hyper_parameter_tuning_job_training_job_status_counters": S("TrainingJobStatusCounters")
         >> Bend(AwsSagemakerTrainingJobStatusCounters.mapping),
@@ -3819,8 +3827,8 @@ class AwsSagemakerHyperParameterTuningJob(SagemakerTaggable, AwsSagemakerJob):
     hyper_parameter_tuning_job_training_job_definition: Optional[AwsSagemakerHyperParameterTrainingJobDefinition] = (
         field(default=None)
     )
-    hyper_parameter_tuning_job_training_job_definitions: List[AwsSagemakerHyperParameterTrainingJobDefinition] = field(
-        factory=list
+    hyper_parameter_tuning_job_training_job_definitions: Tuple[AwsSagemakerHyperParameterTrainingJobDefinition, ...] = (
+        field(default=())
     )
     hyper_parameter_tuning_job_status: Optional[str] = field(default=None)
     hyper_parameter_tuning_job_hyper_parameter_tuning_end_time: Optional[datetime] = field(default=None)
@@ -3919,7 +3927,7 @@ class AwsSagemakerHyperParameterTuningJob(SagemakerTaggable, AwsSagemakerJob):
                 builder.add_edge(self, clazz=AwsSagemakerTrainingJob, arn=obtj.training_job_arn)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerPhase:
     kind: ClassVar[str] = "aws_sagemaker_phase"
     kind_display: ClassVar[str] = "AWS SageMaker Phase"
@@ -3938,7 +3946,7 @@ class AwsSagemakerPhase:
     duration_in_seconds: Optional[int] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerTrafficPattern:
     kind: ClassVar[str] = "aws_sagemaker_traffic_pattern"
     kind_display: ClassVar[str] = "AWS SageMaker Traffic Pattern"
@@ -3949,14 +3957,14 @@ class AwsSagemakerTrafficPattern:
         " models."
     )
     mapping: ClassVar[Dict[str, Bender]] = {
-        "traffic_type": S("TrafficType"),
-        "phases": S("Phases", default=[]) >> ForallBend(AwsSagemakerPhase.mapping),
+        "traffic_type": S("TrafficType") >> Intern(),
+        "phases": S("Phases", default=()) >> ForallBend(AwsSagemakerPhase.mapping),
     }
     traffic_type: Optional[str] = field(default=None)
-    phases: List[AwsSagemakerPhase] = field(factory=list)
+    phases: Tuple[AwsSagemakerPhase, ...] = field(default=())
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerRecommendationJobResourceLimit:
     kind: ClassVar[str] = "aws_sagemaker_recommendation_job_resource_limit"
     kind_display: ClassVar[str] = "AWS SageMaker Recommendation Job Resource Limit"
@@ -3972,7 +3980,7 @@ class AwsSagemakerRecommendationJobResourceLimit:
     max_parallel_of_tests: Optional[int] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerEnvironmentParameterRanges:
     kind: ClassVar[str] = "aws_sagemaker_environment_parameter_ranges"
     kind_display: ClassVar[str] = "AWS SageMaker Environment Parameter Ranges"
@@ -3982,12 +3990,12 @@ class AwsSagemakerEnvironmentParameterRanges:
         " define the valid values that can be used for tuning machine learning models."
     )
     mapping: ClassVar[Dict[str, Bender]] = {
-        "categorical_parameter_ranges": S("CategoricalParameterRanges", "Value", default=[])
+        "categorical_parameter_ranges": S("CategoricalParameterRanges", "Value", default=())
     }
-    categorical_parameter_ranges: List[str] = field(factory=list)
+    categorical_parameter_ranges: Tuple[str, ...] = field(default=())
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerEndpointInputConfiguration:
     kind: ClassVar[str] = "aws_sagemaker_endpoint_input_configuration"
     kind_display: ClassVar[str] = "AWS SageMaker Endpoint Input Configuration"
@@ -3996,7 +4004,7 @@ class AwsSagemakerEndpointInputConfiguration:
         " format and location for real-time inference."
     )
     mapping: ClassVar[Dict[str, Bender]] = {
-        "instance_type": S("InstanceType"),
+        "instance_type": S("InstanceType") >> Intern(),
         "inference_specification_name": S("InferenceSpecificationName"),
         "environment_parameter_ranges": S("EnvironmentParameterRanges")
         >> Bend(AwsSagemakerEnvironmentParameterRanges.mapping),
@@ -4006,7 +4014,7 @@ class AwsSagemakerEndpointInputConfiguration:
     environment_parameter_ranges: Optional[AwsSagemakerEnvironmentParameterRanges] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerRecommendationJobPayloadConfig:
     kind: ClassVar[str] = "aws_sagemaker_recommendation_job_payload_config"
     kind_display: ClassVar[str] = "AWS SageMaker Recommendation Job Payload Config"
@@ -4016,13 +4024,13 @@ class AwsSagemakerRecommendationJobPayloadConfig:
     )
     mapping: ClassVar[Dict[str, Bender]] = {
         "sample_payload_url": S("SamplePayloadUrl"),
-        "supported_content_types": S("SupportedContentTypes", default=[]),
+        "supported_content_types": S("SupportedContentTypes", default=()),
     }
     sample_payload_url: Optional[str] = field(default=None)
-    supported_content_types: List[str] = field(factory=list)
+    supported_content_types: Tuple[str, ...] = field(default=())
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerRecommendationJobContainerConfig:
     kind: ClassVar[str] = "aws_sagemaker_recommendation_job_container_config"
     kind_display: ClassVar[str] = "AWS SageMaker Recommendation Job Container Config"
@@ -4037,7 +4045,7 @@ class AwsSagemakerRecommendationJobContainerConfig:
         "framework_version": S("FrameworkVersion"),
         "payload_config": S("PayloadConfig") >> Bend(AwsSagemakerRecommendationJobPayloadConfig.mapping),
         "nearest_model_name": S("NearestModelName"),
-        "supported_instance_types": S("SupportedInstanceTypes", default=[]),
+        "supported_instance_types": S("SupportedInstanceTypes", default=()),
     }
     domain: Optional[str] = field(default=None)
     task: Optional[str] = field(default=None)
@@ -4045,10 +4053,10 @@ class AwsSagemakerRecommendationJobContainerConfig:
     framework_version: Optional[str] = field(default=None)
     payload_config: Optional[AwsSagemakerRecommendationJobPayloadConfig] = field(default=None)
     nearest_model_name: Optional[str] = field(default=None)
-    supported_instance_types: List[str] = field(factory=list)
+    supported_instance_types: Tuple[str, ...] = field(default=())
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerRecommendationJobInputConfig:
     kind: ClassVar[str] = "aws_sagemaker_recommendation_job_input_config"
     kind_display: ClassVar[str] = "AWS SageMaker Recommendation Job Input Config"
@@ -4061,23 +4069,23 @@ class AwsSagemakerRecommendationJobInputConfig:
         "job_duration_in_seconds": S("JobDurationInSeconds"),
         "traffic_pattern": S("TrafficPattern") >> Bend(AwsSagemakerTrafficPattern.mapping),
         "resource_limit": S("ResourceLimit") >> Bend(AwsSagemakerRecommendationJobResourceLimit.mapping),
-        "endpoint_configurations": S("EndpointConfigurations", default=[])
+        "endpoint_configurations": S("EndpointConfigurations", default=())
         >> ForallBend(AwsSagemakerEndpointInputConfiguration.mapping),
         "container_config": S("ContainerConfig") >> Bend(AwsSagemakerRecommendationJobContainerConfig.mapping),
-        "endpoints": S("Endpoints", default=[]) >> ForallBend(S("EndpointName")),
+        "endpoints": S("Endpoints", default=()) >> ForallBend(S("EndpointName")),
         "vpc_config": S("VpcConfig") >> Bend(AwsSagemakerVpcConfig.mapping),
     }
     model_package_version_arn: Optional[str] = field(default=None)
     job_duration_in_seconds: Optional[int] = field(default=None)
     traffic_pattern: Optional[AwsSagemakerTrafficPattern] = field(default=None)
     resource_limit: Optional[AwsSagemakerRecommendationJobResourceLimit] = field(default=None)
-    endpoint_configurations: List[AwsSagemakerEndpointInputConfiguration] = field(factory=list)
+    endpoint_configurations: Tuple[AwsSagemakerEndpointInputConfiguration, ...] = field(default=())
     container_config: Optional[AwsSagemakerRecommendationJobContainerConfig] = field(default=None)
-    endpoints: List[str] = field(factory=list)
+    endpoints: Tuple[str, ...] = field(default=())
     vpc_config: Optional[AwsSagemakerVpcConfig] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerModelLatencyThreshold:
     kind: ClassVar[str] = "aws_sagemaker_model_latency_threshold"
     kind_display: ClassVar[str] = "AWS SageMaker Model Latency Threshold"
@@ -4094,7 +4102,7 @@ class AwsSagemakerModelLatencyThreshold:
     value_in_milliseconds: Optional[int] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerRecommendationJobStoppingConditions:
     kind: ClassVar[str] = "aws_sagemaker_recommendation_job_stopping_conditions"
     kind_display: ClassVar[str] = "AWS SageMaker Recommendation Job Stopping Conditions"
@@ -4104,14 +4112,14 @@ class AwsSagemakerRecommendationJobStoppingConditions:
     )
     mapping: ClassVar[Dict[str, Bender]] = {
         "max_invocations": S("MaxInvocations"),
-        "model_latency_thresholds": S("ModelLatencyThresholds", default=[])
+        "model_latency_thresholds": S("ModelLatencyThresholds", default=())
         >> ForallBend(AwsSagemakerModelLatencyThreshold.mapping),
     }
     max_invocations: Optional[int] = field(default=None)
-    model_latency_thresholds: List[AwsSagemakerModelLatencyThreshold] = field(factory=list)
+    model_latency_thresholds: Tuple[AwsSagemakerModelLatencyThreshold, ...] = field(default=())
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerRecommendationMetrics:
     kind: ClassVar[str] = "aws_sagemaker_recommendation_metrics"
     kind_display: ClassVar[str] = "AWS SageMaker Recommendation Metrics"
@@ -4132,7 +4140,7 @@ class AwsSagemakerRecommendationMetrics:
     model_latency: Optional[int] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerEndpointOutputConfiguration:
     kind: ClassVar[str] = "aws_sagemaker_endpoint_output_configuration"
     kind_display: ClassVar[str] = "AWS SageMaker Endpoint Output Configuration"
@@ -4143,7 +4151,7 @@ class AwsSagemakerEndpointOutputConfiguration:
     mapping: ClassVar[Dict[str, Bender]] = {
         "endpoint_name": S("EndpointName"),
         "variant_name": S("VariantName"),
-        "instance_type": S("InstanceType"),
+        "instance_type": S("InstanceType") >> Intern(),
         "initial_instance_count": S("InitialInstanceCount"),
     }
     endpoint_name: Optional[str] = field(default=None)
@@ -4152,7 +4160,7 @@ class AwsSagemakerEndpointOutputConfiguration:
     initial_instance_count: Optional[int] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerEnvironmentParameter:
     kind: ClassVar[str] = "aws_sagemaker_environment_parameter"
     kind_display: ClassVar[str] = "AWS SageMaker Environment Parameter"
@@ -4167,7 +4175,7 @@ class AwsSagemakerEnvironmentParameter:
     value: Optional[str] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerModelConfiguration:
     kind: ClassVar[str] = "aws_sagemaker_model_configuration"
     kind_display: ClassVar[str] = "AWS SageMaker Model Configuration"
@@ -4178,14 +4186,14 @@ class AwsSagemakerModelConfiguration:
     )
     mapping: ClassVar[Dict[str, Bender]] = {
         "inference_specification_name": S("InferenceSpecificationName"),
-        "environment_parameters": S("EnvironmentParameters", default=[])
+        "environment_parameters": S("EnvironmentParameters", default=())
         >> ForallBend(AwsSagemakerEnvironmentParameter.mapping),
     }
     inference_specification_name: Optional[str] = field(default=None)
-    environment_parameters: List[AwsSagemakerEnvironmentParameter] = field(factory=list)
+    environment_parameters: Tuple[AwsSagemakerEnvironmentParameter, ...] = field(default=())
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerInferenceRecommendation:
     kind: ClassVar[str] = "aws_sagemaker_inference_recommendation"
     kind_display: ClassVar[str] = "AWS SageMaker Inference Recommendation"
@@ -4204,7 +4212,7 @@ class AwsSagemakerInferenceRecommendation:
     model_configuration: Optional[AwsSagemakerModelConfiguration] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerInferenceMetrics:
     kind: ClassVar[str] = "aws_sagemaker_inference_metrics"
     kind_display: ClassVar[str] = "AWS SageMaker Inference Metrics"
@@ -4218,7 +4226,7 @@ class AwsSagemakerInferenceMetrics:
     model_latency: Optional[int] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerEndpointPerformance:
     kind: ClassVar[str] = "aws_sagemaker_endpoint_performance"
     kind_display: ClassVar[str] = "AWS SageMaker Endpoint Performance"
@@ -4265,17 +4273,17 @@ class AwsSagemakerInferenceRecommendationsJob(AwsSagemakerJob):
         "mtime": S("LastModifiedTime"),
         "arn": S("JobArn"),
         "inference_recommendations_job_description": S("JobDescription"),
-        "inference_recommendations_job_type": S("JobType"),
-        "inference_recommendations_job_status": S("Status"),
+        "inference_recommendations_job_type": S("JobType") >> Intern(),
+        "inference_recommendations_job_status": S("Status") >> Intern(),
         "inference_recommendations_job_completion_time": S("CompletionTime"),
         "inference_recommendations_job_failure_reason": S("FailureReason"),
         "inference_recommendations_job_input_config": S("InputConfig")
         >> Bend(AwsSagemakerRecommendationJobInputConfig.mapping),
         "inference_recommendations_job_stopping_conditions": S("StoppingConditions")
         >> Bend(AwsSagemakerRecommendationJobStoppingConditions.mapping),
-        "inference_recommendations_job_inference_recommendations": S("InferenceRecommendations", default=[])
+        "inference_recommendations_job_inference_recommendations": S("InferenceRecommendations", default=())
         >> ForallBend(AwsSagemakerInferenceRecommendation.mapping),
-        "inference_recommendations_job_endpoint_performances": S("EndpointPerformances", default=[])
+        "inference_recommendations_job_endpoint_performances": S("EndpointPerformances", default=())
         >> ForallBend(AwsSagemakerEndpointPerformance.mapping),
     }
     inference_recommendations_job_description: Optional[str] = field(default=None)
@@ -4287,10 +4295,10 @@ class AwsSagemakerInferenceRecommendationsJob(AwsSagemakerJob):
     inference_recommendations_job_stopping_conditions: Optional[AwsSagemakerRecommendationJobStoppingConditions] = (
         field(default=None)
     )
-    inference_recommendations_job_inference_recommendations: List[AwsSagemakerInferenceRecommendation] = field(
-        factory=list
+    inference_recommendations_job_inference_recommendations: Tuple[AwsSagemakerInferenceRecommendation, ...] = field(
+        default=()
     )
-    inference_recommendations_job_endpoint_performances: List[AwsSagemakerEndpointPerformance] = field(factory=list)
+    inference_recommendations_job_endpoint_performances: Tuple[AwsSagemakerEndpointPerformance, ...] = field(default=())
 
     @classmethod
     def called_collect_apis(cls) -> List[AwsApiSpec]:
@@ -4348,7 +4356,7 @@ class AwsSagemakerInferenceRecommendationsJob(AwsSagemakerJob):
                 builder.add_edge(self, clazz=AwsSagemakerEndpoint, name=perf.endpoint_info)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerLabelCounters:
     kind: ClassVar[str] = "aws_sagemaker_label_counters"
     kind_display: ClassVar[str] = "AWS SageMaker Label Counters"
@@ -4371,7 +4379,7 @@ class AwsSagemakerLabelCounters:
     unlabeled: Optional[int] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerLabelingJobDataSource:
     kind: ClassVar[str] = "aws_sagemaker_labeling_job_data_source"
     kind_display: ClassVar[str] = "AWS SageMaker Labeling Job Data Source"
@@ -4388,7 +4396,7 @@ class AwsSagemakerLabelingJobDataSource:
     sns_data_source: Optional[str] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerLabelingJobInputConfig:
     kind: ClassVar[str] = "aws_sagemaker_labeling_job_input_config"
     kind_display: ClassVar[str] = "AWS SageMaker Labeling Job Input Config"
@@ -4399,13 +4407,13 @@ class AwsSagemakerLabelingJobInputConfig:
     )
     mapping: ClassVar[Dict[str, Bender]] = {
         "data_source": S("DataSource") >> Bend(AwsSagemakerLabelingJobDataSource.mapping),
-        "data_attributes": S("DataAttributes", "ContentClassifiers", default=[]),
+        "data_attributes": S("DataAttributes", "ContentClassifiers", default=()),
     }
     data_source: Optional[AwsSagemakerLabelingJobDataSource] = field(default=None)
-    data_attributes: List[str] = field(factory=list)
+    data_attributes: Tuple[str, ...] = field(default=())
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerLabelingJobOutputConfig:
     kind: ClassVar[str] = "aws_sagemaker_labeling_job_output_config"
     kind_display: ClassVar[str] = "AWS SageMaker Labeling Job Output Config"
@@ -4424,7 +4432,7 @@ class AwsSagemakerLabelingJobOutputConfig:
     sns_topic_arn: Optional[str] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerLabelingJobStoppingConditions:
     kind: ClassVar[str] = "aws_sagemaker_labeling_job_stopping_conditions"
     kind_display: ClassVar[str] = "AWS SageMaker Labeling Job Stopping Conditions"
@@ -4442,7 +4450,7 @@ class AwsSagemakerLabelingJobStoppingConditions:
     max_percentage_of_input_dataset_labeled: Optional[int] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerLabelingJobResourceConfig:
     kind: ClassVar[str] = "aws_sagemaker_labeling_job_resource_config"
     kind_display: ClassVar[str] = "AWS SageMaker Labeling Job Resource Config"
@@ -4459,7 +4467,7 @@ class AwsSagemakerLabelingJobResourceConfig:
     vpc_config: Optional[AwsSagemakerVpcConfig] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerLabelingJobAlgorithmsConfig:
     kind: ClassVar[str] = "aws_sagemaker_labeling_job_algorithms_config"
     kind_display: ClassVar[str] = "AWS SageMaker Labeling Job Algorithms Config"
@@ -4478,7 +4486,7 @@ class AwsSagemakerLabelingJobAlgorithmsConfig:
     labeling_job_resource_config: Optional[AwsSagemakerLabelingJobResourceConfig] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerUiConfig:
     kind: ClassVar[str] = "aws_sagemaker_ui_config"
     kind_display: ClassVar[str] = "AWS SageMaker UI Config"
@@ -4495,7 +4503,7 @@ class AwsSagemakerUiConfig:
     human_task_ui_arn: Optional[str] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerUSD:
     kind: ClassVar[str] = "aws_sagemaker_usd"
     kind_display: ClassVar[str] = "AWS SageMaker USD"
@@ -4514,7 +4522,7 @@ class AwsSagemakerUSD:
     tenth_fractions_of_a_cent: Optional[int] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerPublicWorkforceTaskPrice:
     kind: ClassVar[str] = "aws_sagemaker_public_workforce_task_price"
     kind_display: ClassVar[str] = "AWS SageMaker Public Workforce Task Price"
@@ -4527,7 +4535,7 @@ class AwsSagemakerPublicWorkforceTaskPrice:
     amount_in_usd: Optional[AwsSagemakerUSD] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerHumanTaskConfig:
     kind: ClassVar[str] = "aws_sagemaker_human_task_config"
     kind_display: ClassVar[str] = "AWS SageMaker Human Task Config"
@@ -4541,7 +4549,7 @@ class AwsSagemakerHumanTaskConfig:
         "workteam_arn": S("WorkteamArn"),
         "ui_config": S("UiConfig") >> Bend(AwsSagemakerUiConfig.mapping),
         "pre_human_task_lambda_arn": S("PreHumanTaskLambdaArn"),
-        "task_keywords": S("TaskKeywords", default=[]),
+        "task_keywords": S("TaskKeywords", default=()),
         "task_title": S("TaskTitle"),
         "task_description": S("TaskDescription"),
         "number_of_human_workers_per_data_object": S("NumberOfHumanWorkersPerDataObject"),
@@ -4555,7 +4563,7 @@ class AwsSagemakerHumanTaskConfig:
     workteam_arn: Optional[str] = field(default=None)
     ui_config: Optional[AwsSagemakerUiConfig] = field(default=None)
     pre_human_task_lambda_arn: Optional[str] = field(default=None)
-    task_keywords: List[str] = field(factory=list)
+    task_keywords: Tuple[str, ...] = field(default=())
     task_title: Optional[str] = field(default=None)
     task_description: Optional[str] = field(default=None)
     number_of_human_workers_per_data_object: Optional[int] = field(default=None)
@@ -4566,7 +4574,7 @@ class AwsSagemakerHumanTaskConfig:
     public_workforce_task_price: Optional[AwsSagemakerPublicWorkforceTaskPrice] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerLabelingJobOutput:
     kind: ClassVar[str] = "aws_sagemaker_labeling_job_output"
     kind_display: ClassVar[str] = "AWS SageMaker Labeling Job Output"
@@ -4611,11 +4619,11 @@ class AwsSagemakerLabelingJob(SagemakerTaggable, AwsSagemakerJob):
     mapping: ClassVar[Dict[str, Bender]] = {
         "id": S("LabelingJobName"),
         "name": S("LabelingJobName"),
-        "tags": S("Tags", default=[]) >> ToDict(),
+        "tags": S("Tags", default=()) >> ToDict(),
         "ctime": S("CreationTime"),
         "mtime": S("LastModifiedTime"),
         "arn": S("LabelingJobArn"),
-        "labeling_job_status": S("LabelingJobStatus"),
+        "labeling_job_status": S("LabelingJobStatus") >> Intern(),
         "labeling_job_label_counters": S("LabelCounters") >> Bend(AwsSagemakerLabelCounters.mapping),
         "labeling_job_failure_reason": S("FailureReason"),
         "labeling_job_job_reference_code": S("JobReferenceCode"),
@@ -4718,7 +4726,7 @@ class AwsSagemakerLabelingJob(SagemakerTaggable, AwsSagemakerJob):
                 builder.add_edge(self, clazz=AwsS3Bucket, name=AwsS3Bucket.name_from_path(out.output_dataset_s3_uri))
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerProcessingS3Input:
     kind: ClassVar[str] = "aws_sagemaker_processing_s3_input"
     kind_display: ClassVar[str] = "AWS SageMaker Processing S3 Input"
@@ -4743,7 +4751,7 @@ class AwsSagemakerProcessingS3Input:
     s3_compression_type: Optional[str] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerAthenaDatasetDefinition:
     kind: ClassVar[str] = "aws_sagemaker_athena_dataset_definition"
     kind_display: ClassVar[str] = "AWS SageMaker Athena Dataset Definition"
@@ -4771,7 +4779,7 @@ class AwsSagemakerAthenaDatasetDefinition:
     output_compression: Optional[str] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerRedshiftDatasetDefinition:
     kind: ClassVar[str] = "aws_sagemaker_redshift_dataset_definition"
     kind_display: ClassVar[str] = "AWS SageMaker Redshift Dataset Definition"
@@ -4802,7 +4810,7 @@ class AwsSagemakerRedshiftDatasetDefinition:
     output_compression: Optional[str] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerDatasetDefinition:
     kind: ClassVar[str] = "aws_sagemaker_dataset_definition"
     kind_display: ClassVar[str] = "AWS SageMaker Dataset Definition"
@@ -4816,8 +4824,8 @@ class AwsSagemakerDatasetDefinition:
         "redshift_dataset_definition": S("RedshiftDatasetDefinition")
         >> Bend(AwsSagemakerRedshiftDatasetDefinition.mapping),
         "local_path": S("LocalPath"),
-        "data_distribution_type": S("DataDistributionType"),
-        "input_mode": S("InputMode"),
+        "data_distribution_type": S("DataDistributionType") >> Intern(),
+        "input_mode": S("InputMode") >> Intern(),
     }
     athena_dataset_definition: Optional[AwsSagemakerAthenaDatasetDefinition] = field(default=None)
     redshift_dataset_definition: Optional[AwsSagemakerRedshiftDatasetDefinition] = field(default=None)
@@ -4826,7 +4834,7 @@ class AwsSagemakerDatasetDefinition:
     input_mode: Optional[str] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerProcessingInput:
     kind: ClassVar[str] = "aws_sagemaker_processing_input"
     kind_display: ClassVar[str] = "AWS SageMaker Processing Input"
@@ -4847,7 +4855,7 @@ class AwsSagemakerProcessingInput:
     dataset_definition: Optional[AwsSagemakerDatasetDefinition] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerProcessingS3Output:
     kind: ClassVar[str] = "aws_sagemaker_processing_s3_output"
     kind_display: ClassVar[str] = "AWS SageMaker Processing S3 Output"
@@ -4866,7 +4874,7 @@ class AwsSagemakerProcessingS3Output:
     s3_upload_mode: Optional[str] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerProcessingOutput:
     kind: ClassVar[str] = "aws_sagemaker_processing_output"
     kind_display: ClassVar[str] = "AWS SageMaker Processing Output"
@@ -4887,7 +4895,7 @@ class AwsSagemakerProcessingOutput:
     app_managed: Optional[bool] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerProcessingOutputConfig:
     kind: ClassVar[str] = "aws_sagemaker_processing_output_config"
     kind_display: ClassVar[str] = "AWS SageMaker Processing Output Config"
@@ -4896,14 +4904,14 @@ class AwsSagemakerProcessingOutputConfig:
         " and how the output of a SageMaker processing job should be stored."
     )
     mapping: ClassVar[Dict[str, Bender]] = {
-        "outputs": S("Outputs", default=[]) >> ForallBend(AwsSagemakerProcessingOutput.mapping),
+        "outputs": S("Outputs", default=()) >> ForallBend(AwsSagemakerProcessingOutput.mapping),
         "kms_key_id": S("KmsKeyId"),
     }
-    outputs: List[AwsSagemakerProcessingOutput] = field(factory=list)
+    outputs: Tuple[AwsSagemakerProcessingOutput, ...] = field(default=())
     kms_key_id: Optional[str] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerProcessingClusterConfig:
     kind: ClassVar[str] = "aws_sagemaker_processing_cluster_config"
     kind_display: ClassVar[str] = "AWS SageMaker Processing Cluster Config"
@@ -4915,7 +4923,7 @@ class AwsSagemakerProcessingClusterConfig:
     )
     mapping: ClassVar[Dict[str, Bender]] = {
         "instance_count": S("InstanceCount"),
-        "instance_type": S("InstanceType"),
+        "instance_type": S("InstanceType") >> Intern(),
         "volume_size_in_gb": S("VolumeSizeInGB"),
         "volume_kms_key_id": S("VolumeKmsKeyId"),
     }
@@ -4925,7 +4933,7 @@ class AwsSagemakerProcessingClusterConfig:
     volume_kms_key_id: Optional[str] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerProcessingResources:
     kind: ClassVar[str] = "aws_sagemaker_processing_resources"
     kind_display: ClassVar[str] = "AWS SageMaker Processing Resources"
@@ -4940,7 +4948,7 @@ class AwsSagemakerProcessingResources:
     cluster_config: Optional[AwsSagemakerProcessingClusterConfig] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerAppSpecification:
     kind: ClassVar[str] = "aws_sagemaker_app_specification"
     kind_display: ClassVar[str] = "AWS SageMaker App Specification"
@@ -4951,15 +4959,15 @@ class AwsSagemakerAppSpecification:
     )
     mapping: ClassVar[Dict[str, Bender]] = {
         "image_uri": S("ImageUri"),
-        "container_entrypoint": S("ContainerEntrypoint", default=[]),
-        "container_arguments": S("ContainerArguments", default=[]),
+        "container_entrypoint": S("ContainerEntrypoint", default=()),
+        "container_arguments": S("ContainerArguments", default=()),
     }
     image_uri: Optional[str] = field(default=None)
-    container_entrypoint: List[str] = field(factory=list)
-    container_arguments: List[str] = field(factory=list)
+    container_entrypoint: Tuple[str, ...] = field(default=())
+    container_arguments: Tuple[str, ...] = field(default=())
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerNetworkConfig:
     kind: ClassVar[str] = "aws_sagemaker_network_config"
     kind_display: ClassVar[str] = "AWS SageMaker Network Config"
@@ -5008,7 +5016,7 @@ class AwsSagemakerProcessingJob(AwsSagemakerJob):
         "ctime": S("CreationTime"),
         "mtime": S("LastModifiedTime"),
         "arn": S("ProcessingJobArn"),
-        "processing_job_processing_inputs": S("ProcessingInputs", default=[])
+        "processing_job_processing_inputs": S("ProcessingInputs", default=())
         >> ForallBend(AwsSagemakerProcessingInput.mapping),
         "processing_job_processing_output_config": S("ProcessingOutputConfig")
         >> Bend(AwsSagemakerProcessingOutputConfig.mapping),
@@ -5020,7 +5028,7 @@ class AwsSagemakerProcessingJob(AwsSagemakerJob):
         "processing_job_network_config": S("NetworkConfig") >> Bend(AwsSagemakerNetworkConfig.mapping),
         "processing_job_role_arn": S("RoleArn"),
         "processing_job_trial_component_display_name": S("ExperimentConfig", "TrialComponentDisplayName"),
-        "processing_job_status": S("ProcessingJobStatus"),
+        "processing_job_status": S("ProcessingJobStatus") >> Intern(),
         "processing_job_exit_message": S("ExitMessage"),
         "processing_job_failure_reason": S("FailureReason"),
         "processing_job_processing_end_time": S("ProcessingEndTime"),
@@ -5028,7 +5036,7 @@ class AwsSagemakerProcessingJob(AwsSagemakerJob):
         "processing_job_monitoring_schedule_arn": S("MonitoringScheduleArn"),
         "processing_job_auto_ml_job_arn": S("AutoMLJobArn"),
     }
-    processing_job_processing_inputs: List[AwsSagemakerProcessingInput] = field(factory=list)
+    processing_job_processing_inputs: Tuple[AwsSagemakerProcessingInput, ...] = field(default=())
     processing_job_processing_output_config: Optional[AwsSagemakerProcessingOutputConfig] = field(default=None)
     processing_job_processing_resources: Optional[AwsSagemakerProcessingResources] = field(default=None)
     processing_job_stopping_condition: Optional[int] = field(default=None)
@@ -5122,7 +5130,7 @@ class AwsSagemakerProcessingJob(AwsSagemakerJob):
             builder.add_edge(self, clazz=AwsSagemakerTrainingJob, arn=training_job)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerAlgorithmSpecification:
     kind: ClassVar[str] = "aws_sagemaker_algorithm_specification"
     kind_display: ClassVar[str] = "AWS SageMaker Algorithm Specification"
@@ -5135,22 +5143,22 @@ class AwsSagemakerAlgorithmSpecification:
     mapping: ClassVar[Dict[str, Bender]] = {
         "training_image": S("TrainingImage"),
         "algorithm_name": S("AlgorithmName"),
-        "training_input_mode": S("TrainingInputMode"),
-        "metric_definitions": S("MetricDefinitions", default=[]) >> ForallBend(AwsSagemakerMetricDefinition.mapping),
+        "training_input_mode": S("TrainingInputMode") >> Intern(),
+        "metric_definitions": S("MetricDefinitions", default=()) >> ForallBend(AwsSagemakerMetricDefinition.mapping),
         "enable_sage_maker_metrics_time_series": S("EnableSageMakerMetricsTimeSeries"),
-        "container_entrypoint": S("ContainerEntrypoint", default=[]),
-        "container_arguments": S("ContainerArguments", default=[]),
+        "container_entrypoint": S("ContainerEntrypoint", default=()),
+        "container_arguments": S("ContainerArguments", default=()),
     }
     training_image: Optional[str] = field(default=None)
     algorithm_name: Optional[str] = field(default=None)
     training_input_mode: Optional[str] = field(default=None)
-    metric_definitions: List[AwsSagemakerMetricDefinition] = field(factory=list)
+    metric_definitions: Tuple[AwsSagemakerMetricDefinition, ...] = field(default=())
     enable_sage_maker_metrics_time_series: Optional[bool] = field(default=None)
-    container_entrypoint: List[str] = field(factory=list)
-    container_arguments: List[str] = field(factory=list)
+    container_entrypoint: Tuple[str, ...] = field(default=())
+    container_arguments: Tuple[str, ...] = field(default=())
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerSecondaryStatusTransition:
     kind: ClassVar[str] = "aws_sagemaker_secondary_status_transition"
     kind_display: ClassVar[str] = "AWS SageMaker Secondary Status Transition"
@@ -5159,7 +5167,7 @@ class AwsSagemakerSecondaryStatusTransition:
         " training or processing job after reaching a certain status."
     )
     mapping: ClassVar[Dict[str, Bender]] = {
-        "status": S("Status"),
+        "status": S("Status") >> Intern(),
         "start_time": S("StartTime"),
         "end_time": S("EndTime"),
         "status_message": S("StatusMessage"),
@@ -5170,7 +5178,7 @@ class AwsSagemakerSecondaryStatusTransition:
     status_message: Optional[str] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerMetricData:
     kind: ClassVar[str] = "aws_sagemaker_metric_data"
     kind_display: ClassVar[str] = "AWS SageMaker Metric Data"
@@ -5189,7 +5197,7 @@ class AwsSagemakerMetricData:
     timestamp: Optional[datetime] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerCollectionConfiguration:
     kind: ClassVar[str] = "aws_sagemaker_collection_configuration"
     kind_display: ClassVar[str] = "AWS SageMaker Collection Configuration"
@@ -5205,7 +5213,7 @@ class AwsSagemakerCollectionConfiguration:
     collection_parameters: Optional[Dict[str, str]] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerDebugHookConfig:
     kind: ClassVar[str] = "aws_sagemaker_debug_hook_config"
     kind_display: ClassVar[str] = "AWS SageMaker Debug Hook Config"
@@ -5219,16 +5227,16 @@ class AwsSagemakerDebugHookConfig:
         "local_path": S("LocalPath"),
         "s3_output_path": S("S3OutputPath"),
         "hook_parameters": S("HookParameters"),
-        "collection_configurations": S("CollectionConfigurations", default=[])
+        "collection_configurations": S("CollectionConfigurations", default=())
         >> ForallBend(AwsSagemakerCollectionConfiguration.mapping),
     }
     local_path: Optional[str] = field(default=None)
     s3_output_path: Optional[str] = field(default=None)
     hook_parameters: Optional[Dict[str, str]] = field(default=None)
-    collection_configurations: List[AwsSagemakerCollectionConfiguration] = field(factory=list)
+    collection_configurations: Tuple[AwsSagemakerCollectionConfiguration, ...] = field(default=())
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerDebugRuleConfiguration:
     kind: ClassVar[str] = "aws_sagemaker_debug_rule_configuration"
     kind_display: ClassVar[str] = "AWS SageMaker Debug Rule Configuration"
@@ -5242,7 +5250,7 @@ class AwsSagemakerDebugRuleConfiguration:
         "local_path": S("LocalPath"),
         "s3_output_path": S("S3OutputPath"),
         "rule_evaluator_image": S("RuleEvaluatorImage"),
-        "instance_type": S("InstanceType"),
+        "instance_type": S("InstanceType") >> Intern(),
         "volume_size_in_gb": S("VolumeSizeInGB"),
         "rule_parameters": S("RuleParameters"),
     }
@@ -5255,7 +5263,7 @@ class AwsSagemakerDebugRuleConfiguration:
     rule_parameters: Optional[Dict[str, str]] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerTensorBoardOutputConfig:
     kind: ClassVar[str] = "aws_sagemaker_tensor_board_output_config"
     kind_display: ClassVar[str] = "AWS SageMaker TensorBoard Output Config"
@@ -5268,7 +5276,7 @@ class AwsSagemakerTensorBoardOutputConfig:
     s3_output_path: Optional[str] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerDebugRuleEvaluationStatus:
     kind: ClassVar[str] = "aws_sagemaker_debug_rule_evaluation_status"
     kind_display: ClassVar[str] = "AWS SageMaker Debug Rule Evaluation Status"
@@ -5280,7 +5288,7 @@ class AwsSagemakerDebugRuleEvaluationStatus:
     mapping: ClassVar[Dict[str, Bender]] = {
         "rule_configuration_name": S("RuleConfigurationName"),
         "rule_evaluation_job_arn": S("RuleEvaluationJobArn"),
-        "rule_evaluation_status": S("RuleEvaluationStatus"),
+        "rule_evaluation_status": S("RuleEvaluationStatus") >> Intern(),
         "status_details": S("StatusDetails"),
         "last_modified_time": S("LastModifiedTime"),
     }
@@ -5291,7 +5299,7 @@ class AwsSagemakerDebugRuleEvaluationStatus:
     last_modified_time: Optional[datetime] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerProfilerConfig:
     kind: ClassVar[str] = "aws_sagemaker_profiler_config"
     kind_display: ClassVar[str] = "AWS SageMaker Profiler Configuration"
@@ -5310,7 +5318,7 @@ class AwsSagemakerProfilerConfig:
     profiling_parameters: Optional[Dict[str, str]] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerProfilerRuleConfiguration:
     kind: ClassVar[str] = "aws_sagemaker_profiler_rule_configuration"
     kind_display: ClassVar[str] = "AWS SageMaker Profiler Rule Configuration"
@@ -5324,7 +5332,7 @@ class AwsSagemakerProfilerRuleConfiguration:
         "local_path": S("LocalPath"),
         "s3_output_path": S("S3OutputPath"),
         "rule_evaluator_image": S("RuleEvaluatorImage"),
-        "instance_type": S("InstanceType"),
+        "instance_type": S("InstanceType") >> Intern(),
         "volume_size_in_gb": S("VolumeSizeInGB"),
         "rule_parameters": S("RuleParameters"),
     }
@@ -5337,7 +5345,7 @@ class AwsSagemakerProfilerRuleConfiguration:
     rule_parameters: Optional[Dict[str, str]] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerProfilerRuleEvaluationStatus:
     kind: ClassVar[str] = "aws_sagemaker_profiler_rule_evaluation_status"
     kind_display: ClassVar[str] = "AWS SageMaker Profiler Rule Evaluation Status"
@@ -5349,7 +5357,7 @@ class AwsSagemakerProfilerRuleEvaluationStatus:
     mapping: ClassVar[Dict[str, Bender]] = {
         "rule_configuration_name": S("RuleConfigurationName"),
         "rule_evaluation_job_arn": S("RuleEvaluationJobArn"),
-        "rule_evaluation_status": S("RuleEvaluationStatus"),
+        "rule_evaluation_status": S("RuleEvaluationStatus") >> Intern(),
         "status_details": S("StatusDetails"),
         "last_modified_time": S("LastModifiedTime"),
     }
@@ -5360,7 +5368,7 @@ class AwsSagemakerProfilerRuleEvaluationStatus:
     last_modified_time: Optional[datetime] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerWarmPoolStatus:
     kind: ClassVar[str] = "aws_sagemaker_warm_pool_status"
     kind_display: ClassVar[str] = "AWS SageMaker Warm Pool Status"
@@ -5371,7 +5379,7 @@ class AwsSagemakerWarmPoolStatus:
         " models."
     )
     mapping: ClassVar[Dict[str, Bender]] = {
-        "status": S("Status"),
+        "status": S("Status") >> Intern(),
         "resource_retained_billable_time_in_seconds": S("ResourceRetainedBillableTimeInSeconds"),
         "reused_by_job": S("ReusedByJob"),
     }
@@ -5412,22 +5420,22 @@ class AwsSagemakerTrainingJob(SagemakerTaggable, AwsSagemakerJob):
         "training_job_labeling_job_arn": S("LabelingJobArn"),
         "training_job_auto_ml_job_arn": S("AutoMLJobArn"),
         "training_job_model_artifacts": S("ModelArtifacts", "S3ModelArtifacts"),
-        "training_job_training_job_status": S("TrainingJobStatus"),
-        "training_job_secondary_status": S("SecondaryStatus"),
+        "training_job_training_job_status": S("TrainingJobStatus") >> Intern(),
+        "training_job_secondary_status": S("SecondaryStatus") >> Intern(),
         "training_job_failure_reason": S("FailureReason"),
         "training_job_hyper_parameters": S("HyperParameters"),
         "training_job_algorithm_specification": S("AlgorithmSpecification")
         >> Bend(AwsSagemakerAlgorithmSpecification.mapping),
-        "training_job_input_data_config": S("InputDataConfig", default=[]) >> ForallBend(AwsSagemakerChannel.mapping),
+        "training_job_input_data_config": S("InputDataConfig", default=()) >> ForallBend(AwsSagemakerChannel.mapping),
         "training_job_output_data_config": S("OutputDataConfig") >> Bend(AwsSagemakerOutputDataConfig.mapping),
         "training_job_resource_config": S("ResourceConfig") >> Bend(AwsSagemakerResourceConfig.mapping),
         "training_job_vpc_config": S("VpcConfig") >> Bend(AwsSagemakerVpcConfig.mapping),
         "training_job_stopping_condition": S("StoppingCondition") >> Bend(AwsSagemakerStoppingCondition.mapping),
         "training_job_training_start_time": S("TrainingStartTime"),
         "training_job_training_end_time": S("TrainingEndTime"),
-        "training_job_secondary_status_transitions": S("SecondaryStatusTransitions", default=[])
+        "training_job_secondary_status_transitions": S("SecondaryStatusTransitions", default=())
         >> ForallBend(AwsSagemakerSecondaryStatusTransition.mapping),
-        "training_job_final_metric_data_list": S("FinalMetricDataList", default=[])
+        "training_job_final_metric_data_list": S("FinalMetricDataList", default=())
         >> ForallBend(AwsSagemakerMetricData.mapping),
         "training_job_enable_network_isolation": S("EnableNetworkIsolation"),
         "training_job_enable_inter_container_traffic_encryption": S("EnableInterContainerTrafficEncryption"),
@@ -5437,18 +5445,18 @@ class AwsSagemakerTrainingJob(SagemakerTaggable, AwsSagemakerJob):
         "training_job_billable_time_in_seconds": S("BillableTimeInSeconds"),
         "training_job_debug_hook_config": S("DebugHookConfig") >> Bend(AwsSagemakerDebugHookConfig.mapping),
         "training_job_trial_component_display_name": S("ExperimentConfig", "TrialComponentDisplayName"),
-        "training_job_debug_rule_configurations": S("DebugRuleConfigurations", default=[])
+        "training_job_debug_rule_configurations": S("DebugRuleConfigurations", default=())
         >> ForallBend(AwsSagemakerDebugRuleConfiguration.mapping),
         "training_job_tensor_board_output_config": S("TensorBoardOutputConfig")
         >> Bend(AwsSagemakerTensorBoardOutputConfig.mapping),
-        "training_job_debug_rule_evaluation_statuses": S("DebugRuleEvaluationStatuses", default=[])
+        "training_job_debug_rule_evaluation_statuses": S("DebugRuleEvaluationStatuses", default=())
         >> ForallBend(AwsSagemakerDebugRuleEvaluationStatus.mapping),
         "training_job_profiler_config": S("ProfilerConfig") >> Bend(AwsSagemakerProfilerConfig.mapping),
-        "training_job_profiler_rule_configurations": S("ProfilerRuleConfigurations", default=[])
+        "training_job_profiler_rule_configurations": S("ProfilerRuleConfigurations", default=())
         >> ForallBend(AwsSagemakerProfilerRuleConfiguration.mapping),
-        "training_job_profiler_rule_evaluation_statuses": S("ProfilerRuleEvaluationStatuses", default=[])
+        "training_job_profiler_rule_evaluation_statuses": S("ProfilerRuleEvaluationStatuses", default=())
         >> ForallBend(AwsSagemakerProfilerRuleEvaluationStatus.mapping),
-        "training_job_profiling_status": S("ProfilingStatus"),
+        "training_job_profiling_status": S("ProfilingStatus") >> Intern(),
         "training_job_retry_strategy": S("RetryStrategy", "MaximumRetryAttempts"),
         "training_job_environment": S("Environment"),
         "training_job_warm_pool_status": S("WarmPoolStatus") >> Bend(AwsSagemakerWarmPoolStatus.mapping),
@@ -5462,15 +5470,15 @@ class AwsSagemakerTrainingJob(SagemakerTaggable, AwsSagemakerJob):
     training_job_failure_reason: Optional[str] = field(default=None)
     training_job_hyper_parameters: Optional[Dict[str, str]] = field(default=None)
     training_job_algorithm_specification: Optional[AwsSagemakerAlgorithmSpecification] = field(default=None)
-    training_job_input_data_config: List[AwsSagemakerChannel] = field(factory=list)
+    training_job_input_data_config: Tuple[AwsSagemakerChannel, ...] = field(default=())
     training_job_output_data_config: Optional[AwsSagemakerOutputDataConfig] = field(default=None)
     training_job_resource_config: Optional[AwsSagemakerResourceConfig] = field(default=None)
     training_job_vpc_config: Optional[AwsSagemakerVpcConfig] = field(default=None)
     training_job_stopping_condition: Optional[AwsSagemakerStoppingCondition] = field(default=None)
     training_job_training_start_time: Optional[datetime] = field(default=None)
     training_job_training_end_time: Optional[datetime] = field(default=None)
-    training_job_secondary_status_transitions: List[AwsSagemakerSecondaryStatusTransition] = field(factory=list)
-    training_job_final_metric_data_list: List[AwsSagemakerMetricData] = field(factory=list)
+    training_job_secondary_status_transitions: Tuple[AwsSagemakerSecondaryStatusTransition, ...] = field(default=())
+    training_job_final_metric_data_list: Tuple[AwsSagemakerMetricData, ...] = field(default=())
     training_job_enable_network_isolation: Optional[bool] = field(default=None)
     training_job_enable_inter_container_traffic_encryption: Optional[bool] = field(default=None)
     training_job_enable_managed_spot_training: Optional[bool] = field(default=None)
@@ -5479,12 +5487,14 @@ class AwsSagemakerTrainingJob(SagemakerTaggable, AwsSagemakerJob):
     training_job_billable_time_in_seconds: Optional[int] = field(default=None)
     training_job_debug_hook_config: Optional[AwsSagemakerDebugHookConfig] = field(default=None)
     training_job_trial_component_display_name: Optional[str] = field(default=None)
-    training_job_debug_rule_configurations: List[AwsSagemakerDebugRuleConfiguration] = field(factory=list)
+    training_job_debug_rule_configurations: Tuple[AwsSagemakerDebugRuleConfiguration, ...] = field(default=())
     training_job_tensor_board_output_config: Optional[AwsSagemakerTensorBoardOutputConfig] = field(default=None)
-    training_job_debug_rule_evaluation_statuses: List[AwsSagemakerDebugRuleEvaluationStatus] = field(factory=list)
+    training_job_debug_rule_evaluation_statuses: Tuple[AwsSagemakerDebugRuleEvaluationStatus, ...] = field(default=())
     training_job_profiler_config: Optional[AwsSagemakerProfilerConfig] = field(default=None)
-    training_job_profiler_rule_configurations: List[AwsSagemakerProfilerRuleConfiguration] = field(factory=list)
-    training_job_profiler_rule_evaluation_statuses: List[AwsSagemakerProfilerRuleEvaluationStatus] = field(factory=list)
+    training_job_profiler_rule_configurations: Tuple[AwsSagemakerProfilerRuleConfiguration, ...] = field(default=())
+    training_job_profiler_rule_evaluation_statuses: Tuple[AwsSagemakerProfilerRuleEvaluationStatus, ...] = field(
+        default=()
+    )
     training_job_profiling_status: Optional[str] = field(default=None)
     training_job_retry_strategy: Optional[int] = field(default=None)
     training_job_environment: Optional[Dict[str, str]] = field(default=None)
@@ -5569,7 +5579,7 @@ class AwsSagemakerTrainingJob(SagemakerTaggable, AwsSagemakerJob):
                 builder.add_edge(self, clazz=AwsS3Bucket, name=AwsS3Bucket.name_from_path(tjrc.s3_output_path))
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerModelClientConfig:
     kind: ClassVar[str] = "aws_sagemaker_model_client_config"
     kind_display: ClassVar[str] = "AWS SageMaker Model Client Config"
@@ -5585,7 +5595,7 @@ class AwsSagemakerModelClientConfig:
     invocations_max_retries: Optional[int] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerBatchDataCaptureConfig:
     kind: ClassVar[str] = "aws_sagemaker_batch_data_capture_config"
     kind_display: ClassVar[str] = "AWS SageMaker Batch Data Capture Config"
@@ -5603,7 +5613,7 @@ class AwsSagemakerBatchDataCaptureConfig:
     generate_inference_id: Optional[bool] = field(default=None)
 
 
-@define(eq=False, slots=False)
+@define(eq=False, slots=True)
 class AwsSagemakerDataProcessing:
     kind: ClassVar[str] = "aws_sagemaker_data_processing"
     kind_display: ClassVar[str] = "AWS SageMaker Data Processing"
@@ -5649,7 +5659,7 @@ class AwsSagemakerTransformJob(SagemakerTaggable, AwsSagemakerJob):
         "name": S("TransformJobName"),
         "ctime": S("CreationTime"),
         "arn": S("TransformJobArn"),
-        "transform_job_status": S("TransformJobStatus"),
+        "transform_job_status": S("TransformJobStatus") >> Intern(),
         "transform_job_failure_reason": S("FailureReason"),
         "transform_job_model_name": S("ModelName"),
         "transform_job_max_concurrent_transforms": S("MaxConcurrentTransforms"),
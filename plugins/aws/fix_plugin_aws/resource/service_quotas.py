@@ -126,8 +126,9 @@ class AwsServiceQuota(AwsResource, BaseQuota):
         for service, ms in quotas.items():
             AwsServiceQuota.collect_service(service, ms, builder)
 
-    def connect_in_graph(self, builder: GraphBuilder, source: Json) -> None:
-        super().connect_in_graph(builder, source)
+    def complete_graph(self, builder: GraphBuilder, source: Json) -> None:
+        # Instance types are added to the graph while other resources are connected.
+        # Match the quota targets only when the graph is complete.
         matcher: Optional[QuotaMatcher] = source.get("matcher", None)
 
         def prop_matches(attr: Any, expect: Any) -> bool:
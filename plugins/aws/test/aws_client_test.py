@@ -1,10 +1,12 @@
-from typing import Tuple
+from typing import Any, Tuple
 
+from boto3 import Session
 from botocore.exceptions import ClientError
 
 from fix_plugin_aws.aws_client import AwsClient, is_retryable_exception
 from fix_plugin_aws.configuration import AwsConfig
 from fixlib.core.actions import ErrorAccumulator
+from fixlib.types import Json
 from test.resources import BotoFileBasedSession, BotoErrorSession
 
 
@@ -86,6 +88,36 @@ def test_error_handling() -> None:
     assert len(queue_some_error.regional_errors) == 1
 
 
+class ScpDeniedClient:
+    @staticmethod
+    def can_paginate(_: str) -> bool:
+        return False
+
+    @staticmethod
+    def describe_model(**kwargs: Any) -> Json:
+        if kwargs["ModelName"] == "denied":
+            message = "User is not authorized with an explicit deny in a service control policy"
+            raise ClientError({"Error": {"Code": "AccessDeniedException", "Message": message}}, "DescribeModel")
+        return {"ModelName": kwargs["ModelName"]}
+
+
+class ScpDeniedSession(Session):  # type: ignore
+    def client(self, service_name: str, **kwargs: Any) -> Any:
+        return ScpDeniedClient()
+
+
+def test_access_denied_for_one_resource() -> None:
+    config = AwsConfig(access_key_id="foo", secret_access_key="bar")
+    config.sessions().session_class_factory = ScpDeniedSession
+    error_accumulator = ErrorAccumulator()
+    client = AwsClient(config, "test", error_accumulator=error_accumulator)
+    assert client.get("sagemaker", "describe-model", None, ModelName="denied") is None
+    assert len(error_accumulator.regional_errors) == 1
+    # a policy can deny single resources: the same action is still called for other resources
+    assert client.get("sagemaker", "describe-model", None, ModelName="allowed") == {"ModelName": "allowed"}
+    assert client.get("sagemaker", "describe-model", None, ModelName="denied") is None
+
+
 def test_is_retryable() -> None:
     def check_code(code: str, expected: bool) -> None:
         assert is_retryable_exception(ClientError({"Error": {"Code": code, "Message": "eff"}}, "foo")) is expected
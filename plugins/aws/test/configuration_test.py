@@ -1,3 +1,8 @@
+from typing import List
+
+from botocore.client import BaseClient
+from pytest import MonkeyPatch
+
 from fixlib.proc import num_default_threads
 from fixlib.config import Config
 from fix_plugin_aws import AWSCollectorPlugin
@@ -59,6 +64,15 @@ def test_session() -> None:
     # no test for sts session, since this requires sts setup
 
 
+def test_purge_account_sts_sessions() -> None:
+    holder = AwsConfig("test", "test", "test").sessions()
+    session = holder._session("1234", aws_role=None)
+    holder._sts_sessions[("1234", "role", None, "aws")] = (0, session)
+    holder._sts_sessions[("5678", "role", None, "aws")] = (0, session)
+    holder.purge_account("1234")
+    assert list(holder._sts_sessions) == [("5678", "role", None, "aws")]
+
+
 def test_shared_tasks_per_key() -> None:
     config = AwsConfig(
         "test", "test", "test", resource_pool_tasks_per_service_default=20, resource_pool_tasks_per_service={"test": 3}
@@ -68,3 +82,25 @@ def test_shared_tasks_per_key() -> None:
     assert tpk("eu-central-1:foo") == 20  # default
     assert tpk("eu-central-1:sagemaker") == 6  # predefined
     assert tpk("eu-central-1:test") == 3  # defined in config
+
+
+def test_shared_client(monkeypatch: MonkeyPatch) -> None:
+    holder = AwsConfig("test", "test", "test").sessions()
+    closed: List[str] = []
+
+    def shared(account: str) -> BaseClient:
+        client = holder.shared_client(account, None, None, "s3", "us-east-1")
+        monkeypatch.setattr(client, "close", lambda: closed.append(account))
+        return client
+
+    first = shared("1234")
+    other = shared("5678")
+    assert holder.shared_client("1234", None, None, "s3", "us-east-1") is first
+    # purging an account closes only the clients of this account
+    holder.purge_account("1234")
+    assert closed == ["1234"]
+    assert holder.shared_client("1234", None, None, "s3", "us-east-1") is not first
+    assert holder.shared_client("5678", None, None, "s3", "us-east-1") is other
+    # purging all caches closes all remaining clients
+    holder.purge_caches()
+    assert closed == ["1234", "5678"]
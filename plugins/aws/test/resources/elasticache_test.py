@@ -1,8 +1,13 @@
+import pytest
+from attrs.exceptions import FrozenInstanceError
+
 from fix_plugin_aws.resource.elasticache import (
     AwsElastiCacheReplicationGroup,
     AwsElastiCacheCacheCluster,
+    AwsElastiCacheEndpoint,
 )
 from fixlib.graph import Graph
+from fixlib.json import from_json
 from test.resources import round_trip_for
 from typing import Any, cast
 from types import SimpleNamespace
@@ -15,6 +20,15 @@ def test_elasticache_replication_group() -> None:
     assert len(res.tags) == 2
 
 
+def test_endpoints_are_shared() -> None:
+    endpoint = from_json({"address": "foo.cache.amazonaws.com", "port": 6379}, AwsElastiCacheEndpoint)
+    assert endpoint is from_json({"address": "foo.cache.amazonaws.com", "port": 6379}, AwsElastiCacheEndpoint)
+    assert endpoint is not from_json({"address": "foo.cache.amazonaws.com", "port": 6380}, AwsElastiCacheEndpoint)
+    # shared endpoints can not be changed
+    with pytest.raises(FrozenInstanceError):
+        setattr(endpoint, "port", 6380)
+
+
 def test_elasticache_cache_cluster() -> None:
     res, builder = round_trip_for(AwsElastiCacheCacheCluster)
     assert len(builder.resources_of(AwsElastiCacheCacheCluster)) == 1
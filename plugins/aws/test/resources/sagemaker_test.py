@@ -1,6 +1,11 @@
 from types import SimpleNamespace
 from typing import Any, cast
+
+import pytest
+from attrs.exceptions import FrozenInstanceError
+
 from fix_plugin_aws.aws_client import AwsClient
+from fixlib.json import from_json
 from test.resources import round_trip_for
 from fix_plugin_aws.resource.sagemaker import (
     AwsSagemakerNotebook,
@@ -26,6 +31,8 @@ from fix_plugin_aws.resource.sagemaker import (
     AwsSagemakerProcessingJob,
     AwsSagemakerTrainingJob,
     AwsSagemakerTransformJob,
+    AwsSagemakerMetricDefinition,
+    AwsSagemakerResourceSpec,
 )
 
 
@@ -49,6 +56,24 @@ def test_tagging() -> None:
     notebook.delete_resource_tag(client, "foo")
 
 
+def test_metric_definitions_are_shared() -> None:
+    definition = from_json({"name": "train:loss", "regex": "loss=(.*)"}, AwsSagemakerMetricDefinition)
+    assert definition is from_json({"name": "train:loss", "regex": "loss=(.*)"}, AwsSagemakerMetricDefinition)
+    assert definition is not from_json({"name": "validation:loss", "regex": "loss=(.*)"}, AwsSagemakerMetricDefinition)
+    # shared definitions can not be changed
+    with pytest.raises(FrozenInstanceError):
+        setattr(definition, "regex", "")
+
+
+def test_resource_specs_are_shared() -> None:
+    spec = from_json({"instance_type": "ml.t3.medium"}, AwsSagemakerResourceSpec)
+    assert spec is from_json({"instance_type": "ml.t3.medium"}, AwsSagemakerResourceSpec)
+    assert spec is not from_json({"instance_type": "ml.m5.large"}, AwsSagemakerResourceSpec)
+    # shared specs can not be changed
+    with pytest.raises(FrozenInstanceError):
+        setattr(spec, "instance_type", "ml.m5.large")
+
+
 def test_notebooks() -> None:
     first, builder = round_trip_for(AwsSagemakerNotebook)
     assert len(builder.resources_of(AwsSagemakerNotebook)) == 1
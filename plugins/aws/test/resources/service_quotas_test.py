@@ -69,9 +69,9 @@ def test_regional_matcher() -> None:
     sq1._region = region1
     sq2._region = region2
 
-    # connect both quotas in graph
-    sq1.connect_in_graph(builder, {"matcher": evolve(RegionalQuotas["ec2"][0], region=region1)})
-    sq2.connect_in_graph(builder, {"matcher": evolve(RegionalQuotas["ec2"][0], region=region2)})
+    # connect both quotas in the complete graph
+    sq1.complete_graph(builder, {"matcher": evolve(RegionalQuotas["ec2"][0], region=region1)})
+    sq2.complete_graph(builder, {"matcher": evolve(RegionalQuotas["ec2"][0], region=region2)})
 
     # sq1 is only connected to t1
     assert list(builder.graph.successors(sq1, EdgeType.default)) == [t1]
@@ -82,7 +82,7 @@ def test_regional_matcher() -> None:
 def expect_quotas(builder: GraphBuilder, quotas: int) -> None:
     for node, data in builder.graph.nodes(data=True):
         if isinstance(node, AwsServiceQuota):
-            node.connect_in_graph(builder, data.get("source", {}))
+            node.complete_graph(builder, data.get("source", {}))
     # make sure edges have been created
     assert builder.graph.number_of_edges() == quotas
 